@@ -7,98 +7,222 @@ Orders, order items, and pharmacy credit. Status badges and filters.
 """
 
 from django.contrib import admin
-from django.utils.html import format_html
+from django.core.paginator import Paginator
+from django.db import connections
+from django.db.models.lookups import Exact
+from django.utils.functional import cached_property
+from django.utils.html import format_html, format_html_join
 from django.utils.translation import gettext_lazy as _
 
-from .models import B2BOrder, B2BOrderItem, PharmacyCredit
-
-
-class B2BOrderItemInline(admin.TabularInline):
-    model = B2BOrderItem
-    extra = 0
-    readonly_fields = ('id', 'lot', 'quantity_ordered', 'quantity_delivered', 'unit_price', 'line_total_display', 'created_at')
-    fields = ('lot', 'quantity_ordered', 'quantity_delivered', 'unit_price', 'line_total_display', 'created_at')
-    show_change_link = True
-
-    def line_total_display(self, obj):
-        return obj.unit_price * obj.quantity_ordered if obj.pk else '—'
-    line_total_display.short_description = _('Line total')
+from core.admin import ColumnLimitedChangeList
+from core.badges import ChoiceBadge
+
+from .models import (
+    AVAILABLE_CREDIT_EXPRESSION,
+    LINE_TOTAL_EXPRESSION,
+    B2BOrder,
+    B2BOrderItem,
+    PharmacyCredit,
+    items_list_prefetch,
+)
+
+STATUS_BADGE = ChoiceBadge(
+    B2BOrder.StatusChoices.choices,
+    {
+        'DRAFT': '#6b7280', 'SUBMITTED': '#f59e0b', 'APPROVED': '#22c55e',
+        'IN_TRANSIT': '#3b82f6', 'DELIVERED': '#22c55e', 'CANCELLED': '#dc2626', 'REJECTED': '#dc2626',
+    },
+)
+
+
+class EstimatedPaginator(Paginator):
+    """
+    Changelist paginator that skips COUNT(*) on large, unfiltered tables.
+
+    When the only predicate is the default soft-delete filter, PostgreSQL's
+    planner estimate (pg_class.reltuples) is used instead of an exact count.
+    Small tables and filtered/searched changelists fall back to COUNT(*).
+    """
+
+    ESTIMATE_THRESHOLD = 10_000
+
+    @cached_property
+    def count(self):
+        query = getattr(self.object_list, 'query', None)
+        if query is not None and self._is_unfiltered(query):
+            connection = connections[self.object_list.db]
+            if connection.vendor == 'postgresql':
+                with connection.cursor() as cursor:
+                    cursor.execute(
+                        'SELECT reltuples::bigint FROM pg_class WHERE relname = %s',
+                        [self.object_list.model._meta.db_table],
+                    )
+                    row = cursor.fetchone()
+                if row and row[0] > self.ESTIMATE_THRESHOLD:
+                    return row[0]
+        return super().count
+
+    @staticmethod
+    def _is_unfiltered(query) -> bool:
+        if query.where.negated:
+            return False
+        for child in query.where.children:
+            target = getattr(getattr(child, 'lhs', None), 'target', None)
+            if not (
+                isinstance(child, Exact)
+                and getattr(target, 'name', None) == 'is_deleted'
+                and child.rhs is False
+            ):
+                return False
+        return True
+
+
+class IdOnChangeMixin:
+    """
+    Shows the read-only UUID `id` on change forms only; the add form has no
+    primary key to display yet. Prepended to the first fieldset when declared.
+    """
+
+    def get_readonly_fields(self, request, obj=None):
+        readonly = super().get_readonly_fields(request, obj)
+        return ('id', *readonly) if obj is not None else readonly
+
+    def get_fieldsets(self, request, obj=None):
+        fieldsets = super().get_fieldsets(request, obj)
+        if obj is None or not self.fieldsets:
+            return fieldsets
+        (name, options), *rest = fieldsets
+        return [(name, {**options, 'fields': ('id', *options['fields'])}), *rest]
 
 
 @admin.register(B2BOrder)
-class B2BOrderAdmin(admin.ModelAdmin):
+class B2BOrderAdmin(IdOnChangeMixin, admin.ModelAdmin):
     list_display = (
-        'id', 'seller', 'buyer', 'status_badge', 'total_amount',
+        'id', 'seller', 'buyer', 'status_badge', 'total_amount', 'items_count',
         'credit_used', 'payment_status', 'created_at',
     )
     list_filter = ('status', 'payment_status', 'is_deleted')
     search_fields = ('id', 'seller__name', 'buyer__name')
     readonly_fields = (
-        'id', 'total_amount', 'credit_used', 'created_at', 'updated_at',
+        'total_amount', 'items_count', 'credit_used', 'items_table', 'created_at', 'updated_at',
         'created_by', 'updated_by',
     )
     list_select_related = ('seller', 'buyer')
     show_full_result_count = False
+    paginator = EstimatedPaginator
     list_per_page = 30
     date_hierarchy = 'created_at'
     ordering = ('-created_at',)
-    inlines = [B2BOrderItemInline]
-    raw_id_fields = ('seller', 'buyer')
+    autocomplete_fields = ('seller', 'buyer')
+
+    changelist_only_fields = (
+        'id', 'seller', 'seller__name', 'seller__national_code',
+        'buyer', 'buyer__name', 'buyer__national_code',
+        'status', 'total_amount', 'items_count', 'credit_used', 'payment_status', 'created_at', 'is_deleted',
+    )
 
     fieldsets = (
-        (_('Parties'), {'fields': ('id', 'seller', 'buyer')}),
+        (_('Parties'), {'fields': ('seller', 'buyer')}),
         (_('Status'), {'fields': ('status', 'payment_status', 'price_override_approved')}),
-        (_('Amounts'), {'fields': ('total_amount', 'credit_used')}),
+        (_('Amounts'), {'fields': ('total_amount', 'items_count', 'credit_used')}),
+        (_('Items'), {'fields': ('items_table',)}),
         (_('Audit'), {'fields': ('created_at', 'updated_at', 'created_by', 'updated_by'), 'classes': ('collapse',)}),
         (_('Soft Delete'), {'fields': ('is_deleted', 'deleted_at', 'deleted_by'), 'classes': ('collapse',)}),
     )
 
+    def get_changelist(self, request, **kwargs):
+        return ColumnLimitedChangeList
+
     def get_queryset(self, request):
         qs = super().get_queryset(request)
         if not request.GET.get('is_deleted__exact'):
             qs = qs.filter(is_deleted=False)
-        return qs.prefetch_related('items')
+        return qs.prefetch_related(items_list_prefetch())
 
     @admin.display(description=_('Status'))
     def status_badge(self, obj):
-        colors = {
-            'DRAFT': '#6b7280', 'SUBMITTED': '#f59e0b', 'APPROVED': '#22c55e',
-            'IN_TRANSIT': '#3b82f6', 'DELIVERED': '#22c55e', 'CANCELLED': '#dc2626', 'REJECTED': '#dc2626',
-        }
-        color = colors.get(obj.status, '#6b7280')
+        return STATUS_BADGE(obj.status)
+
+    @admin.display(description=_('Order items'))
+    def items_table(self, obj):
+        """Read-only item table rendered from the prefetched items (no inline formset)."""
+        if not obj or not obj.pk:
+            return '—'
+        rows = format_html_join(
+            '',
+            '<tr><td>{}</td><td>{}</td><td>{}</td><td>{}</td><td>{}</td></tr>',
+            (
+                (item.lot_display, item.quantity_ordered, item.quantity_delivered, item.unit_price, item.line_total)
+                for item in obj.items_list
+            ),
+        )
         return format_html(
-            '<span style="background:{};color:#fff;padding:2px 8px;'
-            'border-radius:4px;font-size:11px;font-weight:600;">{}</span>',
-            color, obj.get_status_display(),
+            '<table><thead><tr><th>{}</th><th>{}</th><th>{}</th><th>{}</th><th>{}</th></tr></thead>'
+            '<tbody>{}</tbody></table>',
+            _('Lot'), _('Quantity ordered'), _('Quantity delivered'), _('Unit price'), _('Line total'),
+            rows,
         )
 
 
 @admin.register(B2BOrderItem)
-class B2BOrderItemAdmin(admin.ModelAdmin):
+class B2BOrderItemAdmin(IdOnChangeMixin, admin.ModelAdmin):
     list_display = ('id', 'order', 'lot', 'quantity_ordered', 'quantity_delivered', 'unit_price', 'created_at')
     list_filter = ('order__status',)
     search_fields = ('order__id', 'lot__batch_number')
-    readonly_fields = ('id', 'created_at', 'updated_at', 'created_by', 'updated_by')
-    list_select_related = ('order', 'lot', 'lot__medicine')
+    readonly_fields = ('created_at', 'updated_at', 'created_by', 'updated_by')
+    list_select_related = ('order__seller', 'order__buyer', 'lot__medicine')
     show_full_result_count = False
-    raw_id_fields = ('order', 'lot')
+    paginator = EstimatedPaginator
+    autocomplete_fields = ('order', 'lot')
+
+    # B2BOrder.__str__ reads seller/buyer names; NationalLot.__str__ reads the medicine label.
+    changelist_only_fields = (
+        'id', 'quantity_ordered', 'quantity_delivered', 'unit_price', 'created_at', 'is_deleted',
+        'order', 'order__status', 'order__seller', 'order__seller__name', 'order__buyer', 'order__buyer__name',
+        'lot', 'lot__batch_number', 'lot__medicine',
+        'lot__medicine__inn', 'lot__medicine__brand_name', 'lot__medicine__strength', 'lot__medicine__dosage_form',
+    )
+
+    def get_changelist(self, request, **kwargs):
+        return ColumnLimitedChangeList
+
+    def formfield_for_foreignkey(self, db_field, request, **kwargs):
+        # Selected-option labels: NationalLot.__str__ reads the medicine, B2BOrder.__str__ the parties.
+        if db_field.name == 'lot':
+            kwargs['queryset'] = db_field.remote_field.model.objects.select_related('medicine')
+        elif db_field.name == 'order':
+            kwargs['queryset'] = db_field.remote_field.model.objects.select_related('seller', 'buyer')
+        return super().formfield_for_foreignkey(db_field, request, **kwargs)
 
     def get_queryset(self, request):
         qs = super().get_queryset(request)
         if not request.GET.get('is_deleted__exact'):
             qs = qs.filter(is_deleted=False)
-        return qs
+        return qs.annotate(line_total=LINE_TOTAL_EXPRESSION)
 
 
 @admin.register(PharmacyCredit)
-class PharmacyCreditAdmin(admin.ModelAdmin):
+class PharmacyCreditAdmin(IdOnChangeMixin, admin.ModelAdmin):
     list_display = ('pharmacy', 'credit_limit', 'current_balance', 'reserved_balance', 'available_display', 'created_at')
     list_filter = ()
     search_fields = ('pharmacy__name', 'pharmacy__national_code')
-    readonly_fields = ('id', 'created_at', 'updated_at', 'created_by', 'updated_by')
+    readonly_fields = ('created_at', 'updated_at', 'created_by', 'updated_by')
     list_select_related = ('pharmacy',)
     raw_id_fields = ('pharmacy',)
 
+    # Pharmacy.__str__ reads name and national_code only.
+    changelist_only_fields = (
+        'id', 'credit_limit', 'current_balance', 'reserved_balance', 'created_at',
+        'pharmacy', 'pharmacy__name', 'pharmacy__national_code',
+    )
+
+    def get_changelist(self, request, **kwargs):
+        return ColumnLimitedChangeList
+
+    def get_queryset(self, request):
+        return super().get_queryset(request).annotate(available_credit=AVAILABLE_CREDIT_EXPRESSION)
+
     def available_display(self, obj):
         return obj.available_credit
     available_display.short_description = _('Available credit')
+    available_display.admin_order_field = 'available_credit'
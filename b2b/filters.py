@@ -0,0 +1,44 @@
+"""
+B2B — Filters
+
+FilterSet for the order list. Declared once at import instead of letting
+DjangoFilterBackend build one from filterset_fields on every request.
+Search filter that turns full order ids into primary-key lookups.
+
+@file b2b/filters.py
+"""
+
+import uuid
+
+import django_filters
+from rest_framework.filters import SearchFilter
+
+from .models import B2BOrder
+
+
+class B2BOrderFilter(django_filters.FilterSet):
+    class Meta:
+        model = B2BOrder
+        fields = {
+            'status': ['exact', 'in'],
+            'seller': ['exact'],
+            'buyer': ['exact'],
+            'payment_status': ['exact', 'in'],
+        }
+
+
+class B2BOrderSearchFilter(SearchFilter):
+    """
+    ?search= on order ids. Full UUIDs are matched with a primary-key lookup;
+    partial ids keep the default text search (a cast + LIKE, no index).
+    """
+
+    def filter_queryset(self, request, queryset, view):
+        terms = self.get_search_terms(request)
+        try:
+            ids = {uuid.UUID(term) for term in terms}
+        except ValueError:
+            return super().filter_queryset(request, queryset, view)
+        if len(ids) > 1:
+            return queryset.none()
+        return queryset.filter(pk__in=ids) if ids else queryset
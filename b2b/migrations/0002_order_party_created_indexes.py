@@ -0,0 +1,24 @@
+# Generated by Django 5.2.10 on 2026-10-15 22:41
+
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('b2b', '0001_phase5_b2b_order_credit'),
+        ('pharmacies', '0001_phase3_pharmacy_pharmacydocument'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='b2border',
+            index=models.Index(fields=['seller', '-created_at'], name='b2b_ord_seller_created_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='b2border',
+            index=models.Index(fields=['buyer', '-created_at'], name='b2b_ord_buyer_created_idx'),
+        ),
+    ]
@@ -0,0 +1,25 @@
+# Generated by Django 5.2.10 on 2026-10-15 22:42
+
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('b2b', '0002_order_party_created_indexes'),
+        ('medicines', '0001_initial'),
+        ('pharmacies', '0001_phase3_pharmacy_pharmacydocument'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='b2border',
+            index=models.Index(condition=models.Q(('is_deleted', False)), fields=['-created_at'], name='b2b_ord_live_created_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='b2borderitem',
+            index=models.Index(condition=models.Q(('is_deleted', False)), fields=['order', 'id'], name='b2b_item_live_order_idx'),
+        ),
+    ]
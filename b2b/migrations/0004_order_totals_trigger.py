@@ -0,0 +1,76 @@
+# Generated by Django 5.2.10 on 2026-10-15 22:48
+
+from django.db import migrations, models
+
+# Recompute the order's total_amount/items_count from its live items whenever
+# an item row is inserted, updated (incl. soft delete) or deleted.
+CREATE_TRIGGER_SQL = """
+CREATE OR REPLACE FUNCTION b2b_refresh_order_totals() RETURNS trigger AS $$
+DECLARE
+    affected uuid;
+BEGIN
+    FOREACH affected IN ARRAY CASE
+        WHEN TG_OP = 'INSERT' THEN ARRAY[NEW.order_id]
+        WHEN TG_OP = 'DELETE' THEN ARRAY[OLD.order_id]
+        WHEN NEW.order_id = OLD.order_id THEN ARRAY[NEW.order_id]
+        ELSE ARRAY[OLD.order_id, NEW.order_id]
+    END LOOP
+        UPDATE b2b_b2border o
+        SET total_amount = t.total_amount, items_count = t.items_count
+        FROM (
+            SELECT COALESCE(SUM(unit_price * quantity_ordered), 0) AS total_amount,
+                   COUNT(*) AS items_count
+            FROM b2b_b2borderitem
+            WHERE order_id = affected AND is_deleted = false
+        ) t
+        WHERE o.id = affected;
+    END LOOP;
+    RETURN NULL;
+END;
+$$ LANGUAGE plpgsql;
+
+DROP TRIGGER IF EXISTS b2b_order_item_totals ON b2b_b2borderitem;
+CREATE TRIGGER b2b_order_item_totals
+AFTER INSERT OR DELETE OR UPDATE OF order_id, unit_price, quantity_ordered, is_deleted
+ON b2b_b2borderitem
+FOR EACH ROW EXECUTE FUNCTION b2b_refresh_order_totals();
+"""
+
+DROP_TRIGGER_SQL = """
+DROP TRIGGER IF EXISTS b2b_order_item_totals ON b2b_b2borderitem;
+DROP FUNCTION IF EXISTS b2b_refresh_order_totals();
+"""
+
+BACKFILL_ITEMS_COUNT_SQL = """
+UPDATE b2b_b2border SET items_count = (
+    SELECT COUNT(*) FROM b2b_b2borderitem
+    WHERE b2b_b2borderitem.order_id = b2b_b2border.id AND b2b_b2borderitem.is_deleted = false
+)
+"""
+
+
+def create_trigger(apps, schema_editor):
+    schema_editor.execute(BACKFILL_ITEMS_COUNT_SQL)
+    if schema_editor.connection.vendor == 'postgresql':
+        schema_editor.execute(CREATE_TRIGGER_SQL)
+
+
+def drop_trigger(apps, schema_editor):
+    if schema_editor.connection.vendor == 'postgresql':
+        schema_editor.execute(DROP_TRIGGER_SQL)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('b2b', '0003_live_row_partial_indexes'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='b2border',
+            name='items_count',
+            field=models.PositiveIntegerField(default=0, help_text='Live order lines; kept in sync with total_amount by a trigger on PostgreSQL', verbose_name='items count'),
+        ),
+        migrations.RunPython(create_trigger, drop_trigger),
+    ]
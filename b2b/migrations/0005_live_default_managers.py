@@ -0,0 +1,34 @@
+# Generated by Django 5.2.10 on 2026-10-15 23:05
+
+import django.db.models.manager
+from django.db import migrations
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('b2b', '0004_order_totals_trigger'),
+    ]
+
+    operations = [
+        migrations.AlterModelOptions(
+            name='b2border',
+            options={'default_manager_name': 'all_objects', 'ordering': ['-created_at'], 'verbose_name': 'B2B order', 'verbose_name_plural': 'B2B orders'},
+        ),
+        migrations.AlterModelOptions(
+            name='b2borderitem',
+            options={'default_manager_name': 'all_objects', 'ordering': ['order', 'id'], 'verbose_name': 'B2B order item', 'verbose_name_plural': 'B2B order items'},
+        ),
+        migrations.AlterModelManagers(
+            name='b2border',
+            managers=[
+                ('all_objects', django.db.models.manager.Manager()),
+            ],
+        ),
+        migrations.AlterModelManagers(
+            name='b2borderitem',
+            managers=[
+                ('all_objects', django.db.models.manager.Manager()),
+            ],
+        ),
+    ]
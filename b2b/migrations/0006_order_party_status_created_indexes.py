@@ -0,0 +1,32 @@
+# Generated by Django 5.2.10 on 2026-10-15 23:22
+
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('b2b', '0005_live_default_managers'),
+        ('pharmacies', '0001_phase3_pharmacy_pharmacydocument'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.RemoveIndex(
+            model_name='b2border',
+            name='b2b_b2borde_seller__87508a_idx',
+        ),
+        migrations.RemoveIndex(
+            model_name='b2border',
+            name='b2b_b2borde_buyer_i_c6607c_idx',
+        ),
+        migrations.AddIndex(
+            model_name='b2border',
+            index=models.Index(fields=['seller', 'status', '-created_at'], name='b2b_ord_seller_status_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='b2border',
+            index=models.Index(fields=['buyer', 'status', '-created_at'], name='b2b_ord_buyer_status_idx'),
+        ),
+    ]
@@ -0,0 +1,23 @@
+# Generated by Django 5.2.10 on 2026-10-15 23:42
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('b2b', '0006_order_party_status_created_indexes'),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name='b2border',
+            name='is_deleted',
+            field=models.BooleanField(default=False, verbose_name='deleted'),
+        ),
+        migrations.AlterField(
+            model_name='b2borderitem',
+            name='is_deleted',
+            field=models.BooleanField(default=False, verbose_name='deleted'),
+        ),
+    ]
@@ -0,0 +1,95 @@
+# Generated by Django 5.2.10 on 2026-10-16 09:10
+
+import importlib
+
+from django.db import migrations
+
+# One trigger run per statement instead of per item row: the affected orders
+# are collected from the transition tables and each is re-aggregated and
+# updated once, so a bulk insert of n items costs one pass and one UPDATE per
+# order rather than n re-aggregations and n UPDATEs of the same order row.
+# PostgreSQL does not allow transition tables on multi-event triggers or on
+# UPDATE OF <columns>, hence three triggers sharing one function; updates that
+# leave order_id, price, quantity and is_deleted unchanged are filtered out.
+CREATE_TRIGGER_SQL = """
+CREATE OR REPLACE FUNCTION b2b_refresh_order_totals() RETURNS trigger AS $$
+DECLARE
+    affected uuid[];
+BEGIN
+    IF TG_OP = 'INSERT' THEN
+        SELECT array_agg(DISTINCT order_id) INTO affected FROM new_items;
+    ELSIF TG_OP = 'DELETE' THEN
+        SELECT array_agg(DISTINCT order_id) INTO affected FROM old_items;
+    ELSE
+        SELECT array_agg(DISTINCT ids.order_id) INTO affected
+        FROM (
+            SELECT n.order_id AS new_order_id, o.order_id AS old_order_id
+            FROM new_items n JOIN old_items o ON o.id = n.id
+            WHERE (n.order_id, n.unit_price, n.quantity_ordered, n.is_deleted)
+                IS DISTINCT FROM (o.order_id, o.unit_price, o.quantity_ordered, o.is_deleted)
+        ) changed
+        CROSS JOIN LATERAL (VALUES (changed.new_order_id), (changed.old_order_id)) AS ids(order_id);
+    END IF;
+
+    IF affected IS NULL THEN
+        RETURN NULL;
+    END IF;
+
+    UPDATE b2b_b2border o
+    SET total_amount = t.total_amount, items_count = t.items_count
+    FROM (
+        SELECT a.id,
+               COALESCE(SUM(i.unit_price * i.quantity_ordered), 0) AS total_amount,
+               COUNT(i.id) AS items_count
+        FROM unnest(affected) AS a(id)
+        LEFT JOIN b2b_b2borderitem i ON i.order_id = a.id AND i.is_deleted = false
+        GROUP BY a.id
+    ) t
+    WHERE o.id = t.id;
+    RETURN NULL;
+END;
+$$ LANGUAGE plpgsql;
+
+DROP TRIGGER IF EXISTS b2b_order_item_totals ON b2b_b2borderitem;
+CREATE TRIGGER b2b_order_item_totals_insert
+AFTER INSERT ON b2b_b2borderitem
+REFERENCING NEW TABLE AS new_items
+FOR EACH STATEMENT EXECUTE FUNCTION b2b_refresh_order_totals();
+CREATE TRIGGER b2b_order_item_totals_update
+AFTER UPDATE ON b2b_b2borderitem
+REFERENCING OLD TABLE AS old_items NEW TABLE AS new_items
+FOR EACH STATEMENT EXECUTE FUNCTION b2b_refresh_order_totals();
+CREATE TRIGGER b2b_order_item_totals_delete
+AFTER DELETE ON b2b_b2borderitem
+REFERENCING OLD TABLE AS old_items
+FOR EACH STATEMENT EXECUTE FUNCTION b2b_refresh_order_totals();
+"""
+
+DROP_TRIGGER_SQL = """
+DROP TRIGGER IF EXISTS b2b_order_item_totals_insert ON b2b_b2borderitem;
+DROP TRIGGER IF EXISTS b2b_order_item_totals_update ON b2b_b2borderitem;
+DROP TRIGGER IF EXISTS b2b_order_item_totals_delete ON b2b_b2borderitem;
+"""
+
+
+def create_statement_trigger(apps, schema_editor):
+    if schema_editor.connection.vendor == 'postgresql':
+        schema_editor.execute(CREATE_TRIGGER_SQL)
+
+
+def restore_row_trigger(apps, schema_editor):
+    if schema_editor.connection.vendor == 'postgresql':
+        schema_editor.execute(DROP_TRIGGER_SQL)
+        row_trigger = importlib.import_module('b2b.migrations.0004_order_totals_trigger')
+        schema_editor.execute(row_trigger.CREATE_TRIGGER_SQL)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('b2b', '0007_live_row_partial_indexes'),
+    ]
+
+    operations = [
+        migrations.RunPython(create_statement_trigger, restore_row_trigger),
+    ]
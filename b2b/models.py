@@ -11,9 +11,30 @@ import uuid
 
 from django.conf import settings
 from django.db import models
+from django.db.models.functions import Concat
+from django.utils.functional import cached_property
 from django.utils.translation import gettext_lazy as _
 
-from core.models import BaseModel, RegulatedModel
+from core.models import BaseModel, LiveManager, RegulatedModel
+
+# unit_price × quantity_ordered computed in SQL; annotate item querysets as
+# `line_total` so B2BOrderItem.line_total is read from the row, not recomputed.
+LINE_TOTAL_EXPRESSION = models.ExpressionWrapper(
+    models.F('unit_price') * models.F('quantity_ordered'),
+    output_field=models.DecimalField(max_digits=18, decimal_places=2),
+)
+
+# credit_limit - current_balance - reserved_balance; annotate as `available_credit`.
+AVAILABLE_CREDIT_EXPRESSION = models.ExpressionWrapper(
+    models.F('credit_limit') - models.F('current_balance') - models.F('reserved_balance'),
+    output_field=models.DecimalField(max_digits=15, decimal_places=2),
+)
+
+# '<batch_number> — <medicine INN>' built in SQL; annotate as `lot_display`.
+LOT_DISPLAY_EXPRESSION = Concat(
+    'lot__batch_number', models.Value(' — '), 'lot__medicine__inn',
+    output_field=models.CharField(),
+)
 
 
 class PharmacyCredit(BaseModel):
@@ -53,8 +74,12 @@ class PharmacyCredit(BaseModel):
     def __str__(self):
         return f'{self.pharmacy.name} — limit {self.credit_limit}'
 
-    @property
+    @cached_property
     def available_credit(self):
+        """
+        Computed once per instance (or read from an AVAILABLE_CREDIT_EXPRESSION
+        annotation); use a fresh instance after balances change.
+        """
         return self.credit_limit - self.current_balance - self.reserved_balance
 
 
@@ -106,6 +131,10 @@ class B2BOrder(RegulatedModel):
     credit_used = models.DecimalField(
         _('credit used (BIF)'), max_digits=15, decimal_places=2, default=0,
     )
+    items_count = models.PositiveIntegerField(
+        _('items count'), default=0,
+        help_text=_('Live order lines; kept in sync with total_amount by a trigger on PostgreSQL'),
+    )
     payment_status = models.CharField(
         _('payment status'), max_length=10,
         choices=PaymentStatusChoices.choices,
@@ -117,19 +146,35 @@ class B2BOrder(RegulatedModel):
         help_text=_('When True, unit prices may exceed medicine authorized price'),
     )
 
+    objects = LiveManager()
+    all_objects = models.Manager()
+
     class Meta:
         verbose_name = _('B2B order')
         verbose_name_plural = _('B2B orders')
+        default_manager_name = 'all_objects'
         ordering = ['-created_at']
         indexes = [
-            models.Index(fields=['seller', 'status']),
-            models.Index(fields=['buyer', 'status']),
+            # Also serve plain (party, status) lookups through their prefix.
+            models.Index(fields=['seller', 'status', '-created_at'], name='b2b_ord_seller_status_idx'),
+            models.Index(fields=['buyer', 'status', '-created_at'], name='b2b_ord_buyer_status_idx'),
             models.Index(fields=['status', 'is_deleted']),
+            models.Index(fields=['seller', '-created_at'], name='b2b_ord_seller_created_idx'),
+            models.Index(fields=['buyer', '-created_at'], name='b2b_ord_buyer_created_idx'),
+            models.Index(
+                fields=['-created_at'], name='b2b_ord_live_created_idx',
+                condition=models.Q(is_deleted=False),
+            ),
         ]
 
     def __str__(self):
         return f'Order {self.pk} — {self.seller.name} → {self.buyer.name} ({self.status})'
 
+    @cached_property
+    def items_list(self) -> list['B2BOrderItem']:
+        """Live items; filled by items_list_prefetch() when the order came from a prefetching queryset."""
+        return list(live_items_queryset().filter(order=self))
+
 
 class B2BOrderItem(RegulatedModel):
     """
@@ -156,13 +201,21 @@ class B2BOrderItem(RegulatedModel):
         _('unit price (BIF)'), max_digits=15, decimal_places=2,
     )
 
+    objects = LiveManager()
+    all_objects = models.Manager()
+
     class Meta:
         verbose_name = _('B2B order item')
         verbose_name_plural = _('B2B order items')
+        default_manager_name = 'all_objects'
         ordering = ['order', 'id']
         indexes = [
             models.Index(fields=['order']),
             models.Index(fields=['lot']),
+            models.Index(
+                fields=['order', 'id'], name='b2b_item_live_order_idx',
+                condition=models.Q(is_deleted=False),
+            ),
         ]
         constraints = [
             models.CheckConstraint(
@@ -174,6 +227,24 @@ class B2BOrderItem(RegulatedModel):
     def __str__(self):
         return f'{self.order_id} — {self.lot} × {self.quantity_ordered}'
 
-    @property
+    @cached_property
     def line_total(self):
+        """Overridden by a `line_total` annotation (LINE_TOTAL_EXPRESSION) when present."""
         return self.unit_price * self.quantity_ordered
+
+    @cached_property
+    def lot_display(self):
+        """Overridden by a `lot_display` annotation (LOT_DISPLAY_EXPRESSION) when present."""
+        return f'{self.lot.batch_number} — {self.lot.medicine.inn}'
+
+
+def live_items_queryset():
+    """Non-deleted order items with lot/medicine joined and display columns annotated."""
+    return B2BOrderItem.objects.select_related('lot', 'lot__medicine').annotate(
+        line_total=LINE_TOTAL_EXPRESSION, lot_display=LOT_DISPLAY_EXPRESSION,
+    )
+
+
+def items_list_prefetch() -> models.Prefetch:
+    """Prefetch live items into the plain list `B2BOrder.items_list`."""
+    return models.Prefetch('items', queryset=live_items_queryset(), to_attr='items_list')
@@ -9,6 +9,8 @@ or pharmacy-scoped roles (seller/buyer).
 
 from rest_framework.permissions import BasePermission
 
+ORDER_WORKFLOW_ROLES = frozenset({'NATIONAL_ADMIN', 'INSPECTOR'})
+
 
 class CanManageB2BOrder(BasePermission):
     """List/retrieve: authenticated. Create/update: authenticated (buyer/seller or national)."""
@@ -27,4 +29,4 @@ class CanApproveOrRejectOrder(BasePermission):
             return False
         if request.user.is_superuser:
             return True
-        return request.user.has_role('NATIONAL_ADMIN') or request.user.has_role('INSPECTOR')
+        return not request.user.active_role_names.isdisjoint(ORDER_WORKFLOW_ROLES)
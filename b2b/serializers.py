@@ -7,19 +7,64 @@ Explicit field lists; no __all__.
 @file b2b/serializers.py
 """
 
+import re
+from collections.abc import Mapping
 from decimal import Decimal
+from functools import cached_property
+from operator import attrgetter
 
 from rest_framework import serializers
+from rest_framework.fields import SkipField, empty
+from rest_framework.settings import api_settings
 
 from medicines.models import NationalLot
 
 from .models import B2BOrder, B2BOrderItem, PharmacyCredit
 
-
-class B2BOrderItemReadSerializer(serializers.ModelSerializer):
-    lot_display = serializers.CharField(source='lot.__str__', read_only=True)
-    medicine_inn = serializers.CharField(source='lot.medicine.inn', read_only=True)
-    line_total = serializers.SerializerMethodField()
+# What clients normally send; anything else goes through the UUIDField to be normalised.
+_CANONICAL_UUID_RE = re.compile(r'[0-9a-f]{8}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{12}')
+
+_MOVEMENT_KEYS = ('id', 'movement_type', 'quantity', 'lot_id', 'entity_type', 'entity_id', 'created_at')
+_MOVEMENT_VALUES = attrgetter('pk', 'movement_type', 'quantity', 'lot_id', 'entity_type', 'entity_id', 'created_at')
+
+
+def _validate_item_lots(items: list[dict]) -> None:
+    """Resolve every item lot in one query; per-item errors mirror nested field errors."""
+    lots = {
+        str(lot.pk): lot
+        for lot in NationalLot.objects.filter(
+            pk__in={item['lot_id'] for item in items},
+        ).only('id', 'status', 'expiry_date')
+    }
+    errors = []
+    for item in items:
+        lot = lots.get(item['lot_id'])
+        if lot is None:
+            errors.append({'lot_id': ['Lot not found.']})
+        elif not lot.is_usable:
+            errors.append({'lot_id': ['Lot is not usable for stock.']})
+        else:
+            errors.append({})
+    if any(errors):
+        raise serializers.ValidationError(errors)
+
+
+class _CachedReadableFieldsMixin:
+    """
+    Read-only serializers: resolve the readable fields once per serializer
+    instance. DRF re-walks self.fields for every object, which adds up when one
+    child serializer renders every line of a list page.
+    """
+
+    @cached_property
+    def _readable_fields(self):
+        return tuple(field for field in self.fields.values() if not field.write_only)
+
+
+class B2BOrderItemReadSerializer(_CachedReadableFieldsMixin, serializers.ModelSerializer):
+    lot_display = serializers.ReadOnlyField()
+    medicine_inn = serializers.ReadOnlyField(source='lot.medicine.inn')
+    line_total = serializers.DecimalField(max_digits=18, decimal_places=2, read_only=True)
 
     class Meta:
         model = B2BOrderItem
@@ -30,8 +75,69 @@ class B2BOrderItemReadSerializer(serializers.ModelSerializer):
         ]
         read_only_fields = fields
 
-    def get_line_total(self, obj):
-        return obj.unit_price * obj.quantity_ordered
+
+class _ItemListSerializer(serializers.ListSerializer):
+    """
+    Parses order lines in one loop instead of running the child serializer's
+    full validation per item. Each value still goes through its declared
+    field's run_validation, so accepted input and (translated) error
+    messages are the same; only the common shapes, a canonical UUID string
+    and a positive int, skip the field call. Error shape matches nested
+    validation: one dict of field errors per item.
+
+    lot_id is returned as a canonical lowercase UUID string.
+    """
+
+    def to_internal_value(self, data):
+        if not isinstance(data, list):
+            raise serializers.ValidationError({
+                api_settings.NON_FIELD_ERRORS_KEY: [
+                    self.error_messages['not_a_list'].format(input_type=type(data).__name__),
+                ],
+            }, code='not_a_list')
+
+        fields = self.child.fields
+        lot_field, qty_field, price_field = fields['lot_id'], fields['quantity_ordered'], fields['unit_price']
+        validated, errors = [], []
+        for item in data:
+            if not isinstance(item, Mapping):
+                errors.append({api_settings.NON_FIELD_ERRORS_KEY: [
+                    self.child.error_messages['invalid'].format(datatype=type(item).__name__),
+                ]})
+                continue
+            row, item_errors = {}, {}
+
+            lot_id = item.get('lot_id', empty)
+            if isinstance(lot_id, str) and _CANONICAL_UUID_RE.fullmatch(lot_id):
+                row['lot_id'] = lot_id
+            else:
+                try:
+                    row['lot_id'] = str(lot_field.run_validation(lot_id))
+                except serializers.ValidationError as exc:
+                    item_errors['lot_id'] = exc.detail
+
+            qty = item.get('quantity_ordered', empty)
+            if type(qty) is int and qty >= 1:
+                row['quantity_ordered'] = qty
+            else:
+                try:
+                    row['quantity_ordered'] = qty_field.run_validation(qty)
+                except serializers.ValidationError as exc:
+                    item_errors['quantity_ordered'] = exc.detail
+
+            try:
+                row['unit_price'] = price_field.run_validation(item.get('unit_price', empty))
+            except SkipField:
+                pass
+            except serializers.ValidationError as exc:
+                item_errors['unit_price'] = exc.detail
+
+            validated.append(row)
+            errors.append(item_errors)
+
+        if any(errors):
+            raise serializers.ValidationError(errors)
+        return validated
 
 
 class B2BOrderItemWriteSerializer(serializers.Serializer):
@@ -39,28 +145,22 @@ class B2BOrderItemWriteSerializer(serializers.Serializer):
     quantity_ordered = serializers.IntegerField(min_value=1)
     unit_price = serializers.DecimalField(max_digits=15, decimal_places=2, required=False)
 
-    def validate_lot_id(self, value):
-        try:
-            lot = NationalLot.objects.get(pk=value, is_deleted=False)
-        except NationalLot.DoesNotExist:
-            raise serializers.ValidationError('Lot not found.')
-        if not lot.is_usable:
-            raise serializers.ValidationError('Lot is not usable for stock.')
-        return value
+    class Meta:
+        list_serializer_class = _ItemListSerializer
 
 
-class B2BOrderReadSerializer(serializers.ModelSerializer):
-    seller_name = serializers.CharField(source='seller.name', read_only=True)
-    buyer_name = serializers.CharField(source='buyer.name', read_only=True)
-    status_display = serializers.CharField(source='get_status_display', read_only=True)
-    payment_status_display = serializers.CharField(source='get_payment_status_display', read_only=True)
-    items = B2BOrderItemReadSerializer(many=True, read_only=True)
+class B2BOrderReadSerializer(_CachedReadableFieldsMixin, serializers.ModelSerializer):
+    seller_name = serializers.ReadOnlyField(source='seller.name')
+    buyer_name = serializers.ReadOnlyField(source='buyer.name')
+    status_display = serializers.ReadOnlyField(source='get_status_display')
+    payment_status_display = serializers.ReadOnlyField(source='get_payment_status_display')
+    items = B2BOrderItemReadSerializer(source='items_list', many=True, read_only=True)
 
     class Meta:
         model = B2BOrder
         fields = [
             'id', 'seller', 'seller_name', 'buyer', 'buyer_name',
-            'status', 'status_display', 'total_amount', 'credit_used',
+            'status', 'status_display', 'total_amount', 'items_count', 'credit_used',
             'payment_status', 'payment_status_display', 'price_override_approved',
             'items', 'created_at', 'updated_at',
         ]
@@ -76,6 +176,7 @@ class B2BOrderWriteSerializer(serializers.Serializer):
     def validate_items(self, value):
         if not value:
             raise serializers.ValidationError('At least one item is required.')
+        _validate_item_lots(value)
         return value
 
 
@@ -84,6 +185,10 @@ class B2BOrderUpdateSerializer(serializers.Serializer):
     items = B2BOrderItemWriteSerializer(many=True)
     price_override_approved = serializers.BooleanField(required=False)
 
+    def validate_items(self, value):
+        _validate_item_lots(value)
+        return value
+
 
 class B2BOrderApproveSerializer(serializers.Serializer):
     credit_used = serializers.DecimalField(
@@ -103,12 +208,4 @@ class StockMovementMinimalSerializer(serializers.Serializer):
     created_at = serializers.DateTimeField(read_only=True)
 
     def to_representation(self, instance):
-        return {
-            'id': instance.pk,
-            'movement_type': instance.movement_type,
-            'quantity': instance.quantity,
-            'lot_id': instance.lot_id,
-            'entity_type': instance.entity_type,
-            'entity_id': instance.entity_id,
-            'created_at': instance.created_at,
-        }
+        return dict(zip(_MOVEMENT_KEYS, _MOVEMENT_VALUES(instance)))
@@ -5,13 +5,22 @@ Order lifecycle: create (DRAFT), submit, approve (reserve credit), ship,
 deliver (dual stock + finalize credit), cancel (release/reserve reversal), reject.
 State machine and price validation enforced here.
 
+Lock order (keep it when adding writes, so concurrent transitions cannot
+deadlock): the B2BOrder row (select_for_update; of=('self',) when parties are
+joined, so pharmacy rows are never locked), then stock advisory locks
+(sorted keys, see StockService.process_b2b_transactions_bulk), then the
+buyer's PharmacyCredit row (single conditional/F() UPDATE, last write).
+
 @file b2b/services.py
 """
 
 import logging
-from decimal import Decimal
+from decimal import ROUND_HALF_UP, Decimal
+from functools import partial
 
-from django.db import transaction
+from django.db import connection, transaction
+from django.db.models import Count, Exists, F, OuterRef, Sum
+from django.utils import timezone
 
 from core.constants import AUDIT_ACTION_STATUS_CHANGE
 from core.exceptions import (
@@ -22,64 +31,181 @@ from core.exceptions import (
 )
 from core.services import AuditService
 from medicines.models import NationalLot
+from pharmacies.models import Pharmacy
 from stock.models import StockMovement
 from stock.services import StockService
 
-from .models import B2BOrder, B2BOrderItem, PharmacyCredit
+from .models import AVAILABLE_CREDIT_EXPRESSION, LINE_TOTAL_EXPRESSION, B2BOrder, B2BOrderItem, PharmacyCredit
 
 logger = logging.getLogger('pharmatrack')
 
-# Valid status transitions: from_status -> set of allowed to_status
+# Choice values bound once; service paths compare against these on every call.
+_DRAFT = B2BOrder.StatusChoices.DRAFT
+_SUBMITTED = B2BOrder.StatusChoices.SUBMITTED
+_APPROVED = B2BOrder.StatusChoices.APPROVED
+_IN_TRANSIT = B2BOrder.StatusChoices.IN_TRANSIT
+_DELIVERED = B2BOrder.StatusChoices.DELIVERED
+_CANCELLED = B2BOrder.StatusChoices.CANCELLED
+_REJECTED = B2BOrder.StatusChoices.REJECTED
+_WHOLESALER = Pharmacy.TypeChoices.WHOLESALER
+_RETAILER = Pharmacy.TypeChoices.RETAILER
+
+# Rows per INSERT when writing order lines.
+ITEM_BATCH_SIZE = 500
+
+# Columns needed by transitions that only flip status.
+STATUS_TRANSITION_FIELDS = ('id', 'status', 'is_deleted', 'updated_by', 'updated_at')
+
+# Valid status transitions: from_status -> frozenset of allowed to_status
 ORDER_TRANSITIONS = {
-    B2BOrder.StatusChoices.DRAFT: {B2BOrder.StatusChoices.SUBMITTED, B2BOrder.StatusChoices.CANCELLED},
-    B2BOrder.StatusChoices.SUBMITTED: {
-        B2BOrder.StatusChoices.APPROVED,
-        B2BOrder.StatusChoices.REJECTED,
-        B2BOrder.StatusChoices.CANCELLED,
-    },
-    B2BOrder.StatusChoices.APPROVED: {
-        B2BOrder.StatusChoices.IN_TRANSIT,
-        B2BOrder.StatusChoices.CANCELLED,
-    },
-    B2BOrder.StatusChoices.IN_TRANSIT: {
-        B2BOrder.StatusChoices.DELIVERED,
-        B2BOrder.StatusChoices.CANCELLED,
-    },
-    B2BOrder.StatusChoices.DELIVERED: set(),
-    B2BOrder.StatusChoices.CANCELLED: set(),
-    B2BOrder.StatusChoices.REJECTED: set(),
+    _DRAFT: frozenset({_SUBMITTED, _CANCELLED}),
+    _SUBMITTED: frozenset({_APPROVED, _REJECTED, _CANCELLED}),
+    _APPROVED: frozenset({_IN_TRANSIT, _CANCELLED}),
+    _IN_TRANSIT: frozenset({_DELIVERED, _CANCELLED}),
+    _DELIVERED: frozenset(),
+    _CANCELLED: frozenset(),
+    _REJECTED: frozenset(),
 }
 
+# ORDER_TRANSITIONS compiled at import time: status -> bit index, and one
+# bitmask of allowed targets per source status.
+_STATUS_IDX = {status: i for i, status in enumerate(B2BOrder.StatusChoices.values)}
+_ALLOWED = [0] * len(_STATUS_IDX)
+for _from, _targets in ORDER_TRANSITIONS.items():
+    _ALLOWED[_STATUS_IDX[_from]] = sum(1 << _STATUS_IDX[to] for to in _targets)
+del _from, _targets
+
 
 def _assert_transition(order: B2BOrder, new_status: str) -> None:
-    allowed = ORDER_TRANSITIONS.get(order.status, set())
-    if new_status not in allowed:
+    src = _STATUS_IDX.get(order.status)
+    if src is None or not (_ALLOWED[src] >> _STATUS_IDX[new_status]) & 1:
         raise InvalidStateTransition(
             detail=f'Cannot transition order from {order.status} to {new_status}.',
         )
 
 
-def _recompute_order_total(order: B2BOrder) -> Decimal:
-    total = sum(
-        (item.unit_price * item.quantity_ordered for item in order.items.filter(is_deleted=False)),
-        Decimal('0'),
-    )
-    order.total_amount = total
-    order.save(update_fields=['total_amount'])
-    return total
+_CENT = Decimal('0.01')
+
+
+def _money(value) -> Decimal:
+    """A price as Decimal rounded half-up to cents; floats go through str() to drop binary noise."""
+    if not isinstance(value, Decimal):
+        value = Decimal(str(value))
+    return value.quantize(_CENT, rounding=ROUND_HALF_UP)
+
+
+def _refresh_order_totals(orders: list[B2BOrder]) -> None:
+    """
+    Load total_amount / items_count onto `orders` after their items were written.
+    The live items are the only source: on PostgreSQL the b2b_order_item_totals
+    trigger has already stored the sums and they are read back; other backends
+    get the same aggregate computed and stored here.
+    """
+    by_pk = {order.pk: order for order in orders}
+    if connection.vendor == 'postgresql':
+        rows = B2BOrder.all_objects.filter(pk__in=by_pk).values_list('pk', 'total_amount', 'items_count')
+        for pk, total_amount, items_count in rows:
+            by_pk[pk].total_amount, by_pk[pk].items_count = total_amount, items_count
+        return
+
+    totals = {
+        row['order_id']: row
+        for row in B2BOrderItem.all_objects.filter(order_id__in=by_pk, is_deleted=False)
+        .values('order_id').annotate(total=Sum(LINE_TOTAL_EXPRESSION), count=Count('id'))
+    }
+    for pk, order in by_pk.items():
+        row = totals.get(pk)
+        order.total_amount = row['total'] if row else Decimal('0')
+        order.items_count = row['count'] if row else 0
+    B2BOrder.all_objects.bulk_update(orders, ['total_amount', 'items_count'], batch_size=ITEM_BATCH_SIZE)
 
 
 def _validate_item_prices(order: B2BOrder, price_override_approved: bool = False) -> None:
     """Raise if any item unit_price exceeds medicine authorized_price and override not granted."""
-    for item in order.items.filter(is_deleted=False).select_related('lot', 'lot__medicine'):
-        authorized = item.lot.medicine.authorized_price
-        if item.unit_price > authorized and not price_override_approved:
+    if price_override_approved:
+        return
+    # Compared in SQL: nothing is hydrated unless a line is actually overpriced.
+    item = order.items.filter(
+        is_deleted=False, unit_price__gt=F('lot__medicine__authorized_price'),
+    ).select_related('lot__medicine').first()
+    if item is not None:
+        raise BusinessRuleViolation(
+            detail=(
+                f'Unit price {item.unit_price} exceeds authorized price {item.lot.medicine.authorized_price} '
+                'for lot. Price override must be granted.'
+            ),
+        )
+
+
+def _load_order_lots(items: list[dict]) -> dict[str, NationalLot]:
+    """Fetch every referenced lot (with its medicine) in one query, keyed by str(pk)."""
+    lots = {
+        str(lot.pk): lot
+        for lot in NationalLot.objects.select_related('medicine').filter(
+            pk__in={row['lot_id'] for row in items},
+        )
+    }
+    for row in items:
+        if str(row['lot_id']) not in lots:
+            raise ResourceNotFoundError(detail=f"Lot {row['lot_id']} not found.")
+    return lots
+
+
+def _load_parties(pharmacy_ids) -> dict:
+    """Live pharmacies for the given ids in one query, keyed by str(pk)."""
+    return {
+        str(pharmacy.pk): pharmacy
+        for pharmacy in Pharmacy.objects.filter(pk__in=set(pharmacy_ids), is_deleted=False)
+    }
+
+
+def _build_draft_order(
+    *,
+    seller_id,
+    buyer_id,
+    items: list[dict],
+    parties: dict,
+    lots: dict[str, NationalLot],
+    actor=None,
+    price_override_approved: bool = False,
+) -> tuple[B2BOrder, list[B2BOrderItem]]:
+    """Validate and build an unsaved DRAFT order and its lines."""
+    seller = parties.get(str(seller_id))
+    if not seller or seller.pharmacy_type != _WHOLESALER:
+        raise ResourceNotFoundError(detail='Seller pharmacy (WHOLESALER) not found.')
+    buyer = parties.get(str(buyer_id))
+    if not buyer or buyer.pharmacy_type != _RETAILER:
+        raise ResourceNotFoundError(detail='Buyer pharmacy (RETAILER) not found.')
+
+    order = B2BOrder(
+        seller=seller,
+        buyer=buyer,
+        status=_DRAFT,
+        price_override_approved=price_override_approved,
+        created_by=actor,
+    )
+    items_to_create = []
+    for row in items:
+        lot = lots[str(row['lot_id'])]
+        if not lot.is_usable:
+            raise BusinessRuleViolation(detail=f'Lot {lot.pk} is not usable for stock.')
+        authorized = lot.medicine.authorized_price
+        unit_price = _money(row.get('unit_price', authorized))
+        if unit_price > authorized and not price_override_approved:
             raise BusinessRuleViolation(
-                detail=(
-                    f'Unit price {item.unit_price} exceeds authorized price {authorized} '
-                    'for lot. Price override must be granted.'
-                ),
+                detail=f'Unit price exceeds authorized price for lot {lot.pk}.',
             )
+        qty = row['quantity_ordered']
+        if qty <= 0:
+            raise BusinessRuleViolation(detail='Quantity must be positive.')
+        items_to_create.append(B2BOrderItem(
+            order=order,
+            lot=lot,
+            quantity_ordered=qty,
+            unit_price=unit_price,
+            created_by=actor,
+        ))
+    return order, items_to_create
 
 
 class B2BOrderService:
@@ -96,53 +222,53 @@ class B2BOrderService:
         price_override_approved: bool = False,
     ) -> B2BOrder:
         """Create order in DRAFT with items. Validates seller=WHOLESALER, buyer=RETAILER."""
-        from pharmacies.models import Pharmacy
-
-        seller = Pharmacy.objects.filter(
-            pk=seller_id, pharmacy_type=Pharmacy.TypeChoices.WHOLESALER, is_deleted=False,
-        ).first()
-        if not seller:
-            raise ResourceNotFoundError(detail='Seller pharmacy (WHOLESALER) not found.')
-        buyer = Pharmacy.objects.filter(
-            pk=buyer_id, pharmacy_type=Pharmacy.TypeChoices.RETAILER, is_deleted=False,
-        ).first()
-        if not buyer:
-            raise ResourceNotFoundError(detail='Buyer pharmacy (RETAILER) not found.')
-
-        order = B2BOrder(
-            seller=seller,
-            buyer=buyer,
-            status=B2BOrder.StatusChoices.DRAFT,
+        parties = _load_parties([seller_id, buyer_id])
+        order, items_to_create = _build_draft_order(
+            seller_id=seller_id,
+            buyer_id=buyer_id,
+            items=items,
+            parties=parties,
+            lots=_load_order_lots(items),
+            actor=actor,
             price_override_approved=price_override_approved,
-            created_by=actor,
         )
         order.save()
-        total = Decimal('0')
-        for row in items:
-            lot = NationalLot.objects.get(pk=row['lot_id'], is_deleted=False)
-            if not lot.is_usable:
-                raise BusinessRuleViolation(detail=f'Lot {lot.pk} is not usable for stock.')
-            authorized = lot.medicine.authorized_price
-            unit_price = row.get('unit_price', authorized)
-            if unit_price > authorized and not price_override_approved:
-                raise BusinessRuleViolation(
-                    detail=f'Unit price exceeds authorized price for lot {lot.pk}.',
-                )
-            qty = row['quantity_ordered']
-            if qty <= 0:
-                raise BusinessRuleViolation(detail='Quantity must be positive.')
-            B2BOrderItem.objects.create(
-                order=order,
-                lot=lot,
-                quantity_ordered=qty,
-                unit_price=unit_price,
-                created_by=actor,
-            )
-            total += unit_price * qty
-        order.total_amount = total
-        order.save(update_fields=['total_amount'])
+        B2BOrderItem.objects.bulk_create(items_to_create, batch_size=ITEM_BATCH_SIZE)
+        _refresh_order_totals([order])
         return order
 
+    @staticmethod
+    @transaction.atomic
+    def create_orders_bulk(*, orders: list[dict], actor=None) -> list[B2BOrder]:
+        """
+        Create many DRAFT orders (import/seed paths) with the same validation as
+        create_order. Each dict takes create_order's keyword arguments (seller_id,
+        buyer_id, items, optional price_override_approved).
+
+        Parties and lots are loaded once for the whole batch; orders and items are
+        written with one bulk_create each. Nothing is written if any order fails.
+        """
+        parties = _load_parties([pk for spec in orders for pk in (spec['seller_id'], spec['buyer_id'])])
+        lots = _load_order_lots([row for spec in orders for row in spec['items']])
+        built = [
+            _build_draft_order(
+                seller_id=spec['seller_id'],
+                buyer_id=spec['buyer_id'],
+                items=spec['items'],
+                parties=parties,
+                lots=lots,
+                actor=actor,
+                price_override_approved=spec.get('price_override_approved', False),
+            )
+            for spec in orders
+        ]
+        created = B2BOrder.objects.bulk_create([order for order, _ in built], batch_size=ITEM_BATCH_SIZE)
+        B2BOrderItem.objects.bulk_create(
+            [item for _, items in built for item in items], batch_size=ITEM_BATCH_SIZE,
+        )
+        _refresh_order_totals(created)
+        return created
+
     @staticmethod
     @transaction.atomic
     def update_draft_order(
@@ -153,50 +279,51 @@ class B2BOrderService:
         actor=None,
     ) -> B2BOrder:
         """Update a DRAFT order (replace items, optionally set price_override_approved)."""
-        order = B2BOrder.objects.select_for_update().get(pk=order_id, is_deleted=False)
-        if order.status != B2BOrder.StatusChoices.DRAFT:
+        order = B2BOrder.objects.select_for_update().get(pk=order_id)
+        if order.status != _DRAFT:
             raise InvalidStateTransition(detail='Only DRAFT orders can be updated.')
+        update_fields = ['updated_by', 'updated_at']
         if price_override_approved is not None:
             order.price_override_approved = price_override_approved
-            order.updated_by = actor
-            order.save(update_fields=['price_override_approved', 'updated_by', 'updated_at'])
+            update_fields.append('price_override_approved')
         if items is not None:
-            for item in order.items.filter(is_deleted=False):
-                item.soft_delete(user=actor)
-            total = Decimal('0')
+            B2BOrderItem.bulk_soft_delete(order.items.filter(is_deleted=False), user=actor)
+            items_to_create = []
+            lots = _load_order_lots(items)
             for row in items:
-                lot = NationalLot.objects.get(pk=row['lot_id'], is_deleted=False)
+                lot = lots[str(row['lot_id'])]
                 if not lot.is_usable:
                     raise BusinessRuleViolation(detail=f'Lot {lot.pk} is not usable.')
-                unit_price = row.get('unit_price', lot.medicine.authorized_price)
+                unit_price = _money(row.get('unit_price', lot.medicine.authorized_price))
                 qty = row['quantity_ordered']
                 if qty <= 0:
                     raise BusinessRuleViolation(detail='Quantity must be positive.')
-                B2BOrderItem.objects.create(
+                items_to_create.append(B2BOrderItem(
                     order=order,
                     lot=lot,
                     quantity_ordered=qty,
                     unit_price=unit_price,
                     created_by=actor,
-                )
-                total += unit_price * qty
-            order.total_amount = total
-            order.save(update_fields=['total_amount', 'updated_by', 'updated_at'])
+                ))
+            B2BOrderItem.objects.bulk_create(items_to_create, batch_size=ITEM_BATCH_SIZE)
         order.updated_by = actor
-        order.save(update_fields=['updated_by', 'updated_at'])
+        order.save(update_fields=update_fields)
+        if items is not None:
+            _refresh_order_totals([order])
         return order
 
     @staticmethod
     @transaction.atomic
     def submit_order(*, order_id, actor=None) -> B2BOrder:
-        order = B2BOrder.objects.select_for_update().select_related('seller', 'buyer').get(
-            pk=order_id, is_deleted=False,
-        )
-        _assert_transition(order, B2BOrder.StatusChoices.SUBMITTED)
-        if not order.items.filter(is_deleted=False).exists():
+        # EXISTS rather than Count(): PostgreSQL rejects FOR UPDATE with GROUP BY.
+        order = B2BOrder.objects.select_for_update().only(*STATUS_TRANSITION_FIELDS).annotate(
+            has_items=Exists(B2BOrderItem.objects.filter(order=OuterRef('pk'))),
+        ).get(pk=order_id)
+        _assert_transition(order, _SUBMITTED)
+        if not order.has_items:
             raise BusinessRuleViolation(detail='Order must have at least one item.')
         old_status = order.status
-        order.status = B2BOrder.StatusChoices.SUBMITTED
+        order.status = _SUBMITTED
         order.updated_by = actor
         order.save(update_fields=['status', 'updated_by', 'updated_at'])
         AuditService.log(
@@ -212,32 +339,32 @@ class B2BOrderService:
     @staticmethod
     @transaction.atomic
     def approve_order(*, order_id, credit_used: Decimal | None = None, actor=None) -> B2BOrder:
-        order = B2BOrder.objects.select_for_update().select_related('seller', 'buyer').prefetch_related(
-            'items__lot', 'items__lot__medicine',
-        ).get(pk=order_id, is_deleted=False)
-        _assert_transition(order, B2BOrder.StatusChoices.APPROVED)
+        order = B2BOrder.objects.select_for_update(of=('self',)).select_related('seller', 'buyer').get(
+            pk=order_id,
+        )
+        _assert_transition(order, _APPROVED)
         _validate_item_prices(order, price_override_approved=order.price_override_approved)
 
         credit_used = credit_used or order.total_amount
         if credit_used > 0:
-            try:
-                credit = PharmacyCredit.objects.select_for_update().get(pharmacy=order.buyer)
-            except PharmacyCredit.DoesNotExist:
-                raise BusinessRuleViolation(detail='Buyer has no credit line configured.')
-            available = credit.credit_limit - credit.current_balance - credit.reserved_balance
-            if available < credit_used:
+            # Check and reserve in one conditional UPDATE; only read the row to explain a failure.
+            reserved = PharmacyCredit.objects.filter(pharmacy=order.buyer_id).alias(
+                available=AVAILABLE_CREDIT_EXPRESSION,
+            ).filter(available__gte=credit_used).update(
+                reserved_balance=F('reserved_balance') + credit_used, updated_at=timezone.now(),
+            )
+            if not reserved:
+                credit = PharmacyCredit.objects.filter(pharmacy=order.buyer_id).first()
+                if credit is None:
+                    raise BusinessRuleViolation(detail='Buyer has no credit line configured.')
                 raise BusinessRuleViolation(
-                    detail=f'Insufficient credit: available={available}, order total={credit_used}.',
+                    detail=f'Insufficient credit: available={credit.available_credit}, order total={credit_used}.',
                 )
-            credit.reserved_balance += credit_used
-            credit.save(update_fields=['reserved_balance', 'updated_at'])
-        order.credit_used = credit_used
-        order.save(update_fields=['credit_used', 'updated_at'])
-
         old_status = order.status
-        order.status = B2BOrder.StatusChoices.APPROVED
+        order.credit_used = credit_used
+        order.status = _APPROVED
         order.updated_by = actor
-        order.save(update_fields=['status', 'updated_by', 'updated_at'])
+        order.save(update_fields=['credit_used', 'status', 'updated_by', 'updated_at'])
         AuditService.log(
             actor=actor,
             action=AUDIT_ACTION_STATUS_CHANGE,
@@ -251,10 +378,12 @@ class B2BOrderService:
     @staticmethod
     @transaction.atomic
     def ship_order(*, order_id, actor=None) -> B2BOrder:
-        order = B2BOrder.objects.select_for_update().get(pk=order_id, is_deleted=False)
-        _assert_transition(order, B2BOrder.StatusChoices.IN_TRANSIT)
+        order = B2BOrder.objects.select_for_update().only(*STATUS_TRANSITION_FIELDS).get(
+            pk=order_id,
+        )
+        _assert_transition(order, _IN_TRANSIT)
         old_status = order.status
-        order.status = B2BOrder.StatusChoices.IN_TRANSIT
+        order.status = _IN_TRANSIT
         order.updated_by = actor
         order.save(update_fields=['status', 'updated_by', 'updated_at'])
         AuditService.log(
@@ -269,43 +398,44 @@ class B2BOrderService:
 
     @staticmethod
     @transaction.atomic
+    @AuditService.batch()
     def deliver_order(*, order_id, actor=None) -> B2BOrder:
-        order = B2BOrder.objects.select_for_update().select_related('seller', 'buyer').prefetch_related(
-            'items__lot',
-        ).get(pk=order_id, is_deleted=False)
-        _assert_transition(order, B2BOrder.StatusChoices.DELIVERED)
-
-        for item in order.items.filter(is_deleted=False):
-            if item.quantity_ordered <= 0:
-                continue
-            try:
-                StockService.process_b2b_transaction(
-                    seller_entity_type=StockMovement.EntityType.PHARMACY,
-                    seller_entity_id=order.seller_id,
-                    buyer_entity_type=StockMovement.EntityType.PHARMACY,
-                    buyer_entity_id=order.buyer_id,
-                    lot_id=item.lot_id,
-                    quantity=item.quantity_ordered,
-                    created_by=actor,
-                    reference_id=order.pk,
-                    reference_type='B2BOrder',
-                )
-            except InsufficientStockError as e:
-                raise BusinessRuleViolation(
-                    detail=f'Seller insufficient stock for lot {item.lot_id}: {e.detail}.',
-                )
+        order = B2BOrder.objects.select_for_update(of=('self',)).select_related('seller', 'buyer').get(
+            pk=order_id,
+        )
+        _assert_transition(order, _DELIVERED)
+
+        # items_list (live lines with lot/medicine) is reused by the read serializer afterwards.
+        items = [item for item in order.items_list if item.quantity_ordered > 0]
+        try:
+            StockService.process_b2b_transactions_bulk(
+                seller_entity_type=StockMovement.EntityType.PHARMACY,
+                seller_entity_id=order.seller_id,
+                buyer_entity_type=StockMovement.EntityType.PHARMACY,
+                buyer_entity_id=order.buyer_id,
+                lines=[(item.lot_id, item.quantity_ordered) for item in items],
+                created_by=actor,
+                reference_id=order.pk,
+                reference_type='B2BOrder',
+            )
+        except InsufficientStockError as e:
+            raise BusinessRuleViolation(detail=e.detail)
+        now = timezone.now()
+        for item in items:
             item.quantity_delivered = item.quantity_ordered
-            item.save(update_fields=['quantity_delivered', 'updated_at'])
+            item.updated_at = now
+        B2BOrderItem.objects.bulk_update(items, ['quantity_delivered', 'updated_at'], batch_size=ITEM_BATCH_SIZE)
 
         if order.credit_used > 0:
-            credit = PharmacyCredit.objects.select_for_update().get(pharmacy=order.buyer)
-            credit.reserved_balance -= order.credit_used
-            credit.current_balance += order.credit_used
-            credit.save(update_fields=['reserved_balance', 'current_balance', 'updated_at'])
+            PharmacyCredit.objects.filter(pharmacy=order.buyer_id).update(
+                reserved_balance=F('reserved_balance') - order.credit_used,
+                current_balance=F('current_balance') + order.credit_used,
+                updated_at=timezone.now(),
+            )
 
         # JournalEntry creation deferred to Phase 8 (finance)
         old_status = order.status
-        order.status = B2BOrder.StatusChoices.DELIVERED
+        order.status = _DELIVERED
         order.updated_by = actor
         order.save(update_fields=['status', 'updated_by', 'updated_at'])
         AuditService.log(
@@ -316,31 +446,32 @@ class B2BOrderService:
             old_values={'status': old_status},
             new_values={'status': 'DELIVERED'},
         )
-        logger.info('B2B order %s delivered.', order_id)
+        # After commit: slow log handlers must not extend the row/advisory locks.
+        transaction.on_commit(partial(logger.info, 'B2B order %s delivered.', order_id))
         return order
 
     @staticmethod
     @transaction.atomic
     def cancel_order(*, order_id, actor=None) -> B2BOrder:
-        order = B2BOrder.objects.select_for_update().select_related('seller', 'buyer').prefetch_related(
-            'items__lot',
-        ).get(pk=order_id, is_deleted=False)
-        _assert_transition(order, B2BOrder.StatusChoices.CANCELLED)
+        order = B2BOrder.objects.select_for_update().only(*STATUS_TRANSITION_FIELDS, 'buyer', 'credit_used').get(
+            pk=order_id,
+        )
+        _assert_transition(order, _CANCELLED)
 
-        if order.status == B2BOrder.StatusChoices.DELIVERED:
+        if order.status == _DELIVERED:
             raise InvalidStateTransition(detail='Cannot cancel an already delivered order; use reversal flow.')
 
-        if order.status in (B2BOrder.StatusChoices.APPROVED, B2BOrder.StatusChoices.IN_TRANSIT) and order.credit_used > 0:
-            credit = PharmacyCredit.objects.select_for_update().get(pharmacy=order.buyer)
-            credit.reserved_balance -= order.credit_used
-            credit.save(update_fields=['reserved_balance', 'updated_at'])
+        if order.status in (_APPROVED, _IN_TRANSIT) and order.credit_used > 0:
+            PharmacyCredit.objects.filter(pharmacy=order.buyer_id).update(
+                reserved_balance=F('reserved_balance') - order.credit_used, updated_at=timezone.now(),
+            )
 
-        if order.status == B2BOrder.StatusChoices.IN_TRANSIT:
+        if order.status == _IN_TRANSIT:
             # Already shipped but not delivered: release reserved only (no stock moved yet)
             pass
 
         old_status = order.status
-        order.status = B2BOrder.StatusChoices.CANCELLED
+        order.status = _CANCELLED
         order.updated_by = actor
         order.save(update_fields=['status', 'updated_by', 'updated_at'])
         AuditService.log(
@@ -356,10 +487,12 @@ class B2BOrderService:
     @staticmethod
     @transaction.atomic
     def reject_order(*, order_id, actor=None) -> B2BOrder:
-        order = B2BOrder.objects.select_for_update().get(pk=order_id, is_deleted=False)
-        _assert_transition(order, B2BOrder.StatusChoices.REJECTED)
+        order = B2BOrder.objects.select_for_update().only(*STATUS_TRANSITION_FIELDS).get(
+            pk=order_id,
+        )
+        _assert_transition(order, _REJECTED)
         old_status = order.status
-        order.status = B2BOrder.StatusChoices.REJECTED
+        order.status = _REJECTED
         order.updated_by = actor
         order.save(update_fields=['status', 'updated_by', 'updated_at'])
         AuditService.log(
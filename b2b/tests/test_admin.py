@@ -0,0 +1,22 @@
+"""
+Tests — B2B admin paginator.
+
+@file b2b/tests/test_admin.py
+"""
+
+import pytest
+
+from b2b.admin import EstimatedPaginator
+from b2b.models import B2BOrder
+
+
+@pytest.mark.parametrize('queryset, unfiltered', [
+    (B2BOrder.objects.all(), True),
+    (B2BOrder.all_objects.all(), True),
+    (B2BOrder.all_objects.filter(is_deleted=True), False),
+    (B2BOrder.all_objects.exclude(is_deleted=False), False),
+    (B2BOrder.all_objects.filter(is_deleted__in=[False, True]), False),
+    (B2BOrder.objects.filter(status='DRAFT'), False),
+])
+def test_only_default_soft_delete_filter_counts_as_unfiltered(queryset, unfiltered):
+    assert EstimatedPaginator._is_unfiltered(queryset.query) is unfiltered
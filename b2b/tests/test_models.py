@@ -7,7 +7,14 @@ Tests — B2BOrder, B2BOrderItem, PharmacyCredit models.
 import pytest
 from decimal import Decimal
 
-from b2b.models import B2BOrder, B2BOrderItem, PharmacyCredit
+from b2b.models import (
+    AVAILABLE_CREDIT_EXPRESSION,
+    LINE_TOTAL_EXPRESSION,
+    LOT_DISPLAY_EXPRESSION,
+    B2BOrder,
+    B2BOrderItem,
+    PharmacyCredit,
+)
 from tests.factories import (
     B2BOrderFactory,
     B2BOrderItemFactory,
@@ -29,6 +36,15 @@ class TestPharmacyCredit:
         )
         assert credit.available_credit == Decimal('70000')
 
+    def test_available_credit_annotation(self):
+        credit = PharmacyCreditFactory(
+            credit_limit=Decimal('50000'),
+            current_balance=Decimal('5000'),
+            reserved_balance=Decimal('2500'),
+        )
+        annotated = PharmacyCredit.objects.annotate(available_credit=AVAILABLE_CREDIT_EXPRESSION).get(pk=credit.pk)
+        assert annotated.available_credit == Decimal('42500')
+
 
 class TestB2BOrder:
     def test_create_order(self):
@@ -47,3 +63,18 @@ class TestB2BOrderItem:
     def test_line_total(self):
         item = B2BOrderItemFactory(quantity_ordered=5, unit_price=Decimal('1000'))
         assert item.unit_price * item.quantity_ordered == Decimal('5000')
+
+    def test_line_total_property(self):
+        item = B2BOrderItemFactory(quantity_ordered=5, unit_price=Decimal('1000'))
+        assert item.line_total == Decimal('5000')
+
+    def test_line_total_annotation(self):
+        item = B2BOrderItemFactory(quantity_ordered=3, unit_price=Decimal('1500'))
+        annotated = B2BOrderItem.objects.annotate(line_total=LINE_TOTAL_EXPRESSION).get(pk=item.pk)
+        assert annotated.line_total == Decimal('4500')
+
+    def test_lot_display_annotation_matches_property(self):
+        item = B2BOrderItemFactory()
+        annotated = B2BOrderItem.objects.annotate(lot_display=LOT_DISPLAY_EXPRESSION).get(pk=item.pk)
+        assert annotated.lot_display == item.lot_display
+        assert item.lot_display == f'{item.lot.batch_number} — {item.lot.medicine.inn}'
@@ -0,0 +1,73 @@
+"""
+Tests — Order item list parsing matches plain nested DRF validation.
+
+@file b2b/tests/test_serializers.py
+"""
+
+import uuid
+from decimal import Decimal
+
+import pytest
+from django.utils import translation
+from rest_framework import serializers
+
+from b2b.serializers import B2BOrderItemWriteSerializer
+
+LOT_ID = uuid.UUID('12345678-1234-5678-1234-567812345678')
+
+
+def _parse(serializer):
+    if serializer.is_valid():
+        return 'valid', serializer.validated_data
+    return 'invalid', serializer.errors
+
+
+def _fast(items):
+    return _parse(B2BOrderItemWriteSerializer(many=True, data=items))
+
+
+def _plain(items):
+    return _parse(serializers.ListSerializer(child=B2BOrderItemWriteSerializer(), data=items))
+
+
+def _normalised(result):
+    # The fast path returns lot_id as a string and plain dicts; compare values only.
+    state, payload = result
+    if state == 'valid':
+        payload = [{key: str(value) if key == 'lot_id' else value for key, value in row.items()} for row in payload]
+    return state, payload
+
+
+@pytest.mark.parametrize('item', [
+    {'lot_id': str(LOT_ID), 'quantity_ordered': 2},
+    {'lot_id': str(LOT_ID).upper(), 'quantity_ordered': '3'},
+    {'lot_id': LOT_ID.hex, 'quantity_ordered': 2.0},
+    {'lot_id': str(LOT_ID), 'quantity_ordered': '2.0'},
+    {'lot_id': str(LOT_ID), 'quantity_ordered': ' 4 '},
+    {'lot_id': str(LOT_ID), 'quantity_ordered': 2.5},
+    {'lot_id': str(LOT_ID), 'quantity_ordered': True},
+    {'lot_id': str(LOT_ID), 'quantity_ordered': 0},
+    {'lot_id': str(LOT_ID), 'quantity_ordered': None},
+    {'lot_id': str(LOT_ID), 'quantity_ordered': 1, 'unit_price': None},
+    {'lot_id': str(LOT_ID), 'quantity_ordered': 1, 'unit_price': '12.50'},
+    {'lot_id': str(LOT_ID), 'quantity_ordered': 1, 'unit_price': '12.345'},
+    {'lot_id': 'not-a-uuid', 'quantity_ordered': 'x'},
+    {'lot_id': None},
+    {},
+    'not-a-dict',
+])
+def test_item_parsing_matches_plain_list_serializer(item):
+    assert _normalised(_fast([item])) == _normalised(_plain([item]))
+
+
+def test_item_errors_use_drf_translations():
+    with translation.override('fr'):
+        state, errors = _fast([{'lot_id': str(LOT_ID), 'quantity_ordered': 'x'}])
+    assert state == 'invalid'
+    assert str(errors[0]['quantity_ordered'][0]) == 'Un nombre entier valide est requis.'
+
+
+def test_valid_items_keep_types():
+    state, rows = _fast([{'lot_id': str(LOT_ID), 'quantity_ordered': '2.0', 'unit_price': '1.5'}])
+    assert state == 'valid'
+    assert rows == [{'lot_id': str(LOT_ID), 'quantity_ordered': 2, 'unit_price': Decimal('1.50')}]
@@ -4,12 +4,22 @@ Tests — B2BOrderService: lifecycle, credit reserve/release, dual stock on deli
 @file b2b/tests/test_services.py
 """
 
+import uuid
+
 import pytest
 from decimal import Decimal
 
-from b2b.models import B2BOrder, PharmacyCredit
-from b2b.services import B2BOrderService
-from core.exceptions import BusinessRuleViolation, InvalidStateTransition
+from django.db import connection
+
+from b2b.models import B2BOrder, B2BOrderItem, PharmacyCredit
+from b2b.services import (
+    ORDER_TRANSITIONS,
+    B2BOrderService,
+    _assert_transition,
+    _refresh_order_totals,
+)
+from core.exceptions import BusinessRuleViolation, InvalidStateTransition, ResourceNotFoundError
+from core.models import AuditLog
 from stock.models import StockMovement
 from stock.services import StockService
 from tests.factories import (
@@ -24,6 +34,10 @@ from tests.factories import (
 
 pytestmark = pytest.mark.django_db
 
+# Reading order totals back after item writes: one SELECT of trigger-maintained
+# values on PostgreSQL, aggregate + bulk UPDATE elsewhere.
+TOTALS_QUERIES = 1 if connection.vendor == 'postgresql' else 2
+
 
 def _wholesaler():
     return PharmacyFactory(pharmacy_type='WHOLESALER', status='APPROVED')
@@ -47,6 +61,128 @@ class TestOrderLifecycle:
         assert order.status == B2BOrder.StatusChoices.DRAFT
         assert order.items.filter(is_deleted=False).count() == 1
         assert order.total_amount == lot.medicine.authorized_price * 5
+        assert order.items_count == 1
+
+    def test_create_order_loads_lots_in_one_query(self, django_assert_num_queries):
+        seller, buyer = _wholesaler(), _retailer()
+        lots = NationalLotFactory.create_batch(3)
+        items = [{'lot_id': lot.pk, 'quantity_ordered': 1} for lot in lots]
+        # savepoint, seller + buyer, lots (+ medicine), order INSERT, item INSERT, totals, release
+        with django_assert_num_queries(6 + TOTALS_QUERIES):
+            order = B2BOrderService.create_order(seller_id=seller.pk, buyer_id=buyer.pk, items=items)
+        assert order.items_count == 3
+
+    def test_create_order_checks_party_types(self):
+        lot = NationalLotFactory()
+        retailer, wholesaler = _retailer(), _wholesaler()
+        items = [{'lot_id': lot.pk, 'quantity_ordered': 1}]
+        with pytest.raises(ResourceNotFoundError, match='Seller'):
+            B2BOrderService.create_order(seller_id=retailer.pk, buyer_id=retailer.pk, items=items)
+        with pytest.raises(ResourceNotFoundError, match='Buyer'):
+            B2BOrderService.create_order(seller_id=wholesaler.pk, buyer_id=wholesaler.pk, items=items)
+
+    def test_create_orders_bulk(self, django_assert_num_queries):
+        seller = _wholesaler()
+        buyers = [_retailer() for _ in range(3)]
+        lots = NationalLotFactory.create_batch(2)
+        specs = [
+            {
+                'seller_id': seller.pk,
+                'buyer_id': buyer.pk,
+                'items': [{'lot_id': lot.pk, 'quantity_ordered': 2} for lot in lots],
+            }
+            for buyer in buyers
+        ]
+        # savepoint, parties, lots (+ medicine), order INSERT, item INSERT, totals, release
+        with django_assert_num_queries(6 + TOTALS_QUERIES):
+            orders = B2BOrderService.create_orders_bulk(orders=specs)
+        assert B2BOrder.objects.filter(pk__in=[o.pk for o in orders]).count() == 3
+        expected = sum(lot.medicine.authorized_price * 2 for lot in lots)
+        for order in orders:
+            order.refresh_from_db()
+            assert (order.total_amount, order.items_count, order.items.count()) == (expected, 2, 2)
+
+    def test_create_orders_bulk_rounds_float_prices_to_cents(self):
+        seller, buyer = _wholesaler(), _retailer()
+        lots = NationalLotFactory.create_batch(2, medicine__authorized_price=Decimal('100'))
+        specs = [{
+            'seller_id': seller.pk,
+            'buyer_id': buyer.pk,
+            'items': [
+                {'lot_id': lots[0].pk, 'quantity_ordered': 10, 'unit_price': 0.29},
+                {'lot_id': lots[1].pk, 'quantity_ordered': 1, 'unit_price': Decimal('10.005')},
+            ],
+        }]
+        [order] = B2BOrderService.create_orders_bulk(orders=specs)
+        order.refresh_from_db()
+        assert order.total_amount == Decimal('12.91')
+        prices = sorted(order.items.values_list('unit_price', flat=True))
+        assert prices == [Decimal('0.29'), Decimal('10.01')]
+
+    def test_create_orders_bulk_is_all_or_nothing(self):
+        seller, buyer = _wholesaler(), _retailer()
+        lot = NationalLotFactory()
+        specs = [
+            {'seller_id': seller.pk, 'buyer_id': buyer.pk, 'items': [{'lot_id': lot.pk, 'quantity_ordered': 1}]},
+            {'seller_id': buyer.pk, 'buyer_id': buyer.pk, 'items': [{'lot_id': lot.pk, 'quantity_ordered': 1}]},
+        ]
+        with pytest.raises(ResourceNotFoundError):
+            B2BOrderService.create_orders_bulk(orders=specs)
+        assert not B2BOrder.objects.exists()
+
+    def test_create_order_unknown_lot_raises(self):
+        with pytest.raises(ResourceNotFoundError):
+            B2BOrderService.create_order(
+                seller_id=_wholesaler().pk,
+                buyer_id=_retailer().pk,
+                items=[{'lot_id': uuid.uuid4(), 'quantity_ordered': 1}],
+            )
+
+    def test_update_draft_order_replaces_items(self):
+        actor = SuperuserFactory()
+        order = B2BOrderFactory(status=B2BOrder.StatusChoices.DRAFT)
+        old_items = B2BOrderItemFactory.create_batch(2, order=order)
+        lot = NationalLotFactory()
+        order = B2BOrderService.update_draft_order(
+            order_id=order.pk,
+            items=[{'lot_id': lot.pk, 'quantity_ordered': 4}],
+            actor=actor,
+        )
+        for item in old_items:
+            item.refresh_from_db()
+            assert item.is_deleted and item.deleted_by == actor and item.deleted_at is not None
+        audited = AuditLog.objects.filter(action=AuditLog.ActionChoices.SOFT_DELETE, model_name='B2BOrderItem')
+        assert sorted(audited.values_list('object_id', flat=True)) == sorted(str(item.pk) for item in old_items)
+        assert all(entry.actor == actor for entry in audited)
+        live = order.items.filter(is_deleted=False)
+        assert [item.lot_id for item in live] == [lot.pk]
+        assert order.items_count == 1
+        assert order.total_amount == lot.medicine.authorized_price * 4
+
+    def test_refresh_order_totals(self, django_assert_num_queries):
+        order, empty = B2BOrderFactory(), B2BOrderFactory()
+        B2BOrderItemFactory(order=order, quantity_ordered=2, unit_price=Decimal('100.50'))
+        B2BOrderItemFactory(order=order, quantity_ordered=1, unit_price=Decimal('10'))
+        B2BOrderItemFactory(order=order, quantity_ordered=9, unit_price=Decimal('10'), is_deleted=True)
+        with django_assert_num_queries(TOTALS_QUERIES):
+            _refresh_order_totals([order, empty])
+        assert (order.total_amount, order.items_count) == (Decimal('211.00'), 2)
+        assert (empty.total_amount, empty.items_count) == (Decimal('0'), 0)
+        order.refresh_from_db()
+        assert (order.total_amount, order.items_count) == (Decimal('211.00'), 2)
+
+    @pytest.mark.skipif(connection.vendor != 'postgresql', reason='order totals trigger is PostgreSQL-only')
+    def test_totals_trigger_updates_every_touched_order(self):
+        first, second = B2BOrderFactory(), B2BOrderFactory()
+        moved = B2BOrderItemFactory(order=first, quantity_ordered=2, unit_price=Decimal('5'))
+        B2BOrderItemFactory(order=first, quantity_ordered=1, unit_price=Decimal('7'))
+        B2BOrderItemFactory(order=second, quantity_ordered=3, unit_price=Decimal('1'))
+        B2BOrderItem.all_objects.filter(pk=moved.pk).update(order=second)
+        B2BOrderItem.all_objects.filter(order=second, unit_price=Decimal('1')).update(is_deleted=True)
+        first.refresh_from_db()
+        second.refresh_from_db()
+        assert (first.total_amount, first.items_count) == (Decimal('7'), 1)
+        assert (second.total_amount, second.items_count) == (Decimal('10'), 1)
 
     def test_submit_approve_ship_deliver(self):
         seller = _wholesaler()
@@ -82,6 +218,8 @@ class TestOrderLifecycle:
         credit.refresh_from_db()
         assert credit.reserved_balance == 0
         assert credit.current_balance == order.total_amount
+        assert [item.quantity_delivered for item in order.items_list] == [10]
+        assert order.items.get().quantity_delivered == 10
 
     def test_approve_without_credit_raises(self):
         seller = _wholesaler()
@@ -95,9 +233,50 @@ class TestOrderLifecycle:
             actor=SuperuserFactory(),
         )
         B2BOrderService.submit_order(order_id=order.pk, actor=SuperuserFactory())
-        with pytest.raises(BusinessRuleViolation, match='credit'):
+        with pytest.raises(BusinessRuleViolation, match='no credit line'):
             B2BOrderService.approve_order(order_id=order.pk, actor=SuperuserFactory())
 
+    def test_approve_over_available_credit_raises(self):
+        buyer = _retailer()
+        PharmacyCreditFactory(
+            pharmacy=buyer, credit_limit=Decimal('1500'),
+            current_balance=Decimal('0'), reserved_balance=Decimal('600'),
+        )
+        order = B2BOrderFactory(
+            buyer=buyer, status=B2BOrder.StatusChoices.SUBMITTED, total_amount=Decimal('1000'),
+        )
+        B2BOrderItemFactory(order=order, quantity_ordered=1, unit_price=Decimal('1000'))
+        with pytest.raises(BusinessRuleViolation, match='available=900'):
+            B2BOrderService.approve_order(order_id=order.pk, actor=SuperuserFactory())
+        assert PharmacyCredit.objects.get(pharmacy=buyer).reserved_balance == Decimal('600')
+
+    def test_approve_overpriced_item_requires_override(self):
+        buyer = _retailer()
+        PharmacyCreditFactory(pharmacy=buyer, credit_limit=Decimal('1000000'))
+        order = B2BOrderFactory(buyer=buyer, status=B2BOrder.StatusChoices.SUBMITTED)
+        item = B2BOrderItemFactory(order=order, quantity_ordered=1)
+        item.unit_price = item.lot.medicine.authorized_price + 1
+        item.save()
+        with pytest.raises(BusinessRuleViolation, match='exceeds authorized price'):
+            B2BOrderService.approve_order(order_id=order.pk, actor=SuperuserFactory())
+        order.price_override_approved = True
+        order.save()
+        order = B2BOrderService.approve_order(order_id=order.pk, actor=SuperuserFactory())
+        assert order.status == B2BOrder.StatusChoices.APPROVED
+
+    def test_second_approval_cannot_overdraw_credit(self):
+        buyer = _retailer()
+        PharmacyCreditFactory(pharmacy=buyer, credit_limit=Decimal('1000'))
+        orders = []
+        for _ in range(2):
+            order = B2BOrderFactory(buyer=buyer, status=B2BOrder.StatusChoices.SUBMITTED, total_amount=Decimal('600'))
+            B2BOrderItemFactory(order=order, quantity_ordered=1, unit_price=Decimal('600'))
+            orders.append(order)
+        B2BOrderService.approve_order(order_id=orders[0].pk, actor=SuperuserFactory())
+        with pytest.raises(BusinessRuleViolation, match='available=400'):
+            B2BOrderService.approve_order(order_id=orders[1].pk, actor=SuperuserFactory())
+        assert PharmacyCredit.objects.get(pharmacy=buyer).reserved_balance == Decimal('600')
+
     def test_cancel_after_approve_releases_reserved(self):
         seller = _wholesaler()
         buyer = _retailer()
@@ -114,6 +293,12 @@ class TestOrderLifecycle:
         credit.refresh_from_db()
         assert credit.reserved_balance == 0
 
+    def test_submit_requires_live_item(self):
+        order = B2BOrderFactory(seller=_wholesaler(), buyer=_retailer(), status=B2BOrder.StatusChoices.DRAFT)
+        B2BOrderItemFactory(order=order, is_deleted=True)
+        with pytest.raises(BusinessRuleViolation):
+            B2BOrderService.submit_order(order_id=order.pk, actor=SuperuserFactory())
+
     def test_reject_from_submitted(self):
         order = B2BOrderFactory(seller=_wholesaler(), buyer=_retailer(), status=B2BOrder.StatusChoices.SUBMITTED)
         order = B2BOrderService.reject_order(order_id=order.pk, actor=SuperuserFactory())
@@ -123,3 +308,13 @@ class TestOrderLifecycle:
         order = B2BOrderFactory(seller=_wholesaler(), buyer=_retailer(), status=B2BOrder.StatusChoices.DRAFT)
         with pytest.raises(InvalidStateTransition):
             B2BOrderService.deliver_order(order_id=order.pk, actor=SuperuserFactory())
+
+    def test_transition_mask_matches_table(self):
+        for src in B2BOrder.StatusChoices.values:
+            order = B2BOrder(status=src)
+            for dst in B2BOrder.StatusChoices.values:
+                if dst in ORDER_TRANSITIONS[src]:
+                    _assert_transition(order, dst)
+                else:
+                    with pytest.raises(InvalidStateTransition):
+                        _assert_transition(order, dst)
@@ -4,18 +4,26 @@ Tests — B2B API endpoints.
 @file b2b/tests/test_views.py
 """
 
+import uuid
+
 import pytest
 from decimal import Decimal
 
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
 from django.urls import reverse
 
 from b2b.models import B2BOrder
 from tests.factories import (
     B2BOrderFactory,
+    B2BOrderItemFactory,
     NationalLotFactory,
     PharmacyCreditFactory,
     PharmacyFactory,
+    RoleFactory,
+    StockMovementFactory,
     SuperuserFactory,
+    UserRoleFactory,
 )
 
 
@@ -43,6 +51,39 @@ class TestB2BOrderAPI:
         assert resp.status_code == 200
         assert len(resp.data['results']) == 2
 
+    def test_list_filters_by_status(self, admin_client):
+        B2BOrderFactory(status=B2BOrder.StatusChoices.DRAFT)
+        submitted = B2BOrderFactory(status=B2BOrder.StatusChoices.SUBMITTED)
+        approved = B2BOrderFactory(status=B2BOrder.StatusChoices.APPROVED)
+        url = reverse('api-v1:b2b:order-list')
+        resp = admin_client.get(url, {'status': 'SUBMITTED'})
+        assert [row['id'] for row in resp.data['results']] == [str(submitted.pk)]
+        resp = admin_client.get(url, {'status__in': 'SUBMITTED,APPROVED'})
+        assert {row['id'] for row in resp.data['results']} == {str(submitted.pk), str(approved.pk)}
+
+    def test_search_by_order_id(self, admin_client):
+        order = B2BOrderFactory()
+        B2BOrderFactory()
+        url = reverse('api-v1:b2b:order-list')
+        resp = admin_client.get(url, {'search': str(order.pk)})
+        assert [row['id'] for row in resp.data['results']] == [str(order.pk)]
+        resp = admin_client.get(url, {'search': str(order.pk)[:8]})
+        assert [row['id'] for row in resp.data['results']] == [str(order.pk)]
+
+    def test_list_query_count_independent_of_page_size(self, admin_client):
+        url = reverse('api-v1:b2b:order-list')
+
+        def list_queries():
+            with CaptureQueriesContext(connection) as ctx:
+                assert admin_client.get(url).status_code == 200
+            return len(ctx.captured_queries)
+
+        B2BOrderItemFactory(order=B2BOrderFactory())
+        baseline = list_queries()
+        for order in B2BOrderFactory.create_batch(3):
+            B2BOrderItemFactory.create_batch(2, order=order)
+        assert list_queries() == baseline
+
     def test_create_order(self, admin_client):
         seller = _wholesaler()
         buyer = _retailer()
@@ -61,9 +102,72 @@ class TestB2BOrderAPI:
         assert len(resp.data['items']) == 1
         assert resp.data['items'][0]['quantity_ordered'] == 3
 
+    def test_retrieve_order_lists_live_items_only(self, admin_client):
+        order = B2BOrderFactory()
+        live = B2BOrderItemFactory(order=order, quantity_ordered=2, unit_price=Decimal('150'))
+        B2BOrderItemFactory(order=order, is_deleted=True)
+        url = reverse('api-v1:b2b:order-detail', kwargs={'pk': order.pk})
+        resp = admin_client.get(url)
+        assert resp.status_code == 200
+        assert [item['id'] for item in resp.data['items']] == [str(live.pk)]
+        assert resp.data['items'][0]['line_total'] == Decimal('300')
+
+    def test_create_order_normalises_lot_ids(self, admin_client):
+        lot = NationalLotFactory()
+        url = reverse('api-v1:b2b:order-list')
+        data = {
+            'seller_id': str(_wholesaler().pk),
+            'buyer_id': str(_retailer().pk),
+            'items': [
+                {'lot_id': lot.pk.hex.upper(), 'quantity_ordered': 1},
+                {'lot_id': str(lot.pk), 'quantity_ordered': 2},
+            ],
+        }
+        resp = admin_client.post(url, data, format='json')
+        assert resp.status_code == 201
+        assert resp.data['items_count'] == 2
+
+    def test_create_order_rejects_unknown_and_unusable_lots(self, admin_client):
+        lot = NationalLotFactory()
+        recalled = NationalLotFactory(status='RECALLED')
+        url = reverse('api-v1:b2b:order-list')
+        data = {
+            'seller_id': str(_wholesaler().pk),
+            'buyer_id': str(_retailer().pk),
+            'items': [
+                {'lot_id': str(lot.pk), 'quantity_ordered': 1},
+                {'lot_id': str(uuid.uuid4()), 'quantity_ordered': 1},
+                {'lot_id': str(recalled.pk), 'quantity_ordered': 1},
+            ],
+        }
+        resp = admin_client.post(url, data, format='json')
+        assert resp.status_code == 400
+        items_errors = resp.data['errors']['items']
+        assert items_errors[0] == {}
+        assert 'lot_id' in items_errors[1]
+        assert 'lot_id' in items_errors[2]
+
+    def test_create_order_item_field_errors(self, admin_client):
+        lot = NationalLotFactory()
+        url = reverse('api-v1:b2b:order-list')
+        data = {
+            'seller_id': str(_wholesaler().pk),
+            'buyer_id': str(_retailer().pk),
+            'items': [
+                {'lot_id': 'not-a-uuid', 'quantity_ordered': 0},
+                {'lot_id': str(lot.pk), 'quantity_ordered': '2', 'unit_price': '12.345'},
+                {'quantity_ordered': 'x'},
+            ],
+        }
+        resp = admin_client.post(url, data, format='json')
+        assert resp.status_code == 400
+        items_errors = resp.data['errors']['items']
+        assert set(items_errors[0]) == {'lot_id', 'quantity_ordered'}
+        assert set(items_errors[1]) == {'unit_price'}
+        assert set(items_errors[2]) == {'lot_id', 'quantity_ordered'}
+
     def test_submit_order(self, admin_client):
         order = B2BOrderFactory(seller=_wholesaler(), buyer=_retailer(), status=B2BOrder.StatusChoices.DRAFT)
-        from tests.factories import B2BOrderItemFactory
         B2BOrderItemFactory(order=order, quantity_ordered=1, unit_price=Decimal('1000'))
         order.total_amount = Decimal('1000')
         order.save()
@@ -71,3 +175,67 @@ class TestB2BOrderAPI:
         resp = admin_client.post(url, {}, format='json')
         assert resp.status_code == 200
         assert resp.data['status'] == 'SUBMITTED'
+
+    def test_cancel_order_returns_full_read_row(self, admin_client):
+        order = B2BOrderFactory(seller=_wholesaler(), buyer=_retailer(), status=B2BOrder.StatusChoices.DRAFT)
+        item = B2BOrderItemFactory(order=order)
+        url = reverse('api-v1:b2b:order-cancel', kwargs={'pk': order.pk})
+        resp = admin_client.post(url, {}, format='json')
+        assert resp.status_code == 200
+        assert resp.data['status'] == 'CANCELLED'
+        assert resp.data['buyer_name'] == order.buyer.name
+        assert [row['id'] for row in resp.data['items']] == [str(item.pk)]
+
+    def test_order_movements(self, admin_client):
+        order = B2BOrderFactory()
+        movement = StockMovementFactory(reference_type='B2BOrder', reference_id=order.pk)
+        StockMovementFactory()
+        url = reverse('api-v1:b2b:order-movements', kwargs={'pk': order.pk})
+        resp = admin_client.get(url)
+        assert resp.status_code == 200
+        assert len(resp.data['results']) == 1
+        row = resp.data['results'][0]
+        assert list(row) == ['id', 'movement_type', 'quantity', 'lot_id', 'entity_type', 'entity_id', 'created_at']
+        assert row['quantity'] == movement.quantity
+        assert row['lot_id'] == movement.lot_id
+
+    def test_order_movements_paginated(self, admin_client):
+        order = B2BOrderFactory()
+        StockMovementFactory.create_batch(3, reference_type='B2BOrder', reference_id=order.pk)
+        url = reverse('api-v1:b2b:order-movements', kwargs={'pk': order.pk})
+        resp = admin_client.get(url, {'page_size': 2})
+        assert resp.status_code == 200
+        assert 'count' not in resp.data
+        assert len(resp.data['results']) == 2
+        resp = admin_client.get(resp.data['next'])
+        assert len(resp.data['results']) == 1
+        assert resp.data['next'] is None
+
+    @pytest.mark.parametrize('ordering', ['total_amount', '-status', 'created_at', 'bogus'])
+    def test_order_movements_ignore_order_ordering(self, admin_client, ordering):
+        order = B2BOrderFactory()
+        movements = StockMovementFactory.create_batch(3, reference_type='B2BOrder', reference_id=order.pk)
+        url = reverse('api-v1:b2b:order-movements', kwargs={'pk': order.pk})
+        resp = admin_client.get(url, {'ordering': ordering})
+        assert resp.status_code == 200
+        expected = sorted(movements, key=lambda m: (m.created_at, m.pk), reverse=True)
+        assert [row['id'] for row in resp.data['results']] == [m.pk for m in expected]
+
+    def test_list_non_cursor_ordering_uses_page_numbers(self, admin_client):
+        orders = [B2BOrderFactory(total_amount=Decimal(amount)) for amount in ('30', '10', '20')]
+        url = reverse('api-v1:b2b:order-list')
+        resp = admin_client.get(url, {'ordering': 'total_amount'})
+        assert resp.status_code == 200
+        assert resp.data['count'] == 3
+        assert [row['id'] for row in resp.data['results']] == [str(orders[i].pk) for i in (1, 2, 0)]
+        resp = admin_client.get(url, {'ordering': 'created_at'})
+        assert 'count' not in resp.data
+        assert [row['id'] for row in resp.data['results']] == [str(order.pk) for order in orders]
+
+    def test_approve_requires_workflow_role(self, authenticated_client, user):
+        order = B2BOrderFactory(status=B2BOrder.StatusChoices.SUBMITTED)
+        url = reverse('api-v1:b2b:order-approve', kwargs={'pk': order.pk})
+        assert authenticated_client.post(url, {}, format='json').status_code == 403
+        UserRoleFactory(user=user, role=RoleFactory(name='INSPECTOR'))
+        user.clear_role_cache()
+        assert authenticated_client.post(url, {}, format='json').status_code != 403
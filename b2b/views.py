@@ -7,14 +7,18 @@ ship, deliver, cancel, reject). Movements list for an order.
 @file b2b/views.py
 """
 
+from django_filters.rest_framework import DjangoFilterBackend
 from rest_framework import status, viewsets
 from rest_framework.decorators import action
+from rest_framework.filters import OrderingFilter
 from rest_framework.permissions import IsAuthenticated
 from rest_framework.response import Response
 
+from core.pagination import FixedCursorPagination, StandardCursorPagination, StandardPagination, cursor_ordering
 from stock.models import StockMovement
 
-from .models import B2BOrder, B2BOrderItem
+from .filters import B2BOrderFilter, B2BOrderSearchFilter
+from .models import B2BOrder, B2BOrderItem, items_list_prefetch
 from .permissions import CanApproveOrRejectOrder, CanManageB2BOrder
 from .serializers import (
     B2BOrderApproveSerializer,
@@ -33,24 +37,44 @@ class B2BOrderViewSet(viewsets.ModelViewSet):
     """
 
     permission_classes = [IsAuthenticated, CanManageB2BOrder]
-    filterset_fields = ['status', 'seller', 'buyer', 'payment_status']
+    pagination_class = StandardCursorPagination
+    filterset_class = B2BOrderFilter
+    filter_backends = [DjangoFilterBackend, B2BOrderSearchFilter, OrderingFilter]
     search_fields = ['id']
     ordering_fields = ['created_at', 'total_amount', 'status']
     ordering = ['-created_at']
+    # Actions not listed here (create, workflow actions) use B2BOrderWriteSerializer.
+    SERIALIZER_BY_ACTION = {
+        'list': B2BOrderReadSerializer,
+        'retrieve': B2BOrderReadSerializer,
+        'update': B2BOrderUpdateSerializer,
+        'partial_update': B2BOrderUpdateSerializer,
+        'approve': B2BOrderApproveSerializer,
+    }
+
+    @property
+    def paginator(self):
+        # Cursor pages for the created_at orderings; page numbers when ?ordering=
+        # picks total_amount or status, which cannot key a cursor.
+        if not hasattr(self, '_paginator'):
+            ordering = OrderingFilter().get_ordering(self.request, self.get_queryset(), self)
+            self._paginator = (StandardCursorPagination if cursor_ordering(ordering) else StandardPagination)()
+        return self._paginator
 
     def get_queryset(self):
-        return B2BOrder.objects.filter(is_deleted=False).select_related(
+        # Only list/retrieve serialize straight from this queryset; update, destroy and
+        # movements just need the row, and workflow actions re-read through _read_queryset().
+        if self.action in ('list', 'retrieve'):
+            return self._read_queryset()
+        return B2BOrder.objects.all()
+
+    def _read_queryset(self):
+        return B2BOrder.objects.select_related(
             'seller', 'buyer',
-        ).prefetch_related('items__lot', 'items__lot__medicine')
+        ).prefetch_related(items_list_prefetch())
 
     def get_serializer_class(self):
-        if self.action in ('list', 'retrieve'):
-            return B2BOrderReadSerializer
-        if self.action in ('update', 'partial_update'):
-            return B2BOrderUpdateSerializer
-        if self.action == 'approve':
-            return B2BOrderApproveSerializer
-        return B2BOrderWriteSerializer
+        return self.SERIALIZER_BY_ACTION.get(self.action, B2BOrderWriteSerializer)
 
     def create(self, request, *args, **kwargs):
         serializer = self.get_serializer(data=request.data)
@@ -62,8 +86,7 @@ class B2BOrderViewSet(viewsets.ModelViewSet):
             actor=request.user,
             price_override_approved=serializer.validated_data.get('price_override_approved', False),
         )
-        read_ser = B2BOrderReadSerializer(order, context={'request': request})
-        return Response(read_ser.data, status=status.HTTP_201_CREATED)
+        return Response(self._serialize_order(order), status=status.HTTP_201_CREATED)
 
     def update(self, request, *args, **kwargs):
         order = self.get_object()
@@ -78,7 +101,7 @@ class B2BOrderViewSet(viewsets.ModelViewSet):
             price_override_approved=serializer.validated_data.get('price_override_approved'),
             actor=request.user,
         )
-        return Response(B2BOrderReadSerializer(updated, context={'request': request}).data)
+        return Response(self._serialize_order(self._reload(updated)))
 
     def perform_update(self, serializer):
         pass  # update() overridden above
@@ -86,6 +109,13 @@ class B2BOrderViewSet(viewsets.ModelViewSet):
     def perform_destroy(self, instance):
         instance.soft_delete(user=self.request.user)
 
+    def _serialize_order(self, order):
+        return B2BOrderReadSerializer(order, context=self.get_serializer_context()).data
+
+    def _reload(self, order):
+        """Full read row (parties + live items) for an order a service loaded only partially."""
+        return self._read_queryset().get(pk=order.pk)
+
     @action(
         detail=True,
         methods=['post'],
@@ -95,7 +125,7 @@ class B2BOrderViewSet(viewsets.ModelViewSet):
     def submit(self, request, pk=None):
         order = B2BOrderService.submit_order(order_id=pk, actor=request.user)
         return Response(
-            B2BOrderReadSerializer(order, context={'request': request}).data,
+            self._serialize_order(self._reload(order)),
             status=status.HTTP_200_OK,
         )
 
@@ -106,7 +136,7 @@ class B2BOrderViewSet(viewsets.ModelViewSet):
         permission_classes=[IsAuthenticated, CanApproveOrRejectOrder],
     )
     def approve(self, request, pk=None):
-        ser = B2BOrderApproveSerializer(data=request.data)
+        ser = self.get_serializer(data=request.data)
         ser.is_valid(raise_exception=True)
         credit_used = ser.validated_data.get('credit_used')
         order = B2BOrderService.approve_order(
@@ -115,7 +145,7 @@ class B2BOrderViewSet(viewsets.ModelViewSet):
             actor=request.user,
         )
         return Response(
-            B2BOrderReadSerializer(order, context={'request': request}).data,
+            self._serialize_order(order),
             status=status.HTTP_200_OK,
         )
 
@@ -128,7 +158,7 @@ class B2BOrderViewSet(viewsets.ModelViewSet):
     def ship(self, request, pk=None):
         order = B2BOrderService.ship_order(order_id=pk, actor=request.user)
         return Response(
-            B2BOrderReadSerializer(order, context={'request': request}).data,
+            self._serialize_order(self._reload(order)),
             status=status.HTTP_200_OK,
         )
 
@@ -141,7 +171,7 @@ class B2BOrderViewSet(viewsets.ModelViewSet):
     def deliver(self, request, pk=None):
         order = B2BOrderService.deliver_order(order_id=pk, actor=request.user)
         return Response(
-            B2BOrderReadSerializer(order, context={'request': request}).data,
+            self._serialize_order(order),
             status=status.HTTP_200_OK,
         )
 
@@ -154,7 +184,7 @@ class B2BOrderViewSet(viewsets.ModelViewSet):
     def cancel(self, request, pk=None):
         order = B2BOrderService.cancel_order(order_id=pk, actor=request.user)
         return Response(
-            B2BOrderReadSerializer(order, context={'request': request}).data,
+            self._serialize_order(self._reload(order)),
             status=status.HTTP_200_OK,
         )
 
@@ -167,7 +197,7 @@ class B2BOrderViewSet(viewsets.ModelViewSet):
     def reject(self, request, pk=None):
         order = B2BOrderService.reject_order(order_id=pk, actor=request.user)
         return Response(
-            B2BOrderReadSerializer(order, context={'request': request}).data,
+            self._serialize_order(self._reload(order)),
             status=status.HTTP_200_OK,
         )
 
@@ -181,6 +211,10 @@ class B2BOrderViewSet(viewsets.ModelViewSet):
         movements = StockMovement.objects.filter(
             reference_type='B2BOrder',
             reference_id=order.pk,
-        ).select_related('lot').order_by('-created_at')
-        ser = StockMovementMinimalSerializer(movements, many=True)
-        return Response(ser.data)
+        ).only(
+            'id', 'movement_type', 'quantity', 'lot_id', 'entity_type', 'entity_id', 'created_at',
+        )
+        # Own paginator: the view's ordering fields are B2BOrder columns.
+        paginator = FixedCursorPagination()
+        page = paginator.paginate_queryset(movements, request, view=self)
+        return paginator.get_paginated_response(StockMovementMinimalSerializer(page, many=True).data)
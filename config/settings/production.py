@@ -22,7 +22,8 @@ SECURE_BROWSER_XSS_FILTER = True
 X_FRAME_OPTIONS = 'DENY'
 
 DATABASES['default']['CONN_MAX_AGE'] = 600  # noqa: F405
-DATABASES['default']['CONN_HEALTH_CHECKS'] = True  # noqa: F405
+# Server-side cursors do not survive pgbouncer transaction pooling.
+DATABASES['default']['DISABLE_SERVER_SIDE_CURSORS'] = True  # noqa: F405
 
 REST_FRAMEWORK['DEFAULT_RENDERER_CLASSES'] = (  # noqa: F405
     'core.renderers.StandardJSONRenderer',
@@ -7,8 +7,10 @@ The DRF browsable API is available for route inspection in development.
 @file config/urls.py
 """
 
+from functools import lru_cache
+
 from django.contrib import admin
-from django.urls import include, path
+from django.urls import get_script_prefix, include, path
 from rest_framework.decorators import api_view, permission_classes
 from rest_framework.permissions import AllowAny
 from rest_framework.response import Response
@@ -19,32 +21,50 @@ admin.site.site_title = 'PharmaTrack-BI'
 admin.site.index_title = 'National Pharmaceutical Traceability Platform'
 
 
+# URL names behind the api_root directory; reversed once per script prefix.
+_API_DIRECTORY = {
+    'auth': {
+        'login': 'api-v1:auth:login',
+        'refresh': 'api-v1:auth:token-refresh',
+        'logout': 'api-v1:auth:logout',
+        'otp_request': 'api-v1:auth:otp-request',
+        'otp_verify': 'api-v1:auth:otp-verify',
+        'me': 'api-v1:auth:me',
+    },
+    'users': 'api-v1:users:user-list',
+    'geography': {
+        'levels': 'api-v1:geography:level-list',
+    },
+    'medicines': {
+        'list': 'api-v1:medicines:medicine-list',
+        'lots': 'api-v1:medicines:lots:lot-list',
+    },
+    'pharmacies': 'api-v1:pharmacies:pharmacy-list',
+    'b2b': {
+        'orders': 'api-v1:b2b:order-list',
+    },
+}
+
+
+def _map_directory(func, directory):
+    return {
+        key: _map_directory(func, value) if isinstance(value, dict) else func(value)
+        for key, value in directory.items()
+    }
+
+
+@lru_cache(maxsize=8)
+def _api_directory_paths(script_prefix, format):
+    # script_prefix only keys the cache; reverse() reads the active prefix itself.
+    return _map_directory(lambda name: reverse(name, format=format), _API_DIRECTORY)
+
+
 @api_view(['GET'])
 @permission_classes([AllowAny])
 def api_root(request, format=None):
     """PharmaTrack-BI API v1 — endpoint directory."""
-    return Response({
-        'auth': {
-            'login': reverse('api-v1:auth:login', request=request, format=format),
-            'refresh': reverse('api-v1:auth:token-refresh', request=request, format=format),
-            'logout': reverse('api-v1:auth:logout', request=request, format=format),
-            'otp_request': reverse('api-v1:auth:otp-request', request=request, format=format),
-            'otp_verify': reverse('api-v1:auth:otp-verify', request=request, format=format),
-            'me': reverse('api-v1:auth:me', request=request, format=format),
-        },
-        'users': reverse('api-v1:users:user-list', request=request, format=format),
-        'geography': {
-            'levels': reverse('api-v1:geography:level-list', request=request, format=format),
-        },
-        'medicines': {
-            'list': reverse('api-v1:medicines:medicine-list', request=request, format=format),
-            'lots': reverse('api-v1:medicines:lots:lot-list', request=request, format=format),
-        },
-        'pharmacies': reverse('api-v1:pharmacies:pharmacy-list', request=request, format=format),
-        'b2b': {
-            'orders': reverse('api-v1:b2b:order-list', request=request, format=format),
-        },
-    })
+    paths = _api_directory_paths(get_script_prefix(), format)
+    return Response(_map_directory(request.build_absolute_uri, paths))
 
 
 api_v1_patterns = [
@@ -1,16 +1,69 @@
 """
 Core — Django Admin Configuration
 
-Read-only admin for AuditLog.
+Read-only admin for AuditLog, and changelist helpers shared by app admins.
 
 @file core/admin.py
 """
 
 from django.contrib import admin
-from django.utils.html import format_html
+from django.contrib.admin.views.main import ChangeList
+from django.db import transaction
 from django.utils.translation import gettext_lazy as _
 
+from core.badges import ChoiceBadge
 from core.models import AuditLog
+from core.services import AuditService
+
+ACTION_BADGE = ChoiceBadge(
+    AuditLog.ActionChoices.choices,
+    {
+        'CREATE': '#22c55e',
+        'UPDATE': '#3b82f6',
+        'DELETE': '#ef4444',
+        'SOFT_DELETE': '#f97316',
+        'RESTORE': '#8b5cf6',
+        'STATUS_CHANGE': '#eab308',
+        'LOGIN': '#06b6d4',
+        'LOGOUT': '#6b7280',
+        'LOGIN_FAILED': '#dc2626',
+    },
+)
+
+
+class ColumnLimitedChangeList(ChangeList):
+    """
+    Changelist that loads only `model_admin.changelist_only_fields` and no
+    prefetches. Change/detail views keep the full get_queryset().
+    """
+
+    def get_queryset(self, request, exclude_parameters=None):
+        qs = super().get_queryset(request, exclude_parameters)
+        return qs.prefetch_related(None).only(*self.model_admin.changelist_only_fields)
+
+
+class AuditBatchAdminMixin:
+    """
+    Collects the audit entries written while saving, deleting or running a
+    bulk action into one AuditService.batch(), i.e. one bulk INSERT.
+    """
+
+    def save_model(self, request, obj, form, change):
+        with AuditService.batch():
+            super().save_model(request, obj, form, change)
+
+    def save_related(self, request, form, formsets, change):
+        with AuditService.batch():
+            super().save_related(request, form, formsets, change)
+
+    def delete_queryset(self, request, queryset):
+        with AuditService.batch():
+            super().delete_queryset(request, queryset)
+
+    def response_action(self, request, queryset):
+        # Actions are not atomic by default; the batch must commit with them.
+        with transaction.atomic(), AuditService.batch():
+            return super().response_action(request, queryset)
 
 
 @admin.register(AuditLog)
@@ -32,6 +85,11 @@ class AuditLogAdmin(admin.ModelAdmin):
     show_full_result_count = False
     list_per_page = 50
     ordering = ('-timestamp',)
+    # Skips the JSON payloads and user agent; User.__str__ needs the name and phone.
+    changelist_only_fields = (
+        'id', 'timestamp', 'action', 'model_name', 'object_id', 'ip_address',
+        'actor', 'actor__first_name', 'actor__last_name', 'actor__phone',
+    )
 
     fieldsets = (
         (_('Event'), {
@@ -46,6 +104,9 @@ class AuditLogAdmin(admin.ModelAdmin):
         }),
     )
 
+    def get_changelist(self, request, **kwargs):
+        return ColumnLimitedChangeList
+
     def has_add_permission(self, request):
         return False
 
@@ -57,20 +118,4 @@ class AuditLogAdmin(admin.ModelAdmin):
 
     @admin.display(description=_('Action'))
     def action_badge(self, obj):
-        colors = {
-            'CREATE': '#22c55e',
-            'UPDATE': '#3b82f6',
-            'DELETE': '#ef4444',
-            'SOFT_DELETE': '#f97316',
-            'RESTORE': '#8b5cf6',
-            'STATUS_CHANGE': '#eab308',
-            'LOGIN': '#06b6d4',
-            'LOGOUT': '#6b7280',
-            'LOGIN_FAILED': '#dc2626',
-        }
-        color = colors.get(obj.action, '#6b7280')
-        return format_html(
-            '<span style="background:{}; color:#fff; padding:2px 8px; '
-            'border-radius:4px; font-size:11px; font-weight:600;">{}</span>',
-            color, obj.get_action_display(),
-        )
+        return ACTION_BADGE(obj.action)
@@ -0,0 +1,49 @@
+"""
+Core — Admin Badges
+
+Pre-rendered coloured status badges for Django admin list columns.
+Badge HTML is built once per (choice, language) instead of running
+format_html on every row.
+
+@file core/badges.py
+"""
+
+from django.utils.html import escape, format_html
+from django.utils.safestring import mark_safe
+from django.utils.translation import get_language
+
+BADGE_TEMPLATE = (
+    '<span style="background:{color};color:#fff;padding:2px 8px;'
+    'border-radius:4px;font-size:11px;font-weight:600;">{label}</span>'
+)
+DEFAULT_BADGE_COLOR = '#6b7280'
+
+
+class ChoiceBadge:
+    """
+    Callable mapping a choice value to its badge HTML.
+
+    Labels are lazy translations, so rendered badges are cached per active
+    language. Values outside `choices` fall back to a grey badge of the raw value.
+    """
+
+    def __init__(self, choices, colors: dict[str, str], default_color: str = DEFAULT_BADGE_COLOR):
+        self.choices = tuple(choices)
+        self.colors = colors
+        self.default_color = default_color
+        self._cache: dict[str | None, dict[str, str]] = {}
+
+    def __call__(self, value) -> str:
+        language = get_language()
+        badges = self._cache.get(language)
+        if badges is None:
+            badges = self._cache[language] = {
+                code: mark_safe(BADGE_TEMPLATE.format(
+                    color=self.colors.get(code, self.default_color), label=escape(label),
+                ))
+                for code, label in self.choices
+            }
+        badge = badges.get(value)
+        if badge is None:
+            return format_html(BADGE_TEMPLATE, color=self.default_color, label=value)
+        return badge
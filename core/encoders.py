@@ -0,0 +1,39 @@
+"""
+Core — JSON Encoders
+
+Encoder for audit snapshot JSONFields. Snapshots hold raw field values
+(datetime, UUID, Decimal, …); they are encoded with orjson when it is
+installed and with the stdlib encoder otherwise.
+
+@file core/encoders.py
+"""
+
+import datetime
+
+from django.core.serializers.json import DjangoJSONEncoder
+from django.db.models.fields.files import FieldFile
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - orjson is in requirements.txt
+    orjson = None
+
+
+class AuditJSONEncoder(DjangoJSONEncoder):
+    """
+    Datetimes keep their full isoformat() (orjson's native output), Decimals
+    and UUIDs become strings, files their name.
+    """
+
+    def default(self, o):
+        if isinstance(o, (datetime.datetime, datetime.date, datetime.time)):
+            return o.isoformat()
+        if isinstance(o, FieldFile):
+            return str(o)
+        return super().default(o)
+
+    def encode(self, o):
+        if orjson is None:
+            return super().encode(o)
+        option = orjson.OPT_NON_STR_KEYS | (orjson.OPT_INDENT_2 if self.indent else 0)
+        return orjson.dumps(o, default=self.default, option=option).decode()
@@ -8,6 +8,7 @@ error envelopes.
 """
 
 import logging
+from functools import lru_cache
 
 from django.core.exceptions import PermissionDenied, ValidationError
 from django.http import Http404
@@ -65,49 +66,74 @@ class AuthenticationFailedError(APIException):
 # Standard exception handler
 # ---------------------------------------------------------------------------
 
+_STATUS_400 = status.HTTP_400_BAD_REQUEST
+_STATUS_403 = status.HTTP_403_FORBIDDEN
+_STATUS_500 = status.HTTP_500_INTERNAL_SERVER_ERROR
+
+
+def _error_response(errors, code, status_code) -> Response:
+    return Response({'success': False, 'errors': errors, 'code': code}, status=status_code)
+
+
+def _not_found(exc):
+    return ResourceNotFoundError()
+
+
+def _permission_denied(exc):
+    exc = APIException(detail='Permission denied.', code='PERMISSION_DENIED')
+    exc.status_code = _STATUS_403
+    return exc
+
+
+def _validation_error(exc):
+    errors = exc.message_dict if hasattr(exc, 'message_dict') else {'detail': exc.messages}
+    return _error_response(errors, 'VALIDATION_ERROR', _STATUS_400)
+
+
+# Django exceptions handled before DRF's exception_handler. A handler returns
+# either the APIException to render or a finished Response.
+_DJANGO_EXCEPTION_HANDLERS = {
+    Http404: _not_found,
+    PermissionDenied: _permission_denied,
+    ValidationError: _validation_error,
+}
+
+
+@lru_cache(maxsize=None)
+def _django_exception_handler(exc_type):
+    # Memoised per exception class: the MRO walk runs once per type, not per error.
+    for cls in exc_type.__mro__:
+        handler = _DJANGO_EXCEPTION_HANDLERS.get(cls)
+        if handler is not None:
+            return handler
+    return None
+
+
 def standard_exception_handler(exc, context):
     """
     Wraps every error response in the standard envelope:
       { "success": false, "errors": {...}, "code": "ERROR_CODE" }
     """
-    if isinstance(exc, Http404):
-        exc = ResourceNotFoundError()
-    elif isinstance(exc, PermissionDenied):
-        exc = APIException(detail='Permission denied.', code='PERMISSION_DENIED')
-        exc.status_code = status.HTTP_403_FORBIDDEN
-    elif isinstance(exc, ValidationError):
-        data = {
-            'success': False,
-            'errors': exc.message_dict if hasattr(exc, 'message_dict') else {'detail': exc.messages},
-            'code': 'VALIDATION_ERROR',
-        }
-        return Response(data, status=status.HTTP_400_BAD_REQUEST)
+    handler = _django_exception_handler(type(exc))
+    if handler is not None:
+        exc = handler(exc)
+        if isinstance(exc, Response):
+            return exc
 
     response = exception_handler(exc, context)
-
-    if response is not None:
-        errors = {}
-        code = getattr(exc, 'default_code', 'ERROR')
-
-        if isinstance(response.data, dict):
-            errors = response.data
-            code = response.data.pop('code', code) if 'code' in response.data else code
-        elif isinstance(response.data, list):
-            errors = {'detail': response.data}
-        else:
-            errors = {'detail': [str(response.data)]}
-
-        response.data = {
-            'success': False,
-            'errors': errors,
-            'code': code,
-        }
-
     if response is None:
         logger.exception('Unhandled exception in view: %s', exc)
-        return Response(
-            {'success': False, 'errors': {'detail': ['Internal server error.']}, 'code': 'INTERNAL_ERROR'},
-            status=status.HTTP_500_INTERNAL_SERVER_ERROR,
+        return _error_response(
+            {'detail': ['Internal server error.']}, 'INTERNAL_ERROR', _STATUS_500,
         )
 
+    data = response.data
+    code = getattr(exc, 'default_code', 'ERROR')
+    if isinstance(data, dict):
+        if 'code' in data:
+            code = data['code']
+            data = {key: value for key, value in data.items() if key != 'code'}
+    else:
+        data = {'detail': data if isinstance(data, list) else [str(data)]}
+    response.data = {'success': False, 'errors': data, 'code': code}
     return response
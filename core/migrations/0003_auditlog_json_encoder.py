@@ -0,0 +1,24 @@
+# Generated by Django 5.2.10 on 2026-10-15 23:40
+
+import core.encoders
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('core', '0002_initial'),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name='auditlog',
+            name='new_values',
+            field=models.JSONField(blank=True, encoder=core.encoders.AuditJSONEncoder, null=True, verbose_name='new values'),
+        ),
+        migrations.AlterField(
+            model_name='auditlog',
+            name='old_values',
+            field=models.JSONField(blank=True, encoder=core.encoders.AuditJSONEncoder, null=True, verbose_name='old values'),
+        ),
+    ]
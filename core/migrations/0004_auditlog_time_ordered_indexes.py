@@ -0,0 +1,32 @@
+# Generated by Django 5.2.10 on 2026-10-15 23:41
+
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('core', '0003_auditlog_json_encoder'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.RemoveIndex(
+            model_name='auditlog',
+            name='core_auditl_model_n_3fb686_idx',
+        ),
+        migrations.AlterField(
+            model_name='auditlog',
+            name='model_name',
+            field=models.CharField(max_length=100, verbose_name='model'),
+        ),
+        migrations.AddIndex(
+            model_name='auditlog',
+            index=models.Index(fields=['model_name', 'object_id', '-timestamp'], name='auditlog_obj_time_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='auditlog',
+            index=models.Index(fields=['model_name', '-timestamp'], name='auditlog_model_time_idx'),
+        ),
+    ]
@@ -0,0 +1,30 @@
+# Generated by Django 5.2.10 on 2026-10-15 23:58
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('core', '0004_auditlog_time_ordered_indexes'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='UserAgent',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('value', models.CharField(max_length=512, unique=True, verbose_name='value')),
+            ],
+            options={
+                'verbose_name': 'user agent',
+                'verbose_name_plural': 'user agents',
+            },
+        ),
+        migrations.AddField(
+            model_name='auditlog',
+            name='user_agent_ref',
+            field=models.ForeignKey(blank=True, null=True, on_delete=django.db.models.deletion.SET_NULL, related_name='+', to='core.useragent', verbose_name='user agent'),
+        ),
+    ]
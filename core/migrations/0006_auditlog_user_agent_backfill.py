@@ -0,0 +1,31 @@
+# Generated by Django 5.2.10 on 2026-10-15 23:58
+
+from django.db import migrations
+
+MAX_LENGTH = 512
+
+
+def move_user_agents(apps, schema_editor):
+    AuditLog = apps.get_model('core', 'AuditLog')
+    UserAgent = apps.get_model('core', 'UserAgent')
+    values = (
+        AuditLog.objects.exclude(user_agent='')
+        .values_list('user_agent', flat=True).distinct().iterator()
+    )
+    for value in values:
+        agent, _ = UserAgent.objects.get_or_create(value=value[:MAX_LENGTH])
+        AuditLog.objects.filter(user_agent=value).update(user_agent_ref=agent)
+
+
+class Migration(migrations.Migration):
+    # Own migration (own transaction on PostgreSQL): the UPDATE fires the deferred
+    # FK trigger, and ALTER TABLE in the same transaction would fail with
+    # "pending trigger events".
+
+    dependencies = [
+        ('core', '0005_auditlog_user_agent_lookup'),
+    ]
+
+    operations = [
+        migrations.RunPython(move_user_agents, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,22 @@
+# Generated by Django 5.2.10 on 2026-10-15 23:58
+
+from django.db import migrations
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('core', '0006_auditlog_user_agent_backfill'),
+    ]
+
+    operations = [
+        migrations.RemoveField(
+            model_name='auditlog',
+            name='user_agent',
+        ),
+        migrations.RenameField(
+            model_name='auditlog',
+            old_name='user_agent_ref',
+            new_name='user_agent',
+        ),
+    ]
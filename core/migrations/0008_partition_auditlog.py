@@ -0,0 +1,63 @@
+# Generated by Django 5.2.10 on 2026-10-16 00:20
+
+from django.db import migrations
+
+from core.partitions import AUDIT_TABLE, DEFAULT_PARTITION, ensure_audit_partitions
+
+
+def partition_audit_log(apps, schema_editor):
+    """
+    Rebuild core_auditlog as a table range-partitioned by month on timestamp
+    (PostgreSQL only). The primary key becomes (id, timestamp) because a
+    partitioned table's unique constraints must include the partition key;
+    the ORM keeps addressing rows by id. Indexes and foreign keys are
+    recreated on the parent, i.e. as per-partition local indexes.
+    """
+    connection = schema_editor.connection
+    if connection.vendor != 'postgresql':
+        return
+
+    old_table = f'{AUDIT_TABLE}_unpartitioned'
+    with connection.cursor() as cursor:
+        cursor.execute(
+            'SELECT indexdef FROM pg_indexes '
+            'WHERE schemaname = current_schema() AND tablename = %s AND indexname <> %s',
+            [AUDIT_TABLE, f'{AUDIT_TABLE}_pkey'],
+        )
+        index_definitions = [row[0] for row in cursor.fetchall()]
+        cursor.execute(
+            'SELECT conname, pg_get_constraintdef(oid) FROM pg_constraint '
+            'WHERE conrelid = %s::regclass AND contype = %s',
+            [AUDIT_TABLE, 'f'],
+        )
+        foreign_keys = cursor.fetchall()
+        cursor.execute(f'SELECT min("timestamp") FROM {AUDIT_TABLE}')
+        oldest = cursor.fetchone()[0]
+
+        cursor.execute(f'ALTER TABLE {AUDIT_TABLE} RENAME TO {old_table}')
+        cursor.execute(
+            f'CREATE TABLE {AUDIT_TABLE} (LIKE {old_table} INCLUDING DEFAULTS) '
+            'PARTITION BY RANGE ("timestamp")'
+        )
+        cursor.execute(f'CREATE TABLE {DEFAULT_PARTITION} PARTITION OF {AUDIT_TABLE} DEFAULT')
+        ensure_audit_partitions(connection, start=oldest.date() if oldest else None)
+
+        cursor.execute(f'INSERT INTO {AUDIT_TABLE} SELECT * FROM {old_table}')
+        cursor.execute(f'DROP TABLE {old_table}')
+
+        cursor.execute(f'ALTER TABLE {AUDIT_TABLE} ADD CONSTRAINT {AUDIT_TABLE}_pkey PRIMARY KEY (id, "timestamp")')
+        for definition in index_definitions:
+            cursor.execute(definition)
+        for name, definition in foreign_keys:
+            cursor.execute(f'ALTER TABLE {AUDIT_TABLE} ADD CONSTRAINT {name} {definition}')
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('core', '0007_auditlog_user_agent_swap'),
+    ]
+
+    operations = [
+        migrations.RunPython(partition_audit_log, migrations.RunPython.noop, elidable=False),
+    ]
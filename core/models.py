@@ -11,10 +11,13 @@ write operation across the platform.
 import uuid
 
 from django.conf import settings
-from django.db import models
+from django.db import models, transaction
 from django.utils import timezone
 from django.utils.translation import gettext_lazy as _
 
+from core.constants import AUDIT_ACTION_RESTORE, AUDIT_ACTION_SOFT_DELETE
+from core.encoders import AuditJSONEncoder
+
 
 # ---------------------------------------------------------------------------
 # Abstract base models (mixins)
@@ -62,7 +65,9 @@ class SoftDeleteMixin(models.Model):
     instead is_deleted, deleted_at, deleted_by are set.
     """
 
-    is_deleted = models.BooleanField(_('deleted'), default=False, db_index=True)
+    # Not db_index'd: nearly every row is live, so subclasses add a partial
+    # index (condition is_deleted=False) on their default ordering instead.
+    is_deleted = models.BooleanField(_('deleted'), default=False)
     deleted_at = models.DateTimeField(_('deleted at'), null=True, blank=True)
     deleted_by = models.ForeignKey(
         settings.AUTH_USER_MODEL,
@@ -76,16 +81,65 @@ class SoftDeleteMixin(models.Model):
         abstract = True
 
     def soft_delete(self, user=None):
-        self.is_deleted = True
-        self.deleted_at = timezone.now()
-        self.deleted_by = user
-        self.save(update_fields=['is_deleted', 'deleted_at', 'deleted_by', 'updated_at'])
+        self._set_deleted(True, user)
 
     def restore(self, user=None):
-        self.is_deleted = False
-        self.deleted_at = None
-        self.deleted_by = None
-        self.save(update_fields=['is_deleted', 'deleted_at', 'deleted_by', 'updated_at'])
+        self._set_deleted(False, user)
+
+    def _set_deleted(self, deleted: bool, user) -> None:
+        # One UPDATE through the unfiltered manager (restore targets a deleted
+        # row); save() signals do not fire, so the change is audited here.
+        now = timezone.now()
+        values = {
+            'is_deleted': deleted,
+            'deleted_at': now if deleted else None,
+            'deleted_by': user if deleted else None,
+            'updated_at': now,
+        }
+        type(self)._base_manager.filter(pk=self.pk).update(**values)
+        for field, value in values.items():
+            setattr(self, field, value)
+        _audit_soft_delete(type(self), [self.pk], deleted, user)
+
+    @classmethod
+    def bulk_soft_delete(cls, queryset, user=None) -> int:
+        """Soft-delete every live row of queryset with one UPDATE; returns the row count."""
+        with transaction.atomic():
+            pks = list(queryset.filter(is_deleted=False).values_list('pk', flat=True))
+            now = timezone.now()
+            count = cls._base_manager.filter(pk__in=pks).update(
+                is_deleted=True, deleted_at=now, deleted_by=user, updated_at=now,
+            )
+            _audit_soft_delete(cls, pks, True, user)
+        return count
+
+
+def _audit_soft_delete(model_cls, pks, deleted: bool, user) -> None:
+    from core.services import AuditService  # core.services imports this module
+
+    with AuditService.batch():
+        for pk in pks:
+            AuditService.log(
+                actor=user,
+                action=AUDIT_ACTION_SOFT_DELETE if deleted else AUDIT_ACTION_RESTORE,
+                model_name=model_cls.__name__,
+                object_id=str(pk),
+                old_values={'is_deleted': not deleted},
+                new_values={'is_deleted': deleted},
+            )
+
+
+class LiveManager(models.Manager):
+    """
+    Manager restricted to rows that are not soft-deleted.
+
+    Attach as `objects` next to a plain `all_objects` manager and set
+    Meta.default_manager_name = 'all_objects', so admin, related managers and
+    uniqueness checks still see every row.
+    """
+
+    def get_queryset(self):
+        return super().get_queryset().filter(is_deleted=False)
 
 
 class BaseModel(TimestampMixin, AuditFieldsMixin):
@@ -116,6 +170,24 @@ class RegulatedModel(BaseModel, SoftDeleteMixin):
 # Audit Log — immutable record of every write operation
 # ---------------------------------------------------------------------------
 
+class UserAgent(models.Model):
+    """
+    Distinct User-Agent strings. Audit rows reference one of these instead
+    of repeating the same few hundred strings across millions of rows.
+    """
+
+    MAX_LENGTH = 512
+
+    value = models.CharField(_('value'), max_length=MAX_LENGTH, unique=True)
+
+    class Meta:
+        verbose_name = _('user agent')
+        verbose_name_plural = _('user agents')
+
+    def __str__(self):
+        return self.value
+
+
 class AuditLog(models.Model):
     """
     Immutable audit trail. One row per create / update / soft-delete
@@ -148,14 +220,20 @@ class AuditLog(models.Model):
         _('action'), max_length=20,
         choices=ActionChoices.choices, db_index=True,
     )
-    model_name = models.CharField(_('model'), max_length=100, db_index=True)
+    model_name = models.CharField(_('model'), max_length=100)
     object_id = models.CharField(_('object ID'), max_length=40, db_index=True)
 
-    old_values = models.JSONField(_('old values'), null=True, blank=True)
-    new_values = models.JSONField(_('new values'), null=True, blank=True)
+    old_values = models.JSONField(_('old values'), null=True, blank=True, encoder=AuditJSONEncoder)
+    new_values = models.JSONField(_('new values'), null=True, blank=True, encoder=AuditJSONEncoder)
 
     ip_address = models.GenericIPAddressField(_('IP address'), null=True, blank=True)
-    user_agent = models.TextField(_('user agent'), blank=True, default='')
+    user_agent = models.ForeignKey(
+        UserAgent,
+        null=True, blank=True,
+        on_delete=models.SET_NULL,
+        related_name='+',
+        verbose_name=_('user agent'),
+    )
 
     timestamp = models.DateTimeField(_('timestamp'), auto_now_add=True, db_index=True)
 
@@ -164,7 +242,9 @@ class AuditLog(models.Model):
         verbose_name_plural = _('audit logs')
         ordering = ['-timestamp']
         indexes = [
-            models.Index(fields=['model_name', 'object_id']),
+            # Object history and per-model feeds, newest first, without a sort step.
+            models.Index(fields=['model_name', 'object_id', '-timestamp'], name='auditlog_obj_time_idx'),
+            models.Index(fields=['model_name', '-timestamp'], name='auditlog_model_time_idx'),
             models.Index(fields=['actor', 'timestamp']),
             models.Index(fields=['action', 'timestamp']),
         ]
@@ -1,12 +1,13 @@
 """
 Core — Pagination
 
-Standard paginator with configurable page_size and hard max cap.
+Standard paginator with configurable page_size and hard max cap, and a
+keyset (cursor) variant for large, append-mostly tables.
 
 @file core/pagination.py
 """
 
-from rest_framework.pagination import PageNumberPagination
+from rest_framework.pagination import CursorPagination, PageNumberPagination
 
 from core.constants import DEFAULT_PAGE_SIZE, MAX_PAGE_SIZE
 
@@ -15,3 +16,39 @@ class StandardPagination(PageNumberPagination):
     page_size = DEFAULT_PAGE_SIZE
     page_size_query_param = 'page_size'
     max_page_size = MAX_PAGE_SIZE
+
+
+def cursor_ordering(ordering) -> tuple | None:
+    """
+    Keyset ordering for `ordering` when it leads with created_at: the same
+    direction with id as a unique tiebreaker. None for any other column,
+    which is neither unique nor immutable enough to serve as a cursor.
+    """
+    first = ordering[0] if ordering else ''
+    if first.lstrip('-') != 'created_at':
+        return None
+    sign = '-' if first.startswith('-') else ''
+    return (f'{sign}created_at', f'{sign}id')
+
+
+class StandardCursorPagination(CursorPagination):
+    """
+    Keyset pages on created_at, id: no COUNT(*) and no OFFSET scan on deep pages.
+    A ?ordering= on any other column falls back to the default key; views
+    that offer such orderings should switch to StandardPagination for them.
+    """
+
+    ordering = ('-created_at', '-id')
+    page_size = DEFAULT_PAGE_SIZE
+    page_size_query_param = 'page_size'
+    max_page_size = MAX_PAGE_SIZE
+
+    def get_ordering(self, request, queryset, view):
+        return cursor_ordering(super().get_ordering(request, queryset, view)) or self.ordering
+
+
+class FixedCursorPagination(StandardCursorPagination):
+    """Cursor pages in `ordering` regardless of ?ordering=, for actions listing another model than the view's."""
+
+    def get_ordering(self, request, queryset, view):
+        return self.ordering
@@ -0,0 +1,95 @@
+"""
+Core — Audit Log Partitions
+
+On PostgreSQL core_auditlog is range-partitioned by month on `timestamp`
+(see migration core.0008). New rows always land in the current month's
+partition, so indexes stay small and old months can be detached or
+archived without touching live data. Partitions are created ahead of time
+by the core.ensure_audit_partitions Celery task; a DEFAULT partition
+catches anything outside the created ranges, and rows it caught for a month
+are moved into that month's partition when it is created.
+
+@file core/partitions.py
+"""
+
+import datetime
+import logging
+
+from django.db import connection as default_connection
+from django.db import transaction
+from django.utils import timezone
+
+logger = logging.getLogger('pharmatrack')
+
+AUDIT_TABLE = 'core_auditlog'
+DEFAULT_PARTITION = f'{AUDIT_TABLE}_default'
+
+# Months after the current one that always have a partition.
+MONTHS_AHEAD = 3
+
+
+def add_months(month: datetime.date, count: int) -> datetime.date:
+    """First day of the month `count` months after `month`."""
+    years, month_index = divmod(month.month - 1 + count, 12)
+    return datetime.date(month.year + years, month_index + 1, 1)
+
+
+def monthly_partitions(first: datetime.date, last: datetime.date) -> list[tuple[str, datetime.date, datetime.date]]:
+    """(table name, from, to) for each month from `first`'s to `last`'s, inclusive."""
+    month = first.replace(day=1)
+    partitions = []
+    while month <= last:
+        upper = add_months(month, 1)
+        partitions.append((f'{AUDIT_TABLE}_{month:%Y%m}', month, upper))
+        month = upper
+    return partitions
+
+
+def ensure_audit_partitions(connection=None, start: datetime.date | None = None) -> int:
+    """
+    Create missing monthly partitions from `start` (default: this month) up to
+    MONTHS_AHEAD months ahead. Returns how many were created; no-op off PostgreSQL.
+    """
+    connection = connection or default_connection
+    if connection.vendor != 'postgresql':
+        return 0
+
+    this_month = timezone.now().date().replace(day=1)
+    created = 0
+    with connection.cursor() as cursor:
+        for name, lower, upper in monthly_partitions(start or this_month, add_months(this_month, MONTHS_AHEAD)):
+            cursor.execute('SELECT to_regclass(%s)', [name])
+            if cursor.fetchone()[0] is not None:
+                continue
+            _create_partition(connection, cursor, name, lower, upper)
+            logger.info('Created audit log partition %s', name)
+            created += 1
+    return created
+
+
+def _create_partition(connection, cursor, name: str, lower: datetime.date, upper: datetime.date) -> None:
+    """
+    Create one monthly partition. PostgreSQL refuses a new partition whose
+    range already has rows in the DEFAULT partition, so when there are any
+    the DEFAULT partition is detached, the month created, its rows moved
+    over and DEFAULT re-attached, all in one transaction (the detach holds
+    an exclusive lock on the audit table until commit).
+    """
+    bounds = [lower.isoformat(), upper.isoformat()]
+    with transaction.atomic(using=connection.alias):
+        cursor.execute(
+            f'SELECT EXISTS (SELECT 1 FROM {DEFAULT_PARTITION} WHERE "timestamp" >= %s AND "timestamp" < %s)',
+            bounds,
+        )
+        stranded = cursor.fetchone()[0]
+        if stranded:
+            cursor.execute(f'ALTER TABLE {AUDIT_TABLE} DETACH PARTITION {DEFAULT_PARTITION}')
+        cursor.execute(f'CREATE TABLE {name} PARTITION OF {AUDIT_TABLE} FOR VALUES FROM (%s) TO (%s)', bounds)
+        if stranded:
+            cursor.execute(
+                f'WITH moved AS (DELETE FROM {DEFAULT_PARTITION} WHERE "timestamp" >= %s AND "timestamp" < %s '
+                f'RETURNING *) INSERT INTO {name} SELECT * FROM moved',
+                bounds,
+            )
+            logger.info('Moved %d audit rows from %s to %s', cursor.rowcount, DEFAULT_PARTITION, name)
+            cursor.execute(f'ALTER TABLE {AUDIT_TABLE} ATTACH PARTITION {DEFAULT_PARTITION} DEFAULT')
@@ -7,35 +7,68 @@ Wraps all successful responses in the standard envelope:
 @file core/renderers.py
 """
 
+from decimal import Decimal
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - orjson is in requirements.txt
+    orjson = None
 from rest_framework.renderers import JSONRenderer
 
+# Datetimes go through DRF's encoder (millisecond precision, 'Z' suffix) so the
+# output matches the stdlib path byte for byte; str/dict/list subclasses stay native.
+_ORJSON_OPTIONS = (orjson.OPT_PASSTHROUGH_DATETIME | orjson.OPT_NON_STR_KEYS) if orjson else 0
+
+_MISSING = object()
+
 
 class StandardJSONRenderer(JSONRenderer):
     """Wraps successful API responses in a consistent envelope."""
 
+    def _make_default(self):
+        # One encoder per render call, shared by every value orjson hands back.
+        fallback = self.encoder_class().default
+
+        def default(obj):
+            # Decimal is by far the most common leftover (money fields with
+            # COERCE_DECIMAL_TO_STRING off); short-circuit it before DRF's isinstance chain.
+            if type(obj) is Decimal:
+                return float(obj)
+            return fallback(obj)
+
+        return default
+
+    def _dumps(self, data, accepted_media_type, renderer_context):
+        # Indented output and the non-compact/ASCII modes stay on DRF's stdlib encoder.
+        if (
+            orjson is None or data is None or not self.compact or self.ensure_ascii
+            or self.get_indent(accepted_media_type, renderer_context or {})
+        ):
+            return super().render(data, accepted_media_type, renderer_context)
+        ret = orjson.dumps(data, default=self._make_default(), option=_ORJSON_OPTIONS)
+        # Same escaping as JSONRenderer: U+2028/U+2029 are not valid inside JS strings.
+        return ret.replace(b'\xe2\x80\xa8', b'\\u2028').replace(b'\xe2\x80\xa9', b'\\u2029')
+
     def render(self, data, accepted_media_type=None, renderer_context=None):
         response = renderer_context.get('response') if renderer_context else None
 
         if response is not None and response.status_code >= 400:
-            return super().render(data, accepted_media_type, renderer_context)
+            return self._dumps(data, accepted_media_type, renderer_context)
 
-        if isinstance(data, dict) and 'success' in data:
-            return super().render(data, accepted_media_type, renderer_context)
+        if isinstance(data, dict):
+            if 'success' in data:
+                return self._dumps(data, accepted_media_type, renderer_context)
+            results = data.get('results', _MISSING)
+            if results is not _MISSING:
+                envelope = {
+                    'success': True,
+                    'data': results,
+                    'meta': {
+                        'count': data.get('count'),
+                        'next': data.get('next'),
+                        'previous': data.get('previous'),
+                    },
+                }
+                return self._dumps(envelope, accepted_media_type, renderer_context)
 
-        if isinstance(data, dict) and 'results' in data:
-            envelope = {
-                'success': True,
-                'data': data['results'],
-                'meta': {
-                    'count': data.get('count'),
-                    'next': data.get('next'),
-                    'previous': data.get('previous'),
-                },
-            }
-        else:
-            envelope = {
-                'success': True,
-                'data': data,
-            }
-
-        return super().render(envelope, accepted_media_type, renderer_context)
+        return self._dumps({'success': True, 'data': data}, accepted_media_type, renderer_context)
@@ -0,0 +1,32 @@
+"""
+Core — Serializer Mixins
+
+Shared building blocks for app serializers.
+
+@file core/serializers.py
+"""
+
+
+class EagerLoadingMixin:
+    """
+    Declares the relations a read serializer walks so views can load them up
+    front instead of issuing one query per row.
+
+    select_related_fields holds FK paths; prefetch_related_fields holds
+    lookups or Prefetch objects; only_fields, when set, restricts the loaded
+    columns (including those of selected relations) to what the fields read.
+    """
+
+    select_related_fields: list = []
+    prefetch_related_fields: list = []
+    only_fields: list = []
+
+    @classmethod
+    def setup_eager_loading(cls, queryset):
+        if cls.select_related_fields:
+            queryset = queryset.select_related(*cls.select_related_fields)
+        if cls.prefetch_related_fields:
+            queryset = queryset.prefetch_related(*cls.prefetch_related_fields)
+        if cls.only_fields:
+            queryset = queryset.only(*cls.only_fields)
+        return queryset
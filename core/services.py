@@ -2,20 +2,76 @@
 Core — Audit Service
 
 Provides methods for writing audit log entries from any app.
+Entries logged inside AuditService.batch() are written together with one
+bulk INSERT when the block exits (still inside the caller's transaction).
 
 @file core/services.py
 """
 
 import logging
-from decimal import Decimal
+import threading
+from collections.abc import Iterator
+from contextlib import contextmanager
+from functools import lru_cache, partial
+from itertools import chain
+from operator import attrgetter
 from typing import Any
 
-from django.forms.models import model_to_dict
+from django.db import transaction
 
-from core.models import AuditLog
+from core.constants import AUDIT_ACTION_UPDATE
+from core.models import AuditLog, UserAgent
 
 logger = logging.getLogger('pharmatrack')
 
+# Rows per INSERT when writing buffered entries.
+FLUSH_BATCH_SIZE = 500
+
+_local = threading.local()
+
+_MISSING = object()
+
+# User-Agent string -> UserAgent pk, filled only once the row is committed.
+_USER_AGENT_IDS: dict[str, int] = {}
+_USER_AGENT_CACHE_SIZE = 4096
+
+
+def _remember_user_agent(value: str, pk: int) -> None:
+    if len(_USER_AGENT_IDS) >= _USER_AGENT_CACHE_SIZE:
+        _USER_AGENT_IDS.clear()
+    _USER_AGENT_IDS[value] = pk
+
+
+def _user_agent_id(user_agent: str) -> int | None:
+    if not user_agent:
+        return None
+    value = user_agent[:UserAgent.MAX_LENGTH]
+    pk = _USER_AGENT_IDS.get(value)
+    if pk is None:
+        pk = UserAgent.objects.get_or_create(value=value)[0].pk
+        transaction.on_commit(partial(_remember_user_agent, value, pk))
+    return pk
+
+
+def _read_m2m(field, instance):
+    return [str(obj.pk) for obj in field.value_from_object(instance)]
+
+
+@lru_cache(maxsize=256)
+def _snapshot_plan(model_cls, fields):
+    """(name, reader) pairs for AuditService.snapshot, built once per model and field set."""
+    opts = model_cls._meta
+    plan = []
+    for field in chain(opts.concrete_fields, opts.many_to_many):
+        if not field.editable or (fields is not None and field.name not in fields):
+            continue
+        if field.many_to_many:
+            if fields is not None:
+                plan.append((field.name, partial(_read_m2m, field)))
+        else:
+            plan.append((field.name, attrgetter(field.attname)))
+    return tuple(plan)
+
 
 class AuditService:
     """Centralised audit logging for every write operation."""
@@ -31,8 +87,16 @@ class AuditService:
         new_values: dict[str, Any] | None = None,
         ip_address: str | None = None,
         user_agent: str = '',
-    ) -> AuditLog:
-        return AuditLog.objects.create(
+    ) -> AuditLog | None:
+        if action == AUDIT_ACTION_UPDATE and old_values is not None and new_values is not None:
+            # Keep only the fields that changed; a no-op update is not logged.
+            changed = [key for key, value in new_values.items() if old_values.get(key, _MISSING) != value]
+            if not changed:
+                return None
+            old_values = {key: old_values.get(key) for key in changed}
+            new_values = {key: new_values[key] for key in changed}
+
+        entry = AuditLog(
             actor=actor,
             action=action,
             model_name=model_name,
@@ -40,38 +104,53 @@ class AuditService:
             old_values=old_values,
             new_values=new_values,
             ip_address=ip_address,
-            user_agent=user_agent,
+            user_agent_id=_user_agent_id(user_agent),
         )
+        buffer = getattr(_local, 'buffer', None)
+        if buffer is not None:
+            buffer.append(entry)
+        else:
+            entry.save()
+        return entry
+
+    @staticmethod
+    @contextmanager
+    def batch() -> Iterator[list[AuditLog]]:
+        """
+        Buffer log() calls and write them with one bulk_create on exit.
+
+        Use inside transaction.atomic so entries commit or roll back with the
+        audited change. Nested batches join the outermost one; entries are
+        discarded if the block raises.
+        """
+        if getattr(_local, 'buffer', None) is not None:
+            yield _local.buffer
+            return
+        _local.buffer = buffer = []
+        try:
+            yield buffer
+        finally:
+            _local.buffer = None
+        if buffer:
+            AuditLog.objects.bulk_create(buffer, batch_size=FLUSH_BATCH_SIZE)
 
     @staticmethod
     def snapshot(instance, fields=None) -> dict[str, Any]:
         """
-        Serialise a model instance to a plain dict suitable for JSONB
-        storage. DateTimes are ISO-formatted; UUIDs stringified;
-        M2M / querysets reduced to lists of PKs.
+        Snapshot a model instance as a dict of its editable fields (as in
+        model_to_dict), foreign keys reduced to their PK. Values stay raw;
+        AuditLog's AuditJSONEncoder encodes them on save. Many-to-many
+        fields cost a query each, so they are only included (as PK
+        strings) when named in `fields`.
         """
-        data = model_to_dict(instance, fields=fields)
-        cleaned: dict[str, Any] = {}
-        for key, value in data.items():
-            if value is None:
-                cleaned[key] = None
-            elif isinstance(value, Decimal):
-                cleaned[key] = str(value)
-            elif hasattr(value, 'isoformat'):
-                cleaned[key] = value.isoformat()
-            elif hasattr(value, 'hex'):
-                cleaned[key] = str(value)
-            elif hasattr(value, 'all'):
-                cleaned[key] = [str(obj.pk) for obj in value.all()]
-            elif isinstance(value, (list, tuple)):
-                cleaned[key] = [str(v.pk) if hasattr(v, 'pk') else v for v in value]
-            else:
-                cleaned[key] = value
-        return cleaned
+        plan = _snapshot_plan(type(instance), frozenset(fields) if fields else None)
+        return {name: read(instance) for name, read in plan}
 
     @staticmethod
     def get_client_ip(request) -> str | None:
-        x_forwarded_for = request.META.get('HTTP_X_FORWARDED_FOR')
+        meta = request.META
+        x_forwarded_for = meta.get('HTTP_X_FORWARDED_FOR')
         if x_forwarded_for:
-            return x_forwarded_for.split(',')[0].strip()
-        return request.META.get('REMOTE_ADDR')
+            # First hop only; partition() avoids splitting the whole proxy chain.
+            return x_forwarded_for.partition(',')[0].strip()
+        return meta.get('REMOTE_ADDR')
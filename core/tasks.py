@@ -0,0 +1,26 @@
+"""
+Core — Celery Tasks
+
+Periodic maintenance for core infrastructure.
+
+@file core/tasks.py
+"""
+
+import logging
+
+from celery import shared_task
+
+logger = logging.getLogger('pharmatrack')
+
+
+@shared_task(name='core.ensure_audit_partitions')
+def ensure_audit_partitions_task():
+    """
+    Daily task: make sure the audit log has partitions for the coming months.
+    Idempotent; only missing partitions are created.
+    """
+    from .partitions import ensure_audit_partitions
+
+    created = ensure_audit_partitions()
+    logger.info('ensure_audit_partitions_task completed: %d partitions created.', created)
+    return {'created_count': created}
@@ -0,0 +1,34 @@
+"""
+Tests — ChoiceBadge pre-rendered admin badges.
+
+@file core/tests/test_badges.py
+"""
+
+from django.utils import translation
+
+from core.badges import ChoiceBadge
+from core.models import AuditLog
+
+BADGE = ChoiceBadge(AuditLog.ActionChoices.choices, {'CREATE': '#22c55e'})
+
+
+class TestChoiceBadge:
+    def test_renders_label_and_color(self):
+        html = BADGE('CREATE')
+        assert 'background:#22c55e' in html
+        assert '>Create<' in html
+
+    def test_reuses_rendered_badge(self):
+        assert BADGE('UPDATE') is BADGE('UPDATE')
+
+    def test_unknown_value_is_escaped(self):
+        html = BADGE('<b>')
+        assert '&lt;b&gt;' in html
+        assert 'background:#6b7280' in html
+
+    def test_cached_per_language(self):
+        with translation.override('en'):
+            english = BADGE('DELETE')
+        with translation.override('fr'):
+            french = BADGE('DELETE')
+        assert english is not french
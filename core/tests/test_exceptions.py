@@ -0,0 +1,56 @@
+"""
+Tests — standard_exception_handler error envelopes.
+
+@file core/tests/test_exceptions.py
+"""
+
+from django.core.exceptions import PermissionDenied, ValidationError
+from django.urls import Resolver404
+from rest_framework.exceptions import NotAuthenticated
+from rest_framework.exceptions import ValidationError as DRFValidationError
+
+from core.exceptions import InvalidStateTransition, ResourceNotFoundError, standard_exception_handler
+
+
+def _handle(exc):
+    return standard_exception_handler(exc, {})
+
+
+class TestStandardExceptionHandler:
+    def test_http404_subclass_maps_to_not_found(self):
+        resp = _handle(Resolver404())
+        assert resp.status_code == 404
+        assert resp.data['code'] == ResourceNotFoundError.default_code
+
+    def test_permission_denied(self):
+        resp = _handle(PermissionDenied())
+        assert resp.status_code == 403
+        assert resp.data['success'] is False
+
+    def test_django_validation_error(self):
+        resp = _handle(ValidationError({'name': ['Required.']}))
+        assert resp.status_code == 400
+        assert resp.data == {'success': False, 'errors': {'name': ['Required.']}, 'code': 'VALIDATION_ERROR'}
+
+    def test_api_exception_uses_default_code(self):
+        resp = _handle(InvalidStateTransition())
+        assert resp.status_code == 400
+        assert resp.data['code'] == InvalidStateTransition.default_code
+        assert 'detail' in resp.data['errors']
+
+    def test_drf_exception(self):
+        resp = _handle(NotAuthenticated())
+        assert resp.status_code == 401
+        assert resp.data['code'] == 'not_authenticated'
+
+    def test_unhandled_exception(self):
+        resp = _handle(RuntimeError('boom'))
+        assert resp.status_code == 500
+        assert resp.data['code'] == 'INTERNAL_ERROR'
+
+    def test_code_in_payload_is_lifted_without_mutating_detail(self):
+        exc = DRFValidationError({'field': ['Bad.'], 'code': 'CUSTOM'})
+        resp = _handle(exc)
+        assert resp.data['code'] == 'CUSTOM'
+        assert resp.data['errors'] == {'field': ['Bad.']}
+        assert 'code' in exc.detail
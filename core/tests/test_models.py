@@ -8,9 +8,10 @@ Tests for AuditLog and base model mixins.
 
 import pytest
 
-from core.models import AuditLog
+from core.models import AuditLog, UserAgent
+from medicines.models import NationalLot
 from core.services import AuditService
-from tests.factories import AuditLogFactory, UserFactory
+from tests.factories import AuditLogFactory, NationalLotFactory, UserFactory, UserRoleFactory
 
 
 @pytest.mark.django_db
@@ -28,6 +29,51 @@ class TestAuditLog:
         assert log.action == 'CREATE'
         assert log.model_name == 'TestModel'
 
+    def test_batch_writes_entries_on_exit(self):
+        user = UserFactory()
+        before = AuditLog.objects.count()
+        with AuditService.batch() as buffer:
+            for i in range(3):
+                AuditService.log(actor=user, action='CREATE', model_name='TestModel', object_id=str(i))
+            with AuditService.batch():
+                AuditService.log(actor=user, action='UPDATE', model_name='TestModel', object_id='0')
+            assert AuditLog.objects.count() == before
+            assert len(buffer) == 4
+        assert AuditLog.objects.count() == before + 4
+
+    def test_batch_discards_entries_on_error(self):
+        before = AuditLog.objects.count()
+        with pytest.raises(RuntimeError):
+            with AuditService.batch():
+                AuditService.log(actor=None, action='CREATE', model_name='TestModel', object_id='x')
+                raise RuntimeError
+        assert AuditLog.objects.count() == before
+        AuditService.log(actor=None, action='CREATE', model_name='TestModel', object_id='y')
+        assert AuditLog.objects.count() == before + 1
+
+    def test_update_logs_only_changed_fields(self):
+        old = {'status': 'ACTIVE', 'name': 'A'}
+        assert AuditService.log(
+            actor=None, action='UPDATE', model_name='TestModel', object_id='x',
+            old_values=old, new_values=dict(old),
+        ) is None
+        log = AuditService.log(
+            actor=None, action='UPDATE', model_name='TestModel', object_id='x',
+            old_values=old, new_values={**old, 'status': 'SUSPENDED'},
+        )
+        assert (log.old_values, log.new_values) == ({'status': 'ACTIVE'}, {'status': 'SUSPENDED'})
+        assert AuditLog.objects.filter(model_name='TestModel', object_id='x').count() == 1
+
+    def test_user_agents_are_stored_once(self):
+        for object_id in ('a', 'b'):
+            AuditService.log(
+                actor=None, action='LOGIN', model_name='User', object_id=object_id, user_agent='Mozilla/5.0',
+            )
+        AuditService.log(actor=None, action='LOGIN', model_name='User', object_id='c')
+        agents = set(AuditLog.objects.filter(model_name='User').values_list('user_agent__value', flat=True))
+        assert agents == {'Mozilla/5.0', None}
+        assert UserAgent.objects.filter(value='Mozilla/5.0').count() == 1
+
     def test_audit_log_immutable_via_factory(self):
         log = AuditLogFactory()
         assert log.pk is not None
@@ -37,6 +83,30 @@ class TestAuditLog:
         snapshot = AuditService.snapshot(user)
         assert isinstance(snapshot, dict)
         assert 'phone' in snapshot
+        assert snapshot['date_joined'] == user.date_joined
+
+    def test_snapshot_reduces_relations_to_pks(self, django_assert_num_queries):
+        role = UserRoleFactory()
+        with django_assert_num_queries(0):
+            snapshot = AuditService.snapshot(role)
+        assert snapshot['user'] == role.user_id
+        assert 'groups' not in AuditService.snapshot(role.user)
+        assert AuditService.snapshot(role.user, fields=['phone', 'groups']) == {
+            'phone': role.user.phone, 'groups': [],
+        }
+
+    def test_snapshot_values_are_encoded_on_save(self):
+        lot = NationalLotFactory()
+        log = AuditService.log(
+            actor=None, action='CREATE', model_name='NationalLot', object_id=str(lot.pk),
+            new_values=AuditService.snapshot(lot, fields=['medicine', 'expiry_date', 'created_by']),
+        )
+        log.refresh_from_db()
+        assert log.new_values == {
+            'medicine': str(lot.medicine_id),
+            'expiry_date': lot.expiry_date.isoformat(),
+            'created_by': None,
+        }
 
     def test_user_create_triggers_audit(self):
         """User creation via signal should produce an audit log."""
@@ -44,3 +114,22 @@ class TestAuditLog:
         UserFactory()
         after = AuditLog.objects.count()
         assert after > before
+
+
+@pytest.mark.django_db
+class TestSoftDelete:
+    def test_soft_delete_and_restore_are_audited(self):
+        lot = NationalLotFactory()
+        lot.soft_delete()
+        assert NationalLot.all_objects.get(pk=lot.pk).is_deleted is True
+        lot.restore()
+        assert NationalLot.objects.filter(pk=lot.pk).exists()
+        actions = AuditLog.objects.filter(object_id=str(lot.pk)).values_list('action', flat=True)
+        assert set(actions) >= {'SOFT_DELETE', 'RESTORE'}
+
+    def test_bulk_soft_delete(self, django_assert_max_num_queries):
+        lots = NationalLotFactory.create_batch(3)
+        with django_assert_max_num_queries(6):
+            count = NationalLot.bulk_soft_delete(NationalLot.objects.filter(pk__in=[lot.pk for lot in lots]))
+        assert count == 3
+        assert not NationalLot.objects.filter(pk__in=[lot.pk for lot in lots]).exists()
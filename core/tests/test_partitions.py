@@ -0,0 +1,53 @@
+"""
+Core — Audit Partition Tests
+
+@file core/tests/test_partitions.py
+"""
+
+import datetime
+
+import pytest
+from django.db import connection
+from django.utils import timezone
+
+from core.models import AuditLog
+from core.partitions import DEFAULT_PARTITION, MONTHS_AHEAD, add_months, ensure_audit_partitions, monthly_partitions
+
+
+def test_add_months_rolls_over_year():
+    assert add_months(datetime.date(2026, 11, 1), 3) == datetime.date(2027, 2, 1)
+
+
+def test_monthly_partitions_cover_inclusive_range():
+    partitions = monthly_partitions(datetime.date(2026, 11, 17), datetime.date(2027, 1, 1))
+    assert partitions == [
+        ('core_auditlog_202611', datetime.date(2026, 11, 1), datetime.date(2026, 12, 1)),
+        ('core_auditlog_202612', datetime.date(2026, 12, 1), datetime.date(2027, 1, 1)),
+        ('core_auditlog_202701', datetime.date(2027, 1, 1), datetime.date(2027, 2, 1)),
+    ]
+
+
+@pytest.mark.django_db
+@pytest.mark.skipif(connection.vendor == 'postgresql', reason='only partitions on PostgreSQL')
+def test_ensure_partitions_is_noop_off_postgres():
+    assert ensure_audit_partitions() == 0
+
+
+@pytest.mark.django_db(transaction=True)
+@pytest.mark.skipif(connection.vendor != 'postgresql', reason='only partitions on PostgreSQL')
+def test_ensure_partitions_moves_rows_caught_by_default():
+    month = add_months(timezone.now().date().replace(day=1), MONTHS_AHEAD)
+    [(name, lower, _upper)] = monthly_partitions(month, month)
+    with connection.cursor() as cursor:
+        cursor.execute(f'DROP TABLE IF EXISTS {name}')
+    entry = AuditLog.objects.create(action=AuditLog.ActionChoices.CREATE, model_name='Test', object_id='1')
+    stamp = datetime.datetime.combine(lower, datetime.time(12), tzinfo=datetime.timezone.utc)
+    AuditLog.objects.filter(pk=entry.pk).update(timestamp=stamp)
+
+    assert ensure_audit_partitions() == 1
+    with connection.cursor() as cursor:
+        cursor.execute(f'SELECT count(*) FROM {name}')
+        assert cursor.fetchone()[0] == 1
+        cursor.execute(f'SELECT count(*) FROM {DEFAULT_PARTITION}')
+        assert cursor.fetchone()[0] == 0
+    assert AuditLog.objects.filter(pk=entry.pk, timestamp=stamp).exists()
@@ -0,0 +1,57 @@
+"""
+Tests — StandardJSONRenderer envelopes and encoder parity.
+
+@file core/tests/test_renderers.py
+"""
+
+import uuid
+from datetime import date, datetime, timezone
+from decimal import Decimal
+
+from django.utils.translation import gettext_lazy as _
+from rest_framework.exceptions import ErrorDetail
+from rest_framework.renderers import JSONRenderer
+
+from core.renderers import StandardJSONRenderer
+
+
+PAYLOAD = {
+    'id': uuid.UUID('12345678-1234-5678-1234-567812345678'),
+    'total': Decimal('1234.50'),
+    'created_at': datetime(2026, 1, 2, 3, 4, 5, 678901, tzinfo=timezone.utc),
+    'day': date(2026, 1, 2),
+    'label': _('Pending'),
+    'text': 'line\u2028break é',
+    'errors': [ErrorDetail('Bad.', code='invalid')],
+    'nested': {1: None, 'flag': True},
+}
+
+
+class TestStandardJSONRenderer:
+    def test_wraps_plain_data(self):
+        assert StandardJSONRenderer().render({'a': 1}) == b'{"success":true,"data":{"a":1}}'
+
+    def test_wraps_paginated_data(self):
+        rendered = StandardJSONRenderer().render({'count': 1, 'next': None, 'previous': None, 'results': [1]})
+        assert rendered == b'{"success":true,"data":[1],"meta":{"count":1,"next":null,"previous":null}}'
+
+    def test_matches_drf_encoder_output(self):
+        envelope = {'success': True, 'data': PAYLOAD}
+        assert StandardJSONRenderer().render(envelope) == JSONRenderer().render(envelope)
+
+    def test_indented_output_uses_drf_encoder(self):
+        rendered = StandardJSONRenderer().render({'a': 1}, 'application/json; indent=2')
+        assert rendered == b'{\n  "success": true,\n  "data": {\n    "a": 1\n  }\n}'
+
+    def test_builds_one_encoder_per_render(self):
+        created = []
+
+        class CountingEncoder(StandardJSONRenderer.encoder_class):
+            def __init__(self, *args, **kwargs):
+                created.append(self)
+                super().__init__(*args, **kwargs)
+
+        renderer = StandardJSONRenderer()
+        renderer.encoder_class = CountingEncoder
+        renderer.render({'ids': [uuid.uuid4() for _ in range(5)], 'day': date(2026, 1, 2)})
+        assert len(created) == 1
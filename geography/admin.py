@@ -8,11 +8,19 @@ filter by level_type, and proper search.
 """
 
 from django.contrib import admin
-from django.utils.html import format_html
+from django.db.models import Count
 from django.utils.translation import gettext_lazy as _
 
+from core.badges import ChoiceBadge
+
 from .models import AdministrativeLevel
 
+LEVEL_BADGE = ChoiceBadge(
+    AdministrativeLevel.LevelType.choices,
+    {'PROVINCE': '#1d4ed8', 'COMMUNE': '#7c3aed', 'ZONE': '#0891b2', 'COLLINE': '#65a30d'},
+)
+LEVEL_LABELS = dict(AdministrativeLevel.LevelType.choices)
+
 
 @admin.register(AdministrativeLevel)
 class AdministrativeLevelAdmin(admin.ModelAdmin):
@@ -41,27 +49,19 @@ class AdministrativeLevelAdmin(admin.ModelAdmin):
         }),
     )
 
+    def get_queryset(self, request):
+        return super().get_queryset(request).annotate(_children_count=Count('children'))
+
     @admin.display(description=_('Level'))
     def level_type_badge(self, obj):
-        colors = {
-            'PROVINCE': '#1d4ed8',
-            'COMMUNE': '#7c3aed',
-            'ZONE': '#0891b2',
-            'COLLINE': '#65a30d',
-        }
-        color = colors.get(obj.level_type, '#6b7280')
-        return format_html(
-            '<span style="background:{}; color:#fff; padding:2px 8px; '
-            'border-radius:4px; font-size:11px; font-weight:600;">{}</span>',
-            color, obj.get_level_type_display(),
-        )
+        return LEVEL_BADGE(obj.level_type)
 
     @admin.display(description=_('Parent'))
     def parent_display(self, obj):
         if obj.parent:
-            return f'{obj.parent.name} ({obj.parent.get_level_type_display()})'
+            return f'{obj.parent.name} ({LEVEL_LABELS[obj.parent.level_type]})'
         return '—'
 
-    @admin.display(description=_('Children'))
+    @admin.display(description=_('Children'), ordering='_children_count')
     def children_count(self, obj):
-        return obj.children.count()
+        return obj._children_count
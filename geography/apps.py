@@ -9,3 +9,6 @@ class GeographyConfig(AppConfig):
     default_auto_field = 'django.db.models.BigAutoField'
     name = 'geography'
     verbose_name = 'Administrative Geography'
+
+    def ready(self):
+        import geography.signals  # noqa: F401
@@ -8,7 +8,9 @@ Usage::
 
     python manage.py seed_geography
 
-Idempotent: safe to re-run (uses get_or_create).
+Idempotent: safe to re-run (existing codes are skipped). Rows are written
+with one bulk_create per level. A top-level JSON array is parsed with
+ijson one province at a time, so the whole document is never held in memory.
 
 @file geography/management/commands/seed_geography.py
 """
@@ -18,13 +20,18 @@ import logging
 import urllib.request
 from collections import Counter
 
+import ijson
 from django.core.management.base import BaseCommand
 from django.db import transaction
 
 from geography.models import AdministrativeLevel
+from geography.services import GeographyService
 
 logger = logging.getLogger('pharmatrack')
 
+# Rows per INSERT statement.
+BATCH_SIZE = 1000
+
 JSON_URL = (
     'https://raw.githubusercontent.com/'
     'mosiflow/burundi-new-subdivision-json/main/burundi-map.json'
@@ -44,26 +51,45 @@ class Command(BaseCommand):
     def handle(self, *args, **options):
         self.stdout.write('Loading Burundi administrative hierarchy…')
 
+        counter = Counter()
+
         if options.get('file'):
-            with open(options['file'], 'r', encoding='utf-8') as f:
-                data = json.load(f)
+            with open(options['file'], 'rb') as f:
+                rows = self._process_data(self._iter_provinces(f), counter)
         else:
             self.stdout.write(f'Downloading from {JSON_URL}')
             with urllib.request.urlopen(JSON_URL) as resp:
-                data = json.loads(resp.read().decode('utf-8'))
-
-        counter = Counter()
+                rows = self._process_data(self._iter_provinces(resp), counter)
 
         with transaction.atomic():
-            self._process_data(data, counter)
+            self._bulk_insert(rows)
+            # bulk_create sends no post_save, so the cached tree is dropped here.
+            transaction.on_commit(GeographyService.invalidate_tree)
 
         self.stdout.write(self.style.SUCCESS(
             f'Done. Provinces: {counter["PROVINCE"]}, Communes: {counter["COMMUNE"]}, '
             f'Zones: {counter["ZONE"]}, Collines: {counter["COLLINE"]}'
         ))
 
-    def _process_data(self, data, counter):
+    def _iter_provinces(self, stream):
+        """
+        Yield province dicts from a binary JSON stream. A top-level array is
+        streamed item by item; object-shaped documents are small and loaded whole.
+        """
+        if stream.peek(1024).lstrip()[:1] == b'[':
+            yield from ijson.items(stream, 'item')
+            return
+
+        data = json.load(stream)
+        if isinstance(data, dict):
+            yield from data.get('provinces', data.get('data', [data]))
+        else:
+            self.stderr.write('Unexpected JSON structure.')
+
+    def _process_data(self, provinces, counter):
         """
+        Collect (code, name, parent_code) rows per level from province dicts.
+
         Expected JSON shape (from mosiflow repo):
 
         [
@@ -83,13 +109,9 @@ class Command(BaseCommand):
           }
         ]
         """
-        if isinstance(data, dict):
-            provinces = data.get('provinces', data.get('data', [data]))
-        elif isinstance(data, list):
-            provinces = data
-        else:
-            self.stderr.write('Unexpected JSON structure.')
-            return
+        LevelType = AdministrativeLevel.LevelType
+        # Rows per level as (code, name, parent_code), in hierarchy order.
+        rows = {level: [] for level in (LevelType.PROVINCE, LevelType.COMMUNE, LevelType.ZONE, LevelType.COLLINE)}
 
         for p_idx, province_data in enumerate(provinces):
             province_name = province_data.get('name', province_data.get('province', ''))
@@ -97,14 +119,7 @@ class Command(BaseCommand):
                 continue
 
             province_code = f'PRV-{p_idx + 1:02d}'
-            province, _ = AdministrativeLevel.objects.get_or_create(
-                code=province_code,
-                defaults={
-                    'name': province_name.strip(),
-                    'level_type': AdministrativeLevel.LevelType.PROVINCE,
-                    'parent': None,
-                },
-            )
+            rows[LevelType.PROVINCE].append((province_code, province_name.strip(), None))
             counter['PROVINCE'] += 1
             self.stdout.write(f'  Province: {province_name}')
 
@@ -121,14 +136,7 @@ class Command(BaseCommand):
                     continue
 
                 commune_code = f'{province_code}-COM-{c_idx + 1:03d}'
-                commune, _ = AdministrativeLevel.objects.get_or_create(
-                    code=commune_code,
-                    defaults={
-                        'name': commune_name.strip(),
-                        'level_type': AdministrativeLevel.LevelType.COMMUNE,
-                        'parent': province,
-                    },
-                )
+                rows[LevelType.COMMUNE].append((commune_code, commune_name.strip(), province_code))
                 counter['COMMUNE'] += 1
 
                 for z_idx, zone_data in enumerate(zones_data):
@@ -143,14 +151,7 @@ class Command(BaseCommand):
                         continue
 
                     zone_code = f'{commune_code}-ZON-{z_idx + 1:03d}'
-                    zone, _ = AdministrativeLevel.objects.get_or_create(
-                        code=zone_code,
-                        defaults={
-                            'name': zone_name.strip(),
-                            'level_type': AdministrativeLevel.LevelType.ZONE,
-                            'parent': commune,
-                        },
-                    )
+                    rows[LevelType.ZONE].append((zone_code, zone_name.strip(), commune_code))
                     counter['ZONE'] += 1
 
                     for col_idx, colline_data in enumerate(collines_data):
@@ -163,12 +164,35 @@ class Command(BaseCommand):
                             continue
 
                         colline_code = f'{zone_code}-COL-{col_idx + 1:04d}'
-                        AdministrativeLevel.objects.get_or_create(
-                            code=colline_code,
-                            defaults={
-                                'name': colline_name.strip(),
-                                'level_type': AdministrativeLevel.LevelType.COLLINE,
-                                'parent': zone,
-                            },
-                        )
+                        rows[LevelType.COLLINE].append((colline_code, colline_name.strip(), zone_code))
                         counter['COLLINE'] += 1
+
+        return rows
+
+    def _bulk_insert(self, rows):
+        """
+        Insert missing levels top-down, one bulk_create per level. Existing
+        codes are left untouched (same semantics as get_or_create).
+        """
+        parents = {}
+        for level_type, level_rows in rows.items():
+            existing = set(
+                AdministrativeLevel.objects.filter(level_type=level_type).values_list('code', flat=True)
+            )
+            new_levels = []
+            for code, name, parent_code in level_rows:
+                if code in existing:
+                    continue
+                parent_id, parent_path = parents[parent_code] if parent_code else (None, '')
+                level = AdministrativeLevel(code=code, name=name, level_type=level_type, parent_id=parent_id)
+                # bulk_create bypasses save(), so the materialized path is set here.
+                level.path = AdministrativeLevel.build_path(parent_path, level.pk)
+                new_levels.append(level)
+            AdministrativeLevel.objects.bulk_create(new_levels, batch_size=BATCH_SIZE, ignore_conflicts=True)
+            # Re-read rather than trust instance pks: ignore_conflicts may have skipped rows.
+            parents.update(
+                (code, (pk, path))
+                for code, pk, path in AdministrativeLevel.objects.filter(
+                    level_type=level_type,
+                ).values_list('code', 'id', 'path')
+            )
@@ -0,0 +1,39 @@
+# Generated by Django 5.2.10 on 2026-10-15 23:34
+
+from django.conf import settings
+from django.db import migrations, models
+
+LEVEL_ORDER = ['PROVINCE', 'COMMUNE', 'ZONE', 'COLLINE']
+
+
+def populate_paths(apps, schema_editor):
+    # Top-down so each parent's path is known before its children's.
+    AdministrativeLevel = apps.get_model('geography', 'AdministrativeLevel')
+    paths = {}
+    for level_type in LEVEL_ORDER:
+        levels = list(AdministrativeLevel.objects.filter(level_type=level_type).only('id', 'parent_id'))
+        for level in levels:
+            level.path = f'{paths.get(level.parent_id, "")}{level.id.hex}/'
+            paths[level.id] = level.path
+        AdministrativeLevel.objects.bulk_update(levels, ['path'], batch_size=1000)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('geography', '0002_initial'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='administrativelevel',
+            name='path',
+            field=models.CharField(blank=True, default='', editable=False, help_text='Materialized path of ancestor ids, province first.', max_length=200, verbose_name='path'),
+        ),
+        migrations.RunPython(populate_paths, migrations.RunPython.noop),
+        migrations.AddIndex(
+            model_name='administrativelevel',
+            index=models.Index(fields=['path'], name='geo_level_path_idx', opclasses=['varchar_pattern_ops']),
+        ),
+    ]
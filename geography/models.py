@@ -5,11 +5,16 @@ Self-referencing AdministrativeLevel model representing Burundi's
 post-2022 subdivision: Province → Commune → Zone → Colline/Quartier.
 
 Parent-child integrity is enforced via CheckConstraint at the DB level.
+Each row also stores a materialized path of its ancestor ids, so ancestor
+and descendant lookups are single queries.
 
 @file geography/models.py
 """
 
+import uuid
+
 from django.db import models
+from django.db.models.functions import Concat, Substr
 from django.utils.translation import gettext_lazy as _
 
 from core.models import BaseModel
@@ -23,6 +28,8 @@ class AdministrativeLevel(BaseModel):
       PROVINCE (18 total) → COMMUNE → ZONE → COLLINE
 
     Each level references its parent (except PROVINCE, whose parent is NULL).
+    `path` holds the hex ids from the province down to this row, each
+    followed by PATH_SEPARATOR, and is maintained by save().
     """
 
     class LevelType(models.TextChoices):
@@ -37,6 +44,8 @@ class AdministrativeLevel(BaseModel):
         'COLLINE': 'ZONE',
     }
 
+    PATH_SEPARATOR = '/'
+
     name = models.CharField(_('name'), max_length=150)
     code = models.CharField(_('code'), max_length=30, unique=True, db_index=True)
     level_type = models.CharField(
@@ -50,6 +59,10 @@ class AdministrativeLevel(BaseModel):
         related_name='children',
         verbose_name=_('parent'),
     )
+    path = models.CharField(
+        _('path'), max_length=200, blank=True, default='', editable=False,
+        help_text=_('Materialized path of ancestor ids, province first.'),
+    )
 
     class Meta:
         verbose_name = _('administrative level')
@@ -58,6 +71,7 @@ class AdministrativeLevel(BaseModel):
         indexes = [
             models.Index(fields=['level_type', 'parent']),
             models.Index(fields=['name']),
+            models.Index(fields=['path'], name='geo_level_path_idx', opclasses=['varchar_pattern_ops']),
         ]
         constraints = [
             models.CheckConstraint(
@@ -72,20 +86,54 @@ class AdministrativeLevel(BaseModel):
     def __str__(self):
         return f'{self.name} ({self.get_level_type_display()})'
 
+    @classmethod
+    def build_path(cls, parent_path: str, pk) -> str:
+        return f'{parent_path}{pk.hex}{cls.PATH_SEPARATOR}'
+
+    def save(self, *args, **kwargs):
+        old_path = self.path
+        self.path = self.build_path(self.parent.path if self.parent_id else '', self.pk)
+        update_fields = kwargs.get('update_fields')
+        if update_fields is not None and 'path' not in update_fields:
+            kwargs['update_fields'] = [*update_fields, 'path']
+        super().save(*args, **kwargs)
+
+        if old_path and old_path != self.path:
+            # Re-parented: rewrite every descendant path in one UPDATE.
+            type(self).objects.filter(path__startswith=old_path).exclude(pk=self.pk).update(
+                path=Concat(models.Value(self.path), Substr('path', len(old_path) + 1)),
+            )
+
+    @classmethod
+    def path_ids(cls, path: str) -> list[uuid.UUID]:
+        """Ids encoded in a materialized path, province first."""
+        return [uuid.UUID(part) for part in path.split(cls.PATH_SEPARATOR)[:-1]]
+
+    @property
+    def ancestor_ids(self) -> list[uuid.UUID]:
+        """Ids from the province down to the parent of this level."""
+        return self.path_ids(self.path)[:-1]
+
     @property
     def full_path(self) -> str:
         """Return the full hierarchy path, e.g. 'Province > Commune > Zone > Colline'."""
         parts = [self.name]
-        current = self.parent
-        while current:
-            parts.insert(0, current.name)
+        current = self
+        # Use parents already loaded via select_related, then fetch the rest at once.
+        while current.parent_id and type(self).parent.is_cached(current):
             current = current.parent
-        return ' > '.join(parts)
+            parts.append(current.name)
+        if current.parent_id and current.path:
+            ancestor_ids = current.ancestor_ids
+            names = type(self).objects.in_bulk(ancestor_ids)
+            parts.extend(names[pk].name for pk in reversed(ancestor_ids))
+        else:
+            while current.parent_id:
+                current = current.parent
+                parts.append(current.name)
+        return ' > '.join(reversed(parts))
 
     def get_descendants(self, include_self=False):
-        """Recursively collect all descendants."""
-        result = [self] if include_self else []
-        for child in self.children.all():
-            result.append(child)
-            result.extend(child.get_descendants())
-        return result
+        """All levels below this one, in one query on the materialized path."""
+        qs = type(self).objects.filter(path__startswith=self.path)
+        return qs if include_self else qs.exclude(pk=self.pk)
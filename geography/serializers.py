@@ -36,7 +36,9 @@ class AdministrativeLevelReadSerializer(serializers.ModelSerializer):
         read_only_fields = fields
 
     def get_children_count(self, obj):
-        return obj.children.count()
+        # Annotated by the viewset; un-annotated instances fall back to a COUNT.
+        count = getattr(obj, 'children_count', None)
+        return obj.children.count() if count is None else count
 
 
 class AdministrativeLevelWriteSerializer(serializers.ModelSerializer):
@@ -65,23 +67,3 @@ class AdministrativeLevelWriteSerializer(serializers.ModelSerializer):
             )
 
         return attrs
-
-
-class AdministrativeLevelTreeSerializer(serializers.ModelSerializer):
-    """Recursive tree representation for hierarchy display."""
-
-    children = serializers.SerializerMethodField()
-
-    class Meta:
-        model = AdministrativeLevel
-        fields = ['id', 'name', 'code', 'level_type', 'children']
-
-    def get_children(self, obj):
-        children = obj.children.all().order_by('name')
-        depth = self.context.get('depth', 2)
-        if depth <= 0:
-            return []
-        return AdministrativeLevelTreeSerializer(
-            children, many=True,
-            context={'depth': depth - 1},
-        ).data
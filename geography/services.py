@@ -6,8 +6,15 @@ Query helpers for the administrative hierarchy.
 @file geography/services.py
 """
 
+import time
+
+from django.core.cache import cache
+
 from .models import AdministrativeLevel
 
+TREE_VERSION_KEY = 'geography:tree:version'
+TREE_CACHE_TIMEOUT = 60 * 60
+
 
 class GeographyService:
     """Read-oriented service for administrative level queries."""
@@ -20,24 +27,77 @@ class GeographyService:
     def get_children(parent_id):
         return AdministrativeLevel.objects.filter(parent_id=parent_id).order_by('name')
 
+    @staticmethod
+    def get_tree(depth: int) -> list[dict]:
+        """
+        Provinces with `depth` levels nested below them, name-ordered at every
+        level. One query; nodes are plain dicts, no model instances.
+        """
+        level_types = list(AdministrativeLevel.LevelType)[:depth + 1]
+        rows = (
+            AdministrativeLevel.objects
+            .filter(level_type__in=level_types)
+            .order_by('name')
+            .values_list('id', 'parent_id', 'name', 'code', 'level_type')
+        )
+        nodes = {}
+        parents = []
+        for pk, parent_id, name, code, level_type in rows:
+            nodes[pk] = {'id': str(pk), 'name': name, 'code': code, 'level_type': level_type, 'children': []}
+            parents.append(parent_id)
+
+        # Dicts keep insertion order, so every children list stays name-ordered.
+        provinces = []
+        for node, parent_id in zip(nodes.values(), parents):
+            siblings = provinces if parent_id is None else nodes[parent_id]['children']
+            siblings.append(node)
+        return provinces
+
+    @staticmethod
+    def tree_version() -> int:
+        """
+        Current generation of the administrative levels, bumped on every write.
+        Seeded from the clock so a version evicted from the cache never comes
+        back as a value that older tree entries were stored under.
+        """
+        version = cache.get(TREE_VERSION_KEY)
+        if version is None:
+            cache.add(TREE_VERSION_KEY, time.time_ns(), timeout=None)
+            version = cache.get(TREE_VERSION_KEY)
+        return version
+
+    @staticmethod
+    def invalidate_tree() -> None:
+        try:
+            cache.incr(TREE_VERSION_KEY)
+        except ValueError:
+            pass  # no version yet, so nothing is cached under one
+
+    @classmethod
+    def get_cached_tree(cls, depth: int, version: int) -> list[dict]:
+        """get_tree(depth), cached until the next write to administrative levels."""
+        key = f'geography:tree:{version}:{depth}'
+        tree = cache.get(key)
+        if tree is None:
+            tree = cls.get_tree(depth)
+            cache.set(key, tree, TREE_CACHE_TIMEOUT)
+        return tree
+
     @staticmethod
     def get_hierarchy(level_id) -> list[dict]:
         """Return the full parent chain from root to the given level."""
-        try:
-            level = AdministrativeLevel.objects.select_related(
-                'parent__parent__parent',
-            ).get(pk=level_id)
-        except AdministrativeLevel.DoesNotExist:
+        path = AdministrativeLevel.objects.filter(pk=level_id).values_list('path', flat=True).first()
+        if not path:
             return []
 
-        chain = []
-        current = level
-        while current:
-            chain.insert(0, {
-                'id': str(current.pk),
-                'name': current.name,
-                'code': current.code,
-                'level_type': current.level_type,
-            })
-            current = current.parent
-        return chain
+        ids = AdministrativeLevel.path_ids(path)
+        levels = AdministrativeLevel.objects.only('id', 'name', 'code', 'level_type').in_bulk(ids)
+        return [
+            {
+                'id': str(pk),
+                'name': levels[pk].name,
+                'code': levels[pk].code,
+                'level_type': levels[pk].level_type,
+            }
+            for pk in ids
+        ]
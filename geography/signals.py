@@ -0,0 +1,21 @@
+"""
+Geography — Signals
+
+Drops the cached province tree whenever an administrative level changes.
+
+@file geography/signals.py
+"""
+
+from django.db import transaction
+from django.db.models.signals import post_delete, post_save
+from django.dispatch import receiver
+
+from geography.models import AdministrativeLevel
+from geography.services import GeographyService
+
+
+@receiver(post_save, sender=AdministrativeLevel)
+@receiver(post_delete, sender=AdministrativeLevel)
+def invalidate_tree_cache(sender, instance, **kwargs):
+    # After commit, so a concurrent tree request cannot re-cache the old rows.
+    transaction.on_commit(GeographyService.invalidate_tree)
@@ -0,0 +1,61 @@
+"""
+Geography — Management Command Tests
+
+Tests for seed_geography bulk loading.
+
+@file geography/tests/test_commands.py
+"""
+
+import io
+import json
+
+import pytest
+from django.core.management import call_command
+
+from geography.models import AdministrativeLevel
+
+DATA = [
+    {
+        'name': 'Bubanza',
+        'communes': [
+            {'name': 'Gihanga', 'zones': [{'name': 'Buringa', 'collines': ['Buringa', 'Kagwema']}]},
+            {'name': 'Mpanda', 'zones': ['Mpanda']},
+        ],
+    },
+    {'name': 'Gitega', 'communes': ['Gitega']},
+]
+
+
+@pytest.mark.django_db
+class TestSeedGeography:
+    def _seed(self, tmp_path, django_assert_max_num_queries):
+        path = tmp_path / 'burundi.json'
+        path.write_text(json.dumps(DATA), encoding='utf-8')
+        with django_assert_max_num_queries(16):
+            call_command('seed_geography', file=str(path), stdout=io.StringIO())
+
+    def test_builds_hierarchy(self, tmp_path, django_assert_max_num_queries):
+        self._seed(tmp_path, django_assert_max_num_queries)
+        colline = AdministrativeLevel.objects.get(code='PRV-01-COM-001-ZON-001-COL-0002')
+        assert colline.name == 'Kagwema'
+        assert colline.parent.code == 'PRV-01-COM-001-ZON-001'
+        assert colline.parent.parent.parent.code == 'PRV-01'
+        assert colline.full_path == 'Bubanza > Gihanga > Buringa > Kagwema'
+        counts = {
+            level: AdministrativeLevel.objects.filter(level_type=level).count()
+            for level in AdministrativeLevel.LevelType.values
+        }
+        assert counts == {'PROVINCE': 2, 'COMMUNE': 3, 'ZONE': 2, 'COLLINE': 2}
+
+    def test_rerun_is_idempotent(self, tmp_path, django_assert_max_num_queries):
+        self._seed(tmp_path, django_assert_max_num_queries)
+        AdministrativeLevel.objects.filter(code='PRV-02').update(name='Renamed')
+        self._seed(tmp_path, django_assert_max_num_queries)
+        assert AdministrativeLevel.objects.count() == 9
+        assert AdministrativeLevel.objects.get(code='PRV-02').name == 'Renamed'
+
+    def test_object_shaped_document(self, tmp_path):
+        path = tmp_path / 'burundi.json'
+        path.write_text(json.dumps({'provinces': DATA}), encoding='utf-8')
+        call_command('seed_geography', file=str(path), stdout=io.StringIO())
+        assert AdministrativeLevel.objects.count() == 9
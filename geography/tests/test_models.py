@@ -72,3 +72,26 @@ class TestAdministrativeLevel:
         assert c1 in descendants
         assert c2 in descendants
         assert z1 in descendants
+
+    def test_path_lists_ancestor_ids(self):
+        commune = CommuneFactory()
+        zone = ZoneFactory(parent=commune)
+        assert zone.ancestor_ids == [commune.parent_id, commune.pk]
+        assert zone.path == f'{commune.path}{zone.pk.hex}/'
+
+    def test_full_path_uses_one_query_for_unloaded_ancestors(self, django_assert_num_queries):
+        zone = ZoneFactory(name='Zone', parent=CommuneFactory(name='Commune', parent=ProvinceFactory(name='Prov')))
+        zone = AdministrativeLevel.objects.get(pk=zone.pk)
+        with django_assert_num_queries(1):
+            assert zone.full_path == 'Prov > Commune > Zone'
+
+    def test_reparenting_rewrites_descendant_paths(self):
+        old_province, new_province = ProvinceFactory(), ProvinceFactory()
+        commune = CommuneFactory(parent=old_province)
+        zone = ZoneFactory(parent=commune)
+        commune.parent = new_province
+        commune.save()
+        zone.refresh_from_db()
+        assert zone.ancestor_ids == [new_province.pk, commune.pk]
+        assert set(new_province.get_descendants()) == {commune, zone}
+        assert not old_province.get_descendants().exists()
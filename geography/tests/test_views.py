@@ -0,0 +1,107 @@
+"""
+Tests — Geography API endpoints (views).
+
+@file geography/tests/test_views.py
+"""
+
+import pytest
+from django.core.cache import cache
+from django.urls import reverse
+
+from geography.services import TREE_VERSION_KEY
+from tests.factories import CommuneFactory, ProvinceFactory, ZoneFactory
+
+
+pytestmark = pytest.mark.django_db
+
+
+@pytest.fixture(autouse=True)
+def fresh_tree_cache():
+    # Rolled-back test writes never invalidate; a new version orphans their entries.
+    cache.delete(TREE_VERSION_KEY)
+
+
+class TestAdministrativeLevelList:
+
+    def test_children_count_is_annotated(self, authenticated_client):
+        province = ProvinceFactory()
+        CommuneFactory.create_batch(2, parent=province)
+        url = reverse('api-v1:geography:level-list')
+        resp = authenticated_client.get(url, {'level_type': 'PROVINCE'})
+        assert resp.status_code == 200
+        assert resp.data['results'][0]['children_count'] == 2
+
+    def test_list_query_count_is_independent_of_rows(self, authenticated_client, django_assert_num_queries):
+        for _ in range(3):
+            ZoneFactory()
+        url = reverse('api-v1:geography:level-list')
+        # page + count; parents and children counts come from the same SELECT
+        with django_assert_num_queries(2):
+            resp = authenticated_client.get(url)
+        assert resp.data['results'][-1]['full_path'].count(' > ') == 2
+
+    def test_retrieve_leaf_has_zero_children(self, authenticated_client):
+        zone = ZoneFactory()
+        url = reverse('api-v1:geography:level-detail', args=[zone.pk])
+        resp = authenticated_client.get(url)
+        assert resp.status_code == 200
+        assert resp.data['children_count'] == 0
+
+
+class TestAdministrativeLevelTree:
+
+    def test_tree_is_name_ordered_and_fetched_at_once(self, authenticated_client, django_assert_num_queries):
+        province = ProvinceFactory()
+        commune_b = CommuneFactory(name='B', parent=province)
+        CommuneFactory(name='A', parent=province)
+        ZoneFactory.create_batch(3, parent=commune_b)
+        url = reverse('api-v1:geography:level-tree')
+
+        # every level fetched in one query
+        with django_assert_num_queries(1):
+            resp = authenticated_client.get(url)
+
+        communes = resp.data['data'][0]['children']
+        assert [c['name'] for c in communes] == ['A', 'B']
+        assert len(communes[1]['children']) == 3
+        assert communes[1]['children'][0]['children'] == []
+
+    def test_tree_depth_bounds_nesting(self, authenticated_client):
+        ZoneFactory()
+        url = reverse('api-v1:geography:level-tree')
+        assert authenticated_client.get(url, {'depth': 0}).data['data'][0]['children'] == []
+        communes = authenticated_client.get(url, {'depth': 1}).data['data'][0]['children']
+        assert [c['children'] for c in communes] == [[]]
+
+    def test_tree_is_cached_until_a_level_changes(
+        self, authenticated_client, django_assert_num_queries, django_capture_on_commit_callbacks,
+    ):
+        province = ProvinceFactory(name='Old')
+        url = reverse('api-v1:geography:level-tree')
+        authenticated_client.get(url)
+
+        with django_assert_num_queries(0):
+            resp = authenticated_client.get(url)
+        assert resp.data['data'][0]['name'] == 'Old'
+
+        not_modified = authenticated_client.get(url, HTTP_IF_NONE_MATCH=resp['ETag'])
+        assert not_modified.status_code == 304
+
+        with django_capture_on_commit_callbacks(execute=True):
+            province.name = 'New'
+            province.save()
+        assert authenticated_client.get(url).data['data'][0]['name'] == 'New'
+
+
+class TestAdministrativeLevelHierarchy:
+
+    def test_hierarchy_lists_chain_from_province(self, authenticated_client):
+        zone = ZoneFactory()
+        commune = zone.parent
+        url = reverse('api-v1:geography:level-hierarchy', args=[zone.pk])
+        resp = authenticated_client.get(url)
+        assert resp.status_code == 200
+        assert [row['id'] for row in resp.data['data']] == [
+            str(commune.parent_id), str(commune.pk), str(zone.pk),
+        ]
+        assert resp.data['data'][0]['level_type'] == 'PROVINCE'
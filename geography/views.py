@@ -7,6 +7,8 @@ for hierarchy rendering.
 @file geography/views.py
 """
 
+from django.db.models import Count
+from django.http import HttpResponseNotModified
 from rest_framework import viewsets
 from rest_framework.decorators import action
 from rest_framework.permissions import IsAuthenticated
@@ -16,11 +18,21 @@ from .models import AdministrativeLevel
 from .permissions import CanModifyGeography
 from .serializers import (
     AdministrativeLevelReadSerializer,
-    AdministrativeLevelTreeSerializer,
     AdministrativeLevelWriteSerializer,
 )
 from .services import GeographyService
 
+# Levels below a province (commune, zone, colline); deeper tree requests are empty.
+_MAX_TREE_DEPTH = len(AdministrativeLevel.LevelType) - 1
+
+
+# Joins every ancestor so full_path is built without further queries.
+_ANCESTORS = ['parent__parent__parent']
+
+
+def _with_children_count(qs):
+    return qs.annotate(children_count=Count('children'))
+
 
 class AdministrativeLevelViewSet(viewsets.ModelViewSet):
     """
@@ -30,14 +42,21 @@ class AdministrativeLevelViewSet(viewsets.ModelViewSet):
     Create / update / delete restricted to NATIONAL_ADMIN.
     """
 
+    queryset = AdministrativeLevel.objects.all()
     permission_classes = [IsAuthenticated, CanModifyGeography]
     filterset_fields = ['level_type', 'parent']
     search_fields = ['name', 'code']
     ordering_fields = ['name', 'level_type', 'created_at']
-    ordering = ['level_type', 'name']
+    # id breaks ties between same-named levels so OFFSET pages never overlap.
+    ordering = ['level_type', 'name', 'id']
 
     def get_queryset(self):
-        return AdministrativeLevel.objects.select_related('parent')
+        # Reads join the ancestor chain (full_path) and count children in SQL;
+        # writes only touch the row itself.
+        qs = super().get_queryset()
+        if self.action in ('list', 'retrieve'):
+            return _with_children_count(qs.select_related(*_ANCESTORS))
+        return qs
 
     def get_serializer_class(self):
         if self.action in ('list', 'retrieve'):
@@ -46,13 +65,13 @@ class AdministrativeLevelViewSet(viewsets.ModelViewSet):
 
     @action(detail=False, methods=['get'], url_path='provinces')
     def provinces(self, request):
-        qs = GeographyService.get_provinces()
+        qs = _with_children_count(GeographyService.get_provinces())
         serializer = AdministrativeLevelReadSerializer(qs, many=True)
         return Response({'success': True, 'data': serializer.data})
 
     @action(detail=True, methods=['get'], url_path='children')
     def children(self, request, pk=None):
-        qs = GeographyService.get_children(pk)
+        qs = _with_children_count(GeographyService.get_children(pk).select_related(*_ANCESTORS))
         serializer = AdministrativeLevelReadSerializer(qs, many=True)
         return Response({'success': True, 'data': serializer.data})
 
@@ -64,11 +83,10 @@ class AdministrativeLevelViewSet(viewsets.ModelViewSet):
     @action(detail=False, methods=['get'], url_path='tree')
     def tree(self, request):
         """Return the full province tree (depth limited to 2 by default)."""
-        depth = int(request.query_params.get('depth', 2))
-        provinces = AdministrativeLevel.objects.filter(
-            level_type='PROVINCE',
-        ).prefetch_related('children__children').order_by('name')
-        serializer = AdministrativeLevelTreeSerializer(
-            provinces, many=True, context={'depth': depth},
-        )
-        return Response({'success': True, 'data': serializer.data})
+        depth = max(0, min(int(request.query_params.get('depth', 2)), _MAX_TREE_DEPTH))
+        version = GeographyService.tree_version()
+        etag = f'"tree-{version}-{depth}"'
+        if etag in request.headers.get('If-None-Match', ''):
+            return HttpResponseNotModified(headers={'ETag': etag})
+        tree = GeographyService.get_cached_tree(depth, version)
+        return Response({'success': True, 'data': tree}, headers={'ETag': etag})
@@ -7,12 +7,29 @@ coding, batch recall action, and comprehensive filters.
 @file medicines/admin.py
 """
 
+from bisect import bisect_right
+
 from django.contrib import admin
 from django.utils import timezone
-from django.utils.html import format_html
+from django.utils.safestring import mark_safe
 from django.utils.translation import gettext_lazy as _
 
-from .models import NationalLot, NationalMedicine
+from core.admin import AuditBatchAdminMixin
+from core.badges import BADGE_TEMPLATE, ChoiceBadge
+from core.constants import AUDIT_ACTION_STATUS_CHANGE
+from core.services import AuditService
+
+from .models import ACTIVE_LOTS_COUNT_EXPRESSION, NationalLot, NationalMedicine
+
+MEDICINE_STATUS_BADGE = ChoiceBadge(
+    NationalMedicine.StatusChoices.choices,
+    {'AUTHORIZED': '#22c55e', 'BLOCKED': '#ef4444'},
+)
+LOT_STATUS_BADGE = ChoiceBadge(
+    NationalLot.StatusChoices.choices,
+    {'ACTIVE': '#22c55e', 'BLOCKED': '#f97316', 'EXPIRED': '#dc2626', 'RECALLED': '#7c3aed'},
+)
+CONTROLLED_BADGE = mark_safe(BADGE_TEMPLATE.format(color='#dc2626', label='CTRL'))
 
 
 # ---------------------------------------------------------------------------
@@ -42,7 +59,7 @@ class NationalLotInline(admin.TabularInline):
 # ---------------------------------------------------------------------------
 
 @admin.register(NationalMedicine)
-class NationalMedicineAdmin(admin.ModelAdmin):
+class NationalMedicineAdmin(AuditBatchAdminMixin, admin.ModelAdmin):
     list_display = (
         'inn', 'brand_name', 'atc_code', 'dosage_form', 'strength',
         'formatted_price', 'controlled_badge', 'status_badge',
@@ -88,7 +105,7 @@ class NationalMedicineAdmin(admin.ModelAdmin):
         qs = super().get_queryset(request)
         if not request.GET.get('is_deleted__exact'):
             qs = qs.filter(is_deleted=False)
-        return qs.prefetch_related('lots')
+        return qs.annotate(active_lots_count=ACTIVE_LOTS_COUNT_EXPRESSION)
 
     @admin.display(description=_('Price (BIF)'), ordering='authorized_price')
     def formatted_price(self, obj):
@@ -96,64 +113,61 @@ class NationalMedicineAdmin(admin.ModelAdmin):
 
     @admin.display(description=_('Controlled'))
     def controlled_badge(self, obj):
-        if obj.is_controlled:
-            return format_html(
-                '<span style="background:#dc2626;color:#fff;padding:2px 8px;'
-                'border-radius:4px;font-size:11px;font-weight:600;">CTRL</span>',
-            )
-        return '—'
+        return CONTROLLED_BADGE if obj.is_controlled else '—'
 
     @admin.display(description=_('Status'))
     def status_badge(self, obj):
-        colors = {'AUTHORIZED': '#22c55e', 'BLOCKED': '#ef4444'}
-        color = colors.get(obj.status, '#6b7280')
-        return format_html(
-            '<span style="background:{};color:#fff;padding:2px 8px;'
-            'border-radius:4px;font-size:11px;font-weight:600;">{}</span>',
-            color, obj.get_status_display(),
-        )
+        return MEDICINE_STATUS_BADGE(obj.status)
 
-    @admin.display(description=_('Active lots'))
+    @admin.display(description=_('Active lots'), ordering='active_lots_count')
     def lots_count(self, obj):
-        return obj.lots.filter(status='ACTIVE', is_deleted=False).count()
+        return obj.active_lots_count
 
 
 # ---------------------------------------------------------------------------
 # NationalLot Admin
 # ---------------------------------------------------------------------------
 
+# Lower bounds (days to expiry) of the 30 / 90 / 180 / beyond buckets; anything
+# below the first is expired. bisect_right(days) indexes _EXPIRY_COLORS.
+_EXPIRY_BOUNDS = (0, 31, 91, 181)
+_EXPIRY_COLORS = ('#dc2626', '#ef4444', '#f97316', '#eab308', '#22c55e')
+
+
 def _render_expiry_badge(obj):
     """Shared helper for expiry color coding."""
     days = obj.days_to_expiry
     if days is None:
         return '—'
-    if days < 0:
-        color, label = '#dc2626', f'EXPIRED ({abs(days)}d ago)'
-    elif days <= 30:
-        color, label = '#ef4444', f'{days}d left'
-    elif days <= 90:
-        color, label = '#f97316', f'{days}d left'
-    elif days <= 180:
-        color, label = '#eab308', f'{days}d left'
-    else:
-        color, label = '#22c55e', f'{days}d left'
-    return format_html(
-        '<span style="background:{};color:#fff;padding:2px 8px;'
-        'border-radius:4px;font-size:11px;font-weight:600;">{}</span>',
-        color, label,
-    )
+    color = _EXPIRY_COLORS[bisect_right(_EXPIRY_BOUNDS, days)]
+    label = f'EXPIRED ({-days}d ago)' if days < 0 else f'{days}d left'
+    # Colour and label are built from constants and an int: nothing to escape.
+    return mark_safe(BADGE_TEMPLATE.format(color=color, label=label))
 
 
 @admin.action(description=_('Mark selected lots as RECALLED'))
 def mark_recalled(modeladmin, request, queryset):
-    updated = queryset.filter(
-        status__in=['ACTIVE', 'BLOCKED'],
-    ).update(status=NationalLot.StatusChoices.RECALLED)
+    # Runs inside AuditBatchAdminMixin's transaction and audit batch. all_objects:
+    # the selection may include soft-deleted lots (?is_deleted__exact=1), and every
+    # selected lot is audited, so every one of them must be updated.
+    lots = list(queryset.filter(status__in=['ACTIVE', 'BLOCKED']).values_list('pk', 'status'))
+    updated = NationalLot.all_objects.filter(pk__in=[pk for pk, _status in lots]).update(
+        status=NationalLot.StatusChoices.RECALLED,
+    )
+    for pk, old_status in lots:
+        AuditService.log(
+            actor=request.user,
+            action=AUDIT_ACTION_STATUS_CHANGE,
+            model_name='NationalLot',
+            object_id=str(pk),
+            old_values={'status': old_status},
+            new_values={'status': NationalLot.StatusChoices.RECALLED},
+        )
     modeladmin.message_user(request, f'{updated} lot(s) marked as recalled.')
 
 
 @admin.register(NationalLot)
-class NationalLotAdmin(admin.ModelAdmin):
+class NationalLotAdmin(AuditBatchAdminMixin, admin.ModelAdmin):
     list_display = (
         'batch_number', 'medicine', 'manufacturing_date',
         'expiry_date', 'expiry_badge', 'quantity_imported',
@@ -222,13 +236,4 @@ class NationalLotAdmin(admin.ModelAdmin):
 
     @admin.display(description=_('Status'))
     def status_badge(self, obj):
-        colors = {
-            'ACTIVE': '#22c55e', 'BLOCKED': '#f97316',
-            'EXPIRED': '#dc2626', 'RECALLED': '#7c3aed',
-        }
-        color = colors.get(obj.status, '#6b7280')
-        return format_html(
-            '<span style="background:{};color:#fff;padding:2px 8px;'
-            'border-radius:4px;font-size:11px;font-weight:600;">{}</span>',
-            color, obj.get_status_display(),
-        )
+        return LOT_STATUS_BADGE(obj.status)
@@ -0,0 +1,24 @@
+# Generated by Django 5.2.10 on 2026-10-15 23:05
+
+import django.db.models.manager
+from django.db import migrations
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('medicines', '0001_initial'),
+    ]
+
+    operations = [
+        migrations.AlterModelOptions(
+            name='nationallot',
+            options={'default_manager_name': 'all_objects', 'ordering': ['-expiry_date'], 'verbose_name': 'national lot', 'verbose_name_plural': 'national lots'},
+        ),
+        migrations.AlterModelManagers(
+            name='nationallot',
+            managers=[
+                ('all_objects', django.db.models.manager.Manager()),
+            ],
+        ),
+    ]
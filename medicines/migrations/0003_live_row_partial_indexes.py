@@ -0,0 +1,33 @@
+# Generated by Django 5.2.10 on 2026-10-15 23:42
+
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('medicines', '0002_live_default_managers'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name='nationallot',
+            name='is_deleted',
+            field=models.BooleanField(default=False, verbose_name='deleted'),
+        ),
+        migrations.AlterField(
+            model_name='nationalmedicine',
+            name='is_deleted',
+            field=models.BooleanField(default=False, verbose_name='deleted'),
+        ),
+        migrations.AddIndex(
+            model_name='nationallot',
+            index=models.Index(condition=models.Q(('is_deleted', False)), fields=['-expiry_date'], name='lot_live_expiry_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='nationalmedicine',
+            index=models.Index(condition=models.Q(('is_deleted', False)), fields=['inn', 'strength'], name='medicine_live_inn_idx'),
+        ),
+    ]
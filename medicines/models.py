@@ -8,15 +8,37 @@ in Burundi, plus per-import lot tracking with expiry and recall lifecycle.
 """
 
 import re
+import time
+from datetime import date, datetime, timezone
+from functools import lru_cache
 
 from django.core.exceptions import ValidationError
 from django.db import models
-from django.utils import timezone
 from django.utils.translation import gettext_lazy as _
 
-from core.models import RegulatedModel
+from core.models import LiveManager, RegulatedModel
 
-ATC_CODE_REGEX = re.compile(r'^[A-Z]\d{2}[A-Z]{2}\d{2}$')
+# Used with fullmatch(): no anchors to get wrong (`$` also matches before a trailing
+# newline), and [0-9] rather than \d so non-ASCII digits are rejected.
+ATC_CODE_REGEX = re.compile(r'[A-Z][0-9]{2}[A-Z]{2}[0-9]{2}')
+
+
+@lru_cache(maxsize=1)
+def _utc_date_for_minute(minute: int) -> date:
+    return datetime.fromtimestamp(minute * 60, tz=timezone.utc).date()
+
+
+def _today() -> date:
+    """timezone.now().date(), computed once per wall-clock minute."""
+    # The UTC date only changes on a minute boundary, so the cached value is exact.
+    return _utc_date_for_minute(int(time.time() // 60))
+
+
+# Live ACTIVE lots per medicine, counted in the list query; annotate medicine
+# querysets as `active_lots_count`.
+ACTIVE_LOTS_COUNT_EXPRESSION = models.Count(
+    'lots', filter=models.Q(lots__status='ACTIVE', lots__is_deleted=False),
+)
 
 
 class NationalMedicine(RegulatedModel):
@@ -107,6 +129,10 @@ class NationalMedicine(RegulatedModel):
             models.Index(fields=['atc_code']),
             models.Index(fields=['inn']),
             models.Index(fields=['is_controlled', 'status']),
+            models.Index(
+                fields=['inn', 'strength'], name='medicine_live_inn_idx',
+                condition=models.Q(is_deleted=False),
+            ),
         ]
         constraints = [
             models.UniqueConstraint(
@@ -118,16 +144,22 @@ class NationalMedicine(RegulatedModel):
 
     def __str__(self):
         label = self.brand_name or self.inn
-        return f'{label} {self.strength} ({self.get_dosage_form_display()})'
+        dosage_form = DOSAGE_FORM_LABELS.get(self.dosage_form, self.dosage_form)
+        return f'{label} {self.strength} ({dosage_form})'
 
     def clean(self):
         super().clean()
-        if self.atc_code and not ATC_CODE_REGEX.match(self.atc_code):
+        if self.atc_code and not ATC_CODE_REGEX.fullmatch(self.atc_code):
             raise ValidationError({
                 'atc_code': _('Invalid ATC code format. Expected pattern: A00AA00 (e.g. N02BE01).'),
             })
 
 
+# get_dosage_form_display() rebuilds a dict from the field choices on every
+# call; __str__ runs once per lot row in list responses, so it reads this instead.
+DOSAGE_FORM_LABELS = dict(NationalMedicine.DosageFormChoices.choices)
+
+
 class NationalLot(RegulatedModel):
     """
     A specific import batch of a nationally registered medicine.
@@ -182,14 +214,22 @@ class NationalLot(RegulatedModel):
         _('metadata'), default=dict, blank=True,
     )
 
+    objects = LiveManager()
+    all_objects = models.Manager()
+
     class Meta:
         verbose_name = _('national lot')
         verbose_name_plural = _('national lots')
+        default_manager_name = 'all_objects'
         ordering = ['-expiry_date']
         indexes = [
             models.Index(fields=['medicine', 'status']),
             models.Index(fields=['status', 'expiry_date']),
             models.Index(fields=['batch_number']),
+            models.Index(
+                fields=['-expiry_date'], name='lot_live_expiry_idx',
+                condition=models.Q(is_deleted=False),
+            ),
         ]
         constraints = [
             models.UniqueConstraint(
@@ -214,13 +254,22 @@ class NationalLot(RegulatedModel):
     def is_expired(self) -> bool:
         if not self.expiry_date:
             return False
-        return self.expiry_date < timezone.now().date()
+        return self.expiry_date < _today()
 
     @property
     def days_to_expiry(self) -> int | None:
         if not self.expiry_date:
             return None
-        return (self.expiry_date - timezone.now().date()).days
+        return (self.expiry_date - _today()).days
+
+    @classmethod
+    def bulk_days_to_expiry(cls, queryset) -> dict:
+        """Map pk → days_to_expiry for every lot in queryset, reading only those two columns."""
+        today = _today()
+        return {
+            pk: (expiry_date - today).days
+            for pk, expiry_date in queryset.order_by().values_list('pk', 'expiry_date').iterator()
+        }
 
     @property
     def is_usable(self) -> bool:
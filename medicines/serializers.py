@@ -8,8 +8,11 @@ Read and write serializers for NationalMedicine and NationalLot.
 
 import re
 
+from django.db.models import Prefetch
 from rest_framework import serializers
 
+from core.serializers import EagerLoadingMixin
+
 from .models import ATC_CODE_REGEX, NationalLot, NationalMedicine
 
 
@@ -17,7 +20,7 @@ from .models import ATC_CODE_REGEX, NationalLot, NationalMedicine
 # NationalMedicine
 # ---------------------------------------------------------------------------
 
-class NationalMedicineReadSerializer(serializers.ModelSerializer):
+class NationalMedicineReadSerializer(EagerLoadingMixin, serializers.ModelSerializer):
     dosage_form_display = serializers.CharField(
         source='get_dosage_form_display', read_only=True,
     )
@@ -26,6 +29,15 @@ class NationalMedicineReadSerializer(serializers.ModelSerializer):
     )
     active_lots_count = serializers.SerializerMethodField()
 
+    # Live ACTIVE lots only (id and medicine_id), counted with len().
+    prefetch_related_fields = [
+        Prefetch(
+            'lots',
+            queryset=NationalLot.objects.filter(status=NationalLot.StatusChoices.ACTIVE).only('id', 'medicine_id'),
+            to_attr='active_lots',
+        ),
+    ]
+
     class Meta:
         model = NationalMedicine
         fields = [
@@ -40,6 +52,11 @@ class NationalMedicineReadSerializer(serializers.ModelSerializer):
         read_only_fields = fields
 
     def get_active_lots_count(self, obj):
+        # setup_eager_loading prefetches the live ACTIVE lots; block/unblock
+        # responses serialize a plain instance.
+        active_lots = getattr(obj, 'active_lots', None)
+        if active_lots is not None:
+            return len(active_lots)
         return obj.lots.filter(status='ACTIVE', is_deleted=False).count()
 
 
@@ -56,7 +73,7 @@ class NationalMedicineWriteSerializer(serializers.ModelSerializer):
 
     def validate_atc_code(self, value):
         value = value.upper().strip()
-        if not ATC_CODE_REGEX.match(value):
+        if not ATC_CODE_REGEX.fullmatch(value):
             raise serializers.ValidationError(
                 'Invalid ATC code format. Expected pattern: A00AA00 (e.g. N02BE01).',
             )
@@ -76,13 +93,23 @@ class MedicineBlockSerializer(serializers.Serializer):
 # NationalLot
 # ---------------------------------------------------------------------------
 
-class NationalLotReadSerializer(serializers.ModelSerializer):
+class NationalLotReadSerializer(EagerLoadingMixin, serializers.ModelSerializer):
     medicine_name = serializers.CharField(source='medicine.__str__', read_only=True)
     medicine_inn = serializers.CharField(source='medicine.inn', read_only=True)
     status_display = serializers.CharField(source='get_status_display', read_only=True)
     days_to_expiry = serializers.IntegerField(read_only=True)
     is_usable = serializers.BooleanField(read_only=True)
 
+    select_related_fields = ['medicine']
+    # Lot columns read above, plus what NationalMedicine.__str__ needs; skips the
+    # medicine's description, metadata and audit columns.
+    only_fields = [
+        'id', 'medicine', 'batch_number', 'manufacturing_date', 'expiry_date',
+        'quantity_imported', 'import_reference', 'supplier', 'status',
+        'recall_reason', 'created_at', 'updated_at',
+        'medicine__inn', 'medicine__brand_name', 'medicine__strength', 'medicine__dosage_form',
+    ]
+
     class Meta:
         model = NationalLot
         fields = [
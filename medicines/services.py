@@ -61,6 +61,7 @@ class MedicineService:
 
     @staticmethod
     @transaction.atomic
+    @AuditService.batch()
     def block_medicine(*, medicine_id, reason: str = '', actor=None) -> NationalMedicine:
         """Block a medicine and cascade-block all its ACTIVE lots."""
         try:
@@ -98,6 +99,7 @@ class MedicineService:
 
     @staticmethod
     @transaction.atomic
+    @AuditService.batch()
     def unblock_medicine(*, medicine_id, actor=None) -> NationalMedicine:
         try:
             medicine = NationalMedicine.objects.select_for_update().get(
@@ -153,9 +155,7 @@ class LotService:
     @transaction.atomic
     def update_lot(*, lot_id, actor=None, **fields) -> NationalLot:
         try:
-            lot = NationalLot.objects.select_for_update().get(
-                pk=lot_id, is_deleted=False,
-            )
+            lot = NationalLot.objects.select_for_update().get(pk=lot_id)
         except NationalLot.DoesNotExist:
             raise ResourceNotFoundError()
 
@@ -176,11 +176,10 @@ class LotService:
 
     @classmethod
     @transaction.atomic
+    @AuditService.batch()
     def recall_lot(cls, *, lot_id, reason: str, actor=None) -> NationalLot:
         try:
-            lot = NationalLot.objects.select_for_update().get(
-                pk=lot_id, is_deleted=False,
-            )
+            lot = NationalLot.objects.select_for_update().get(pk=lot_id)
         except NationalLot.DoesNotExist:
             raise ResourceNotFoundError()
 
@@ -216,7 +215,6 @@ class LotService:
         qs = NationalLot.objects.filter(
             status=NationalLot.StatusChoices.ACTIVE,
             expiry_date__lt=today,
-            is_deleted=False,
         )
         count = qs.update(status=NationalLot.StatusChoices.EXPIRED)
         if count:
@@ -230,5 +228,4 @@ class LotService:
         return NationalLot.objects.filter(
             status=NationalLot.StatusChoices.ACTIVE,
             expiry_date__lte=cutoff,
-            is_deleted=False,
         ).select_related('medicine').order_by('expiry_date')
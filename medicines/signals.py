@@ -53,7 +53,7 @@ def medicine_post_save(sender, instance, created, **kwargs):
 def lot_pre_save(sender, instance, **kwargs):
     if instance.pk:
         try:
-            old = NationalLot.objects.get(pk=instance.pk)
+            old = NationalLot.all_objects.get(pk=instance.pk)
             _lot_pre[str(instance.pk)] = AuditService.snapshot(old)
         except NationalLot.DoesNotExist:
             pass
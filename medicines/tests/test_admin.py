@@ -0,0 +1,71 @@
+"""
+Tests — Medicines admin actions.
+
+@file medicines/tests/test_admin.py
+"""
+
+import pytest
+from datetime import timedelta
+
+from django.urls import reverse
+from django.utils import timezone
+
+from core.models import AuditLog
+from medicines.admin import _render_expiry_badge
+from medicines.models import NationalLot
+from tests.factories import NationalLotFactory, SuperuserFactory
+
+
+pytestmark = pytest.mark.django_db
+
+
+def test_mark_recalled_audits_each_lot(client):
+    client.force_login(SuperuserFactory())
+    lots = NationalLotFactory.create_batch(3)
+    url = reverse('admin:medicines_nationallot_changelist')
+
+    resp = client.post(url, {
+        'action': 'mark_recalled',
+        '_selected_action': [str(lot.pk) for lot in lots],
+    })
+
+    assert resp.status_code == 302
+    assert set(NationalLot.objects.values_list('status', flat=True)) == {'RECALLED'}
+    entries = AuditLog.objects.filter(action='STATUS_CHANGE', model_name='NationalLot')
+    assert entries.count() == 3
+    assert {entry.new_values['status'] for entry in entries} == {'RECALLED'}
+
+
+def test_mark_recalled_updates_selected_deleted_lots(client):
+    client.force_login(SuperuserFactory())
+    lot = NationalLotFactory(is_deleted=True)
+    url = reverse('admin:medicines_nationallot_changelist') + '?is_deleted__exact=1'
+
+    resp = client.post(url, {'action': 'mark_recalled', '_selected_action': [str(lot.pk)]})
+
+    assert resp.status_code == 302
+    lot.refresh_from_db()
+    assert lot.status == 'RECALLED'
+    entry = AuditLog.objects.get(action='STATUS_CHANGE', model_name='NationalLot')
+    assert entry.object_id == str(lot.pk)
+
+
+@pytest.mark.parametrize('days, color', [
+    (-1, '#dc2626'), (0, '#ef4444'), (30, '#ef4444'), (31, '#f97316'),
+    (90, '#f97316'), (91, '#eab308'), (180, '#eab308'), (181, '#22c55e'),
+])
+def test_expiry_badge_buckets(days, color):
+    today = timezone.now().date()
+    lot = NationalLotFactory.build(
+        expiry_date=today + timedelta(days=days), manufacturing_date=today - timedelta(days=400),
+    )
+    assert f'background:{color};' in _render_expiry_badge(lot)
+
+
+def test_medicine_changelist_renders_badges(client):
+    client.force_login(SuperuserFactory())
+    lot = NationalLotFactory(medicine__is_controlled=True)
+    resp = client.get(reverse('admin:medicines_nationalmedicine_changelist'))
+    assert resp.status_code == 200
+    assert 'CTRL</span>' in resp.content.decode()
+    assert lot.medicine.get_status_display() in resp.content.decode()
@@ -12,7 +12,7 @@ from django.core.exceptions import ValidationError
 from django.db import IntegrityError
 from django.utils import timezone
 
-from medicines.models import NationalLot, NationalMedicine
+from medicines.models import ATC_CODE_REGEX, NationalLot, NationalMedicine
 from tests.factories import NationalLotFactory, NationalMedicineFactory
 
 
@@ -36,12 +36,20 @@ class TestNationalMedicine:
         med = NationalMedicineFactory(brand_name='', inn='Paracetamol', strength='500mg')
         assert 'Paracetamol' in str(med)
 
+    def test_str_includes_dosage_form_label(self):
+        med = NationalMedicineFactory.build(brand_name='Doliprane', strength='500mg', dosage_form='INJECTION')
+        assert str(med) == 'Doliprane 500mg (Injectable)'
+
     def test_atc_code_validation_rejects_bad_format(self):
         med = NationalMedicineFactory.build(atc_code='INVALID')
         with pytest.raises(ValidationError) as exc_info:
             med.full_clean()
         assert 'atc_code' in exc_info.value.message_dict
 
+    @pytest.mark.parametrize('code', ['N02BE01\n', 'N02BE011', 'N\u0660\u0662BE01'])
+    def test_atc_code_validation_rejects_near_misses(self, code):
+        assert ATC_CODE_REGEX.fullmatch(code) is None
+
     def test_atc_code_validation_accepts_good_format(self):
         med = NationalMedicineFactory.build(atc_code='N02BE01')
         med.full_clean()
@@ -93,6 +101,12 @@ class TestNationalLot:
         lot = NationalLotFactory.build(expiry_date=past, manufacturing_date=past - timedelta(days=365))
         assert lot.days_to_expiry == -10
 
+    def test_bulk_days_to_expiry(self):
+        today = timezone.now().date()
+        lots = [NationalLotFactory(expiry_date=today + timedelta(days=days)) for days in (5, 90)]
+        result = NationalLot.bulk_days_to_expiry(NationalLot.objects.all())
+        assert result == {lots[0].pk: 5, lots[1].pk: 90}
+
     def test_is_expired(self):
         past = timezone.now().date() - timedelta(days=1)
         lot = NationalLotFactory.build(expiry_date=past, manufacturing_date=past - timedelta(days=365))
@@ -134,3 +148,10 @@ class TestNationalLot:
         with pytest.raises(ValidationError) as exc_info:
             lot.full_clean()
         assert 'expiry_date' in exc_info.value.message_dict
+
+    def test_objects_excludes_soft_deleted_lots(self):
+        lot = NationalLotFactory()
+        lot.soft_delete()
+        assert not NationalLot.objects.filter(pk=lot.pk).exists()
+        assert NationalLot.all_objects.filter(pk=lot.pk).exists()
+        assert lot.medicine.lots.filter(pk=lot.pk).exists()
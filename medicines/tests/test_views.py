@@ -41,6 +41,19 @@ class TestMedicineListCreate:
         assert resp.status_code == 200
         assert len(resp.data['results']) == 3
 
+    def test_list_prefetches_active_lots(self, authenticated_client, django_assert_num_queries):
+        meds = NationalMedicineFactory.create_batch(3)
+        NationalLotFactory.create_batch(2, medicine=meds[0])
+        NationalLotFactory(medicine=meds[0], status='RECALLED')
+        NationalLotFactory(medicine=meds[0], is_deleted=True)
+        url = reverse('api-v1:medicines:medicine-list')
+        with django_assert_num_queries(3):
+            resp = authenticated_client.get(url)
+        assert resp.status_code == 200
+        counts = {row['id']: row['active_lots_count'] for row in resp.data['results']}
+        assert counts[str(meds[0].pk)] == 2
+        assert counts[str(meds[1].pk)] == 0
+
     def test_search_by_inn(self, authenticated_client):
         NationalMedicineFactory(inn='Paracetamol')
         NationalMedicineFactory(inn='Amoxicillin')
@@ -133,6 +146,15 @@ class TestMedicineNestedLots:
         data = resp.data.get('results', resp.data.get('data', []))
         assert len(data) == 2
 
+    def test_list_lots_loads_medicine_with_lots(self, authenticated_client, django_assert_num_queries):
+        med = NationalMedicineFactory()
+        NationalLotFactory.create_batch(3, medicine=med)
+        url = reverse('api-v1:medicines:medicine-lots', args=[med.pk])
+        # get_object, page count, page rows joined to their medicine.
+        with django_assert_num_queries(3):
+            resp = authenticated_client.get(url)
+        assert resp.status_code == 200
+
     def test_create_lot_for_medicine(self, admin_client):
         med = NationalMedicineFactory()
         url = reverse('api-v1:medicines:medicine-lots', args=[med.pk])
@@ -160,6 +182,15 @@ class TestLotListRetrieve:
         assert resp.status_code == 200
         assert len(resp.data['results']) == 2
 
+    def test_list_lots_reads_only_serialized_columns(self, authenticated_client, django_assert_num_queries):
+        lots = NationalLotFactory.create_batch(3)
+        url = reverse('api-v1:medicines:lots:lot-list')
+        with django_assert_num_queries(2):
+            resp = authenticated_client.get(url)
+        assert resp.status_code == 200
+        names = {row['id']: row['medicine_name'] for row in resp.data['results']}
+        assert names[str(lots[0].pk)] == str(lots[0].medicine)
+
     def test_retrieve_lot(self, authenticated_client):
         lot = NationalLotFactory()
         url = reverse('api-v1:medicines:lots:lot-detail', args=[lot.pk])
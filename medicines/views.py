@@ -40,7 +40,10 @@ class NationalMedicineViewSet(viewsets.ModelViewSet):
     ordering = ['inn']
 
     def get_queryset(self):
-        return NationalMedicine.objects.filter(is_deleted=False)
+        qs = NationalMedicine.objects.filter(is_deleted=False)
+        if self.action in ('list', 'retrieve'):
+            return NationalMedicineReadSerializer.setup_eager_loading(qs)
+        return qs
 
     def get_serializer_class(self):
         if self.action in ('list', 'retrieve'):
@@ -103,8 +106,8 @@ class NationalMedicineViewSet(viewsets.ModelViewSet):
         medicine = self.get_object()
 
         if request.method == 'GET':
-            lots = NationalLot.objects.filter(
-                medicine=medicine, is_deleted=False,
+            lots = NationalLotReadSerializer.setup_eager_loading(
+                NationalLot.objects.filter(medicine=medicine),
             ).order_by('-expiry_date')
             page = self.paginate_queryset(lots)
             if page is not None:
@@ -137,11 +140,10 @@ class NationalLotViewSet(viewsets.ModelViewSet):
     ordering = ['-expiry_date']
 
     def get_queryset(self):
-        return (
-            NationalLot.objects
-            .filter(is_deleted=False)
-            .select_related('medicine')
-        )
+        qs = NationalLot.objects.all()
+        if self.action in ('list', 'retrieve'):
+            return NationalLotReadSerializer.setup_eager_loading(qs)
+        return qs
 
     def get_serializer_class(self):
         if self.action in ('list', 'retrieve'):
@@ -182,7 +184,7 @@ class NationalLotViewSet(viewsets.ModelViewSet):
     @action(detail=False, methods=['get'], url_path='expiring-soon')
     def expiring_soon(self, request):
         days = int(request.query_params.get('days', 30))
-        lots = LotService.get_expiring_soon(days=days)
+        lots = NationalLotReadSerializer.setup_eager_loading(LotService.get_expiring_soon(days=days))
         page = self.paginate_queryset(lots)
         if page is not None:
             ser = NationalLotReadSerializer(page, many=True)
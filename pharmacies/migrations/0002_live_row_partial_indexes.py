@@ -0,0 +1,34 @@
+# Generated by Django 5.2.10 on 2026-10-15 23:42
+
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('geography', '0003_administrativelevel_path'),
+        ('pharmacies', '0001_phase3_pharmacy_pharmacydocument'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name='pharmacy',
+            name='is_deleted',
+            field=models.BooleanField(default=False, verbose_name='deleted'),
+        ),
+        migrations.AlterField(
+            model_name='pharmacydocument',
+            name='is_deleted',
+            field=models.BooleanField(default=False, verbose_name='deleted'),
+        ),
+        migrations.AddIndex(
+            model_name='pharmacy',
+            index=models.Index(condition=models.Q(('is_deleted', False)), fields=['name'], name='pharmacy_live_name_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='pharmacydocument',
+            index=models.Index(condition=models.Q(('is_deleted', False)), fields=['-created_at'], name='pharm_doc_live_created_idx'),
+        ),
+    ]
@@ -93,6 +93,10 @@ class Pharmacy(RegulatedModel):
             models.Index(fields=['status', 'is_deleted']),
             models.Index(fields=['pharmacy_type', 'status']),
             models.Index(fields=['administrative_level']),
+            models.Index(
+                fields=['name'], name='pharmacy_live_name_idx',
+                condition=models.Q(is_deleted=False),
+            ),
         ]
         constraints = [
             models.UniqueConstraint(
@@ -160,6 +164,10 @@ class PharmacyDocument(RegulatedModel):
         indexes = [
             models.Index(fields=['pharmacy', 'document_type']),
             models.Index(fields=['status']),
+            models.Index(
+                fields=['-created_at'], name='pharm_doc_live_created_idx',
+                condition=models.Q(is_deleted=False),
+            ),
         ]
 
     def __str__(self):
@@ -0,0 +1,20 @@
+# Generated by Django 5.2.10 on 2026-10-15 23:22
+
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('medicines', '0002_live_default_managers'),
+        ('stock', '0001_phase4_stock_movement'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='stockmovement',
+            index=models.Index(fields=['reference_type', 'reference_id', '-created_at'], name='stock_reference_idx'),
+        ),
+    ]
@@ -94,6 +94,7 @@ class StockMovement(models.Model):
             models.Index(fields=['entity_type', 'entity_id', 'lot'], name='stock_entity_lot_idx'),
             models.Index(fields=['lot', 'created_at'], name='stock_lot_created_idx'),
             models.Index(fields=['created_by', 'created_at'], name='stock_created_by_idx'),
+            models.Index(fields=['reference_type', 'reference_id', '-created_at'], name='stock_reference_idx'),
         ]
         # DBA: table is designed for PARTITION BY RANGE (created_at)
 
@@ -1,8 +1,9 @@
 """
 Stock — Service Layer
 
-Movement-based stock: get_balance, record_movement, process_b2b_transaction,
-process_retail_sale. All outbound movements check balance under advisory lock.
+Movement-based stock: get_balance, record_movement, process_b2b_transaction
+(and its bulk variant), process_retail_sale. All outbound movements check
+balance under advisory lock.
 INSERT ONLY — never update or delete StockMovement.
 
 @file stock/services.py
@@ -10,6 +11,7 @@ INSERT ONLY — never update or delete StockMovement.
 
 import hashlib
 import logging
+from functools import partial
 from typing import Literal
 from uuid import UUID
 
@@ -39,36 +41,51 @@ def _advisory_lock_key(entity_type: str, entity_id: UUID, lot_id: UUID) -> int:
     return int.from_bytes(h, 'big') % (2**63)
 
 
+def _balance_aggregates() -> dict:
+    """in_sum / out_sum aggregates over a StockMovement queryset."""
+    return {
+        'in_sum': Sum(
+            Case(
+                When(movement_type__in=INBOUND_TYPES, then='quantity'),
+                default=Value(0),
+                output_field=IntegerField(),
+            ),
+        ),
+        'out_sum': Sum(
+            Case(
+                When(movement_type__in=OUTBOUND_TYPES, then='quantity'),
+                default=Value(0),
+                output_field=IntegerField(),
+            ),
+        ),
+    }
+
+
 def _get_balance_orm(entity_type: str, entity_id: UUID, lot_id: UUID) -> int:
     """Compute current stock from movements using ORM (inbound - outbound)."""
-    qs = StockMovement.objects.filter(
+    result = StockMovement.objects.filter(
         entity_type=entity_type,
         entity_id=entity_id,
         lot_id=lot_id,
-    )
-    inbound = Sum(
-        Case(
-            When(movement_type__in=INBOUND_TYPES, then='quantity'),
-            default=Value(0),
-            output_field=IntegerField(),
-        ),
-    )
-    outbound = Sum(
-        Case(
-            When(movement_type__in=OUTBOUND_TYPES, then='quantity'),
-            default=Value(0),
-            output_field=IntegerField(),
-        ),
-    )
-    result = qs.aggregate(
-        in_sum=inbound,
-        out_sum=outbound,
-    )
+    ).aggregate(**_balance_aggregates())
     in_sum = result['in_sum'] or 0
     out_sum = result['out_sum'] or 0
     return in_sum - out_sum
 
 
+def _get_balances_orm(entity_type: str, entity_id: UUID, lot_ids) -> dict[str, int]:
+    """Balances of several lots for one entity in a single grouped query, keyed by str(lot_id)."""
+    rows = StockMovement.objects.filter(
+        entity_type=entity_type,
+        entity_id=entity_id,
+        lot_id__in=lot_ids,
+    ).values('lot_id').annotate(**_balance_aggregates()).order_by()
+    balances = {str(lot_id): 0 for lot_id in lot_ids}
+    for row in rows:
+        balances[str(row['lot_id'])] = (row['in_sum'] or 0) - (row['out_sum'] or 0)
+    return balances
+
+
 class StockService:
     """Movement-based stock: balance computation and recorded movements."""
 
@@ -104,7 +121,7 @@ class StockService:
             raise BusinessRuleViolation(detail='Quantity must be positive.')
 
         try:
-            lot = NationalLot.objects.get(pk=lot_id, is_deleted=False)
+            lot = NationalLot.objects.get(pk=lot_id)
         except NationalLot.DoesNotExist:
             raise ResourceNotFoundError(detail='Lot not found.')
         if not lot.is_usable:
@@ -148,14 +165,17 @@ class StockService:
                 'quantity': quantity,
             },
         )
-        logger.info(
+        # Emitted after commit so slow log handlers never run while locks are held.
+        transaction.on_commit(partial(
+            logger.info,
             'StockMovement %s %s qty=%s entity=%s:%s lot=%s',
             movement_type, movement.pk, quantity, entity_type, entity_id, lot_id,
-        )
+        ))
         return movement
 
     @staticmethod
     @transaction.atomic
+    @AuditService.batch()
     def process_b2b_transaction(
         *,
         seller_entity_type: str,
@@ -188,7 +208,7 @@ class StockService:
             )
 
         try:
-            lot = NationalLot.objects.get(pk=lot_id, is_deleted=False)
+            lot = NationalLot.objects.get(pk=lot_id)
         except NationalLot.DoesNotExist:
             raise ResourceNotFoundError(detail='Lot not found.')
         if not lot.is_usable:
@@ -232,12 +252,119 @@ class StockService:
                     'quantity': mov.quantity,
                 },
             )
-        logger.info(
+        transaction.on_commit(partial(
+            logger.info,
             'B2B transaction: OUT %s IN %s qty=%s lot=%s',
             out_movement.pk, in_movement.pk, quantity, lot_id,
-        )
+        ))
         return out_movement, in_movement
 
+    @staticmethod
+    @transaction.atomic
+    def process_b2b_transactions_bulk(
+        *,
+        seller_entity_type: str,
+        seller_entity_id: UUID,
+        buyer_entity_type: str,
+        buyer_entity_id: UUID,
+        lines: list[tuple[UUID, int]],
+        created_by=None,
+        reference_id: UUID | None = None,
+        reference_type: str = 'B2BOrder',
+    ) -> list[tuple[StockMovement, StockMovement]]:
+        """
+        process_b2b_transaction for many (lot_id, quantity) lines at once.
+
+        Locks every seller/buyer lot key, checks all seller balances in one
+        grouped query and inserts every B2B_OUT/B2B_IN pair in one bulk_create.
+        Nothing is written if any line fails.
+        """
+        if any(quantity <= 0 for _, quantity in lines):
+            raise BusinessRuleViolation(detail='Quantity must be positive.')
+        requested: dict[str, int] = {}
+        for lot_id, quantity in lines:
+            requested[str(lot_id)] = requested.get(str(lot_id), 0) + quantity
+
+        if connection.vendor == 'postgresql':
+            # Sorted so concurrent deliveries take overlapping locks in the same order.
+            keys = sorted({
+                _advisory_lock_key(entity_type, entity_id, lot_id)
+                for lot_id in requested
+                for entity_type, entity_id in (
+                    (seller_entity_type, seller_entity_id),
+                    (buyer_entity_type, buyer_entity_id),
+                )
+            })
+            with connection.cursor() as cursor:
+                for key in keys:
+                    cursor.execute('SELECT pg_advisory_xact_lock(%s)', [key])
+
+        balances = _get_balances_orm(seller_entity_type, seller_entity_id, list(requested))
+        for lot_id, quantity in requested.items():
+            if balances[lot_id] < quantity:
+                raise InsufficientStockError(
+                    detail=(
+                        f'Insufficient seller stock for lot {lot_id}: '
+                        f'balance={balances[lot_id]}, requested={quantity}.'
+                    ),
+                )
+
+        lots = {
+            str(lot.pk): lot
+            for lot in NationalLot.objects.filter(pk__in=list(requested)).only(
+                'id', 'status', 'expiry_date',
+            )
+        }
+        for lot_id in requested:
+            if lot_id not in lots:
+                raise ResourceNotFoundError(detail='Lot not found.')
+            if not lots[lot_id].is_usable:
+                raise BusinessRuleViolation(detail='Lot is not usable for stock.')
+
+        pairs = [
+            tuple(
+                StockMovement(
+                    entity_type=entity_type,
+                    entity_id=entity_id,
+                    lot_id=lot_id,
+                    movement_type=movement_type,
+                    quantity=quantity,
+                    reference_id=reference_id,
+                    reference_type=reference_type or 'B2BOrder',
+                    created_by=created_by,
+                )
+                for entity_type, entity_id, movement_type in (
+                    (seller_entity_type, seller_entity_id, StockMovement.MovementType.B2B_OUT),
+                    (buyer_entity_type, buyer_entity_id, StockMovement.MovementType.B2B_IN),
+                )
+            )
+            for lot_id, quantity in lines
+        ]
+        movements = [mov for pair in pairs for mov in pair]
+        StockMovement.objects.bulk_create(movements)
+
+        with AuditService.batch():
+            for mov in movements:
+                AuditService.log(
+                    actor=created_by,
+                    action=AUDIT_ACTION_CREATE,
+                    model_name='StockMovement',
+                    object_id=str(mov.pk),
+                    new_values={
+                        'entity_type': mov.entity_type,
+                        'entity_id': str(mov.entity_id),
+                        'lot_id': str(mov.lot_id),
+                        'movement_type': mov.movement_type,
+                        'quantity': mov.quantity,
+                    },
+                )
+        transaction.on_commit(partial(
+            logger.info,
+            'B2B bulk transaction: %s lines, reference=%s:%s',
+            len(pairs), reference_type, reference_id,
+        ))
+        return pairs
+
     @staticmethod
     @transaction.atomic
     def process_retail_sale(
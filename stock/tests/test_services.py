@@ -1,5 +1,5 @@
 """
-Tests — StockService: get_balance, record_movement, process_b2b, process_retail_sale.
+Tests — StockService: get_balance, record_movement, process_b2b (single and bulk), process_retail_sale.
 Concurrent sale: one succeeds, other gets 409. B2B rollback on error.
 Balance correct after 1000 mixed movements.
 
@@ -322,6 +322,55 @@ class TestProcessB2BTransaction:
         ) == 5
 
 
+class TestProcessB2BTransactionsBulk:
+
+    def _stock(self, entity_id, lot, quantity, user):
+        StockService.record_movement(
+            entity_type=StockMovement.EntityType.PHARMACY,
+            entity_id=entity_id,
+            lot_id=lot.pk,
+            movement_type=StockMovement.MovementType.IMPORT,
+            quantity=quantity,
+            created_by=user,
+        )
+
+    def _bulk(self, seller_id, buyer_id, lines, user):
+        return StockService.process_b2b_transactions_bulk(
+            seller_entity_type=StockMovement.EntityType.PHARMACY,
+            seller_entity_id=seller_id,
+            buyer_entity_type=StockMovement.EntityType.PHARMACY,
+            buyer_entity_id=buyer_id,
+            lines=lines,
+            created_by=user,
+        )
+
+    def test_bulk_moves_every_line(self):
+        seller_id, buyer_id = _pharmacy_id(), _pharmacy_id()
+        lot_a, lot_b = NationalLotFactory(), NationalLotFactory()
+        user = SuperuserFactory()
+        self._stock(seller_id, lot_a, 10, user)
+        self._stock(seller_id, lot_b, 10, user)
+        pairs = self._bulk(seller_id, buyer_id, [(lot_a.pk, 4), (lot_b.pk, 6), (lot_a.pk, 1)], user)
+        assert [(out.movement_type, inc.movement_type) for out, inc in pairs] == [
+            (StockMovement.MovementType.B2B_OUT, StockMovement.MovementType.B2B_IN),
+        ] * 3
+        balance = StockService.get_balance
+        assert balance(StockMovement.EntityType.PHARMACY, seller_id, lot_a.pk) == 5
+        assert balance(StockMovement.EntityType.PHARMACY, seller_id, lot_b.pk) == 4
+        assert balance(StockMovement.EntityType.PHARMACY, buyer_id, lot_a.pk) == 5
+        assert balance(StockMovement.EntityType.PHARMACY, buyer_id, lot_b.pk) == 6
+
+    def test_bulk_checks_combined_quantity_per_lot(self):
+        seller_id, buyer_id = _pharmacy_id(), _pharmacy_id()
+        lot = NationalLotFactory()
+        user = SuperuserFactory()
+        self._stock(seller_id, lot, 5, user)
+        initial_count = StockMovement.objects.count()
+        with pytest.raises(InsufficientStockError, match='balance=5, requested=6'):
+            self._bulk(seller_id, buyer_id, [(lot.pk, 3), (lot.pk, 3)], user)
+        assert StockMovement.objects.count() == initial_count
+
+
 class TestProcessRetailSale:
 
     def test_retail_sale(self):
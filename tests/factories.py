@@ -115,7 +115,7 @@ class NationalMedicineFactory(factory.django.DjangoModelFactory):
     class Meta:
         model = NationalMedicine
 
-    atc_code = factory.Sequence(lambda n: f'N{n:02d}BE{n:02d}')
+    atc_code = factory.Sequence(lambda n: f'N{n % 100:02d}BE{n // 100 % 100:02d}')
     inn = factory.Sequence(lambda n: f'Medicine-INN-{n}')
     brand_name = factory.Sequence(lambda n: f'Brand-{n}')
     dosage_form = NationalMedicine.DosageFormChoices.TABLET
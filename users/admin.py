@@ -12,6 +12,8 @@ from django.contrib.auth.admin import UserAdmin as BaseUserAdmin
 from django.utils.html import format_html
 from django.utils.translation import gettext_lazy as _
 
+from core.admin import AuditBatchAdminMixin
+
 from .models import DeviceToken, OTPCode, Role, User, UserRole
 
 
@@ -33,7 +35,7 @@ class UserRoleInline(admin.TabularInline):
 # ---------------------------------------------------------------------------
 
 @admin.register(User)
-class UserAdmin(BaseUserAdmin):
+class UserAdmin(AuditBatchAdminMixin, BaseUserAdmin):
     """
     Full-featured admin for User model with status badges, geographic
     filtering, and inline role management.
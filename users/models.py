@@ -16,6 +16,7 @@ from django.conf import settings
 from django.contrib.auth.models import AbstractBaseUser, PermissionsMixin
 from django.db import models
 from django.utils import timezone
+from django.utils.functional import cached_property
 from django.utils.translation import gettext_lazy as _
 
 from core.models import BaseModel, RegulatedModel, TimestampMixin
@@ -83,6 +84,10 @@ class User(AbstractBaseUser, PermissionsMixin, RegulatedModel):
             models.Index(fields=['email']),
             models.Index(fields=['phone']),
             models.Index(fields=['administrative_level']),
+            models.Index(
+                fields=['-created_at'], name='user_live_created_idx',
+                condition=models.Q(is_deleted=False),
+            ),
         ]
 
     def __str__(self):
@@ -102,8 +107,22 @@ class User(AbstractBaseUser, PermissionsMixin, RegulatedModel):
             .values_list('role__name', flat=True)
         )
 
+    @cached_property
+    def active_role_names(self) -> frozenset[str]:
+        """
+        Names of active roles, loaded in one query and kept for the lifetime of
+        this instance (i.e. one request for request.user).
+        """
+        return frozenset(
+            self.user_roles.filter(is_active=True).values_list('role__name', flat=True)
+        )
+
     def has_role(self, role_name: str) -> bool:
-        return self.user_roles.filter(role__name=role_name, is_active=True).exists()
+        return role_name in self.active_role_names
+
+    def clear_role_cache(self) -> None:
+        """Forget active_role_names after this user's role assignments change."""
+        self.__dict__.pop('active_role_names', None)
 
     def has_scoped_role(self, role_name: str, scope: str, entity_id: str | None = None) -> bool:
         qs = self.user_roles.filter(
@@ -77,6 +77,7 @@ class UserService:
 
     @staticmethod
     @transaction.atomic
+    @AuditService.batch()
     def update_user(*, user_id, actor=None, **fields) -> User:
         try:
             user = User.objects.select_for_update().get(pk=user_id, is_deleted=False)
@@ -104,6 +105,7 @@ class UserService:
 
     @classmethod
     @transaction.atomic
+    @AuditService.batch()
     def change_status(cls, *, user_id, new_status: str, actor=None, reason: str = '') -> User:
         try:
             user = User.objects.select_for_update().get(pk=user_id, is_deleted=False)
@@ -246,6 +248,7 @@ class RoleService:
             user_role.is_active = True
             user_role.updated_by = actor
             user_role.save(update_fields=['is_active', 'updated_by', 'updated_at'])
+        user.clear_role_cache()
 
         AuditService.log(
             actor=actor,
@@ -266,6 +269,7 @@ class RoleService:
         updated = qs.update(is_active=False)
         if updated == 0:
             raise ResourceNotFoundError(detail='Active role assignment not found.')
+        user.clear_role_cache()
 
     @staticmethod
     def get_user_roles(user: User) -> list[dict]:
@@ -89,6 +89,21 @@ class TestRoleAndRBAC:
         UserRoleFactory(user=user, role=role2)
         assert set(user.role_names) == {'ROLE_A', 'ROLE_B'}
 
+    def test_active_role_names_cached(self, django_assert_num_queries):
+        user = UserFactory()
+        UserRoleFactory(user=user, role=RoleFactory(name='ROLE_ACTIVE'))
+        UserRoleFactory(user=user, role=RoleFactory(name='ROLE_OFF'), is_active=False)
+        with django_assert_num_queries(1):
+            assert user.active_role_names == {'ROLE_ACTIVE'}
+            assert 'ROLE_ACTIVE' in user.active_role_names
+
+    def test_has_role_reuses_cached_names(self, django_assert_num_queries):
+        user = UserFactory()
+        UserRoleFactory(user=user, role=RoleFactory(name='ROLE_CACHED'))
+        with django_assert_num_queries(1):
+            assert user.has_role('ROLE_CACHED') is True
+            assert user.has_role('ROLE_OTHER') is False
+
 
 @pytest.mark.django_db
 class TestOTPCode:
@@ -106,6 +106,7 @@ class TestRoleService:
         user = UserFactory()
         RoleFactory(name='TEST_REVOKE')
         RoleService.assign_role(user=user, role_name='TEST_REVOKE')
+        assert user.has_role('TEST_REVOKE') is True
         RoleService.revoke_role(user=user, role_name='TEST_REVOKE')
         assert user.has_role('TEST_REVOKE') is False
 